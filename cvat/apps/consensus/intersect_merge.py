@@ -19,7 +19,7 @@ from datumaro.util.attrs_util import ensure_cls
 from cvat.apps.quality_control.quality_reports import (
     ComparisonParameters,
     DistanceComparator,
-    segment_iou,
+    SegmentCache,
 )
 
 
@@ -150,6 +150,13 @@ CacheKey = tuple[int, int]
 class CachedSimilarityFunction:
     cache: dict[CacheKey, float] = attrs.field(factory=dict, kw_only=True)
 
+    # The shapes matched using a spatial index: shape id -> the comparisons, where
+    # the shape was on the a or the b side. Pairs of the shapes from different sides
+    # of the same comparison, which are missing in the cache, have 0 similarity.
+    _pruned_comparisons_by_a_id: dict[int, set[int]] = attrs.field(factory=dict, init=False)
+    _pruned_comparisons_by_b_id: dict[int, set[int]] = attrs.field(factory=dict, init=False)
+    _pruned_comparison_count: int = attrs.field(default=0, init=False)
+
     def __call__(self, a_ann: dm.Annotation, b_ann: dm.Annotation) -> float:
         a_ann_id = id(a_ann)
         b_ann_id = id(b_ann)
@@ -162,7 +169,23 @@ class CachedSimilarityFunction:
             b_ann_id,
         )  # make sure the annotations have stable ids before calling this
         key = self._sort_key(key)
-        return self.cache[key]
+
+        distance = self.cache.get(key)
+        if distance is None:
+            if not self._is_pruned(a_ann_id, b_ann_id):
+                raise KeyError(key)
+
+            distance = 0
+
+        return distance
+
+    def _is_pruned(self, a_ann_id: int, b_ann_id: int) -> bool:
+        by_a_id = self._pruned_comparisons_by_a_id
+        by_b_id = self._pruned_comparisons_by_b_id
+        return not (
+            by_a_id.get(a_ann_id, set()).isdisjoint(by_b_id.get(b_ann_id, ()))
+            and by_a_id.get(b_ann_id, set()).isdisjoint(by_b_id.get(a_ann_id, ()))
+        )
 
     @staticmethod
     def _sort_key(key: CacheKey) -> CacheKey:
@@ -177,8 +200,23 @@ class CachedSimilarityFunction:
     def keys(self) -> Iterable[CacheKey]:
         return self.cache.keys()
 
+    def add_pruned_comparisons(
+        self, pruned_comparisons: Iterable[tuple[frozenset[int], frozenset[int]]]
+    ):
+        for a_ids, b_ids in pruned_comparisons:
+            comparison = self._pruned_comparison_count
+            self._pruned_comparison_count += 1
+
+            for a_id in a_ids:
+                self._pruned_comparisons_by_a_id.setdefault(a_id, set()).add(comparison)
+
+            for b_id in b_ids:
+                self._pruned_comparisons_by_b_id.setdefault(b_id, set()).add(comparison)
+
     def clear_cache(self):
         self.cache.clear()
+        self._pruned_comparisons_by_a_id.clear()
+        self._pruned_comparisons_by_b_id.clear()
 
 
 @attrs.define(kw_only=True, slots=False)
@@ -230,6 +268,8 @@ class ShapeMatcher(AnnotationMatcher, metaclass=ABCMeta):
         for (p_a_id, p_b_id), dist in distances.items():
             self._distance.set((p_a_id, p_b_id), dist)
 
+        self._distance.add_pruned_comparisons(distances.pruned_comparisons)
+
         return matches
 
     @abstractmethod
@@ -435,15 +475,24 @@ class ShapeMerger(AnnotationMerger, ShapeMatcher):
         mbbox = dm.Bbox(*mean_bbox(cluster))
         img_h, img_w = self._context.get_item_media_dims(id(cluster[0]))
 
-        dist = []
-        for s in cluster:
+        segment_cache = SegmentCache(img_h=img_h, img_w=img_w)
+        mbbox_segment = segment_cache.get_annotation_segment(
+            mbbox, convert=self._comparator.to_polygon
+        )
+
+        def _to_segment(s: dm.Annotation) -> dm.Annotation:
             if isinstance(s, (dm.Points, dm.PolyLine)):
                 s = self._comparator.to_polygon(dm.Bbox(*s.get_bbox()))
             elif isinstance(s, (dm.Bbox, dm.Ellipse)):
                 s = self._comparator.to_polygon(s)
-            dist.append(
-                segment_iou(self._comparator.to_polygon(mbbox), s, img_h=img_h, img_w=img_w)
+            return s
+
+        dist = [
+            segment_cache.iou(
+                mbbox_segment, segment_cache.get_annotation_segment(s, convert=_to_segment)
             )
+            for s in cluster
+        ]
         nearest_pos, _ = max(enumerate(dist), key=lambda e: e[1])
         return cluster[nearest_pos]
 
@@ -2,10 +2,18 @@
 #
 # SPDX-License-Identifier: MIT
 
+from __future__ import annotations
+
+import concurrent.futures
 import math
+import multiprocessing
+from collections import Counter
+from collections.abc import Sequence
 from typing import Type
 
+import attrs
 import datumaro as dm
+import rq
 from django.conf import settings
 from django.db import transaction
 from rest_framework import serializers
@@ -26,6 +34,8 @@ from cvat.apps.engine.models import (
     User,
     clear_annotations_in_jobs,
 )
+from cvat.apps.engine.rq import BaseRQMeta
+from cvat.apps.engine.utils import take_by
 from cvat.apps.profiler import silk_profile
 from cvat.apps.quality_control.quality_reports import ComparisonParameters, JobDataProvider
 from cvat.apps.redis_handler.background import AbstractRequestManager
@@ -95,31 +105,38 @@ class _TaskMerger:
     def _get_annotations(job_id: int) -> dm.Dataset:
         return JobDataProvider(job_id).dm_dataset
 
-    def _merge_consensus_jobs(self, parent_job_id: int):
-        self.check_merging_available(parent_job_id=parent_job_id)
-
+    def _get_consensus_datasets(self, parent_job_id: int) -> list[dm.Dataset]:
         consensus_job_info = self._jobs[parent_job_id]
 
         consensus_job_ids = [consensus_job_id for consensus_job_id, _ in consensus_job_info]
 
         consensus_job_data_providers = list(map(JobDataProvider, consensus_job_ids))
-        consensus_datasets = [
+        return [
             consensus_job_data_provider.dm_dataset
             for consensus_job_data_provider in consensus_job_data_providers
         ]
 
+    def _get_merger_conf(self, consensus_datasets: Sequence[dm.Dataset]) -> IntersectMerge.Conf:
         comparison_parameters = ComparisonParameters()
-        merger = IntersectMerge(
-            conf=IntersectMerge.Conf(
-                pairwise_dist=self._settings.iou_threshold,
-                quorum=math.ceil(self._settings.quorum * len(consensus_datasets)),
-                sigma=comparison_parameters.oks_sigma,
-                torso_r=comparison_parameters.line_thickness,
-                included_annotation_types=comparison_parameters.included_annotation_types,
-            )
+        return IntersectMerge.Conf(
+            pairwise_dist=self._settings.iou_threshold,
+            quorum=math.ceil(self._settings.quorum * len(consensus_datasets)),
+            sigma=comparison_parameters.oks_sigma,
+            torso_r=comparison_parameters.line_thickness,
+            included_annotation_types=comparison_parameters.included_annotation_types,
         )
+
+    def _merge_consensus_jobs(self, parent_job_id: int):
+        self.check_merging_available(parent_job_id=parent_job_id)
+
+        consensus_datasets = self._get_consensus_datasets(parent_job_id)
+
+        merger = IntersectMerge(conf=self._get_merger_conf(consensus_datasets))
         merged_dataset = merger(*consensus_datasets)
 
+        self._save_merged_annotations(parent_job_id, merged_dataset)
+
+    def _save_merged_annotations(self, parent_job_id: int, merged_dataset: dm.Dataset):
         # Delete the existing annotations in the job.
         # If we don't delete existing annotations, the imported annotations
         # will be appended to the existing annotations, and thus updated annotation
@@ -142,14 +159,207 @@ class _TaskMerger:
                 parent_job.state = StateChoice.COMPLETED.value
                 parent_job.save()
 
+    _FRAME_JOBS_PER_WORKER = 4
+
+    def _merge_in_parallel(self, parent_job_ids: Sequence[int], *, max_workers: int):
+        for parent_job_id in parent_job_ids:
+            self.check_merging_available(parent_job_id=parent_job_id)
+
+        # The replica datasets of the jobs in a batch are kept in memory until the batch
+        # is merged, so the jobs are merged in batches of a limited size
+        merged_job_count = 0
+        for batch_parent_job_ids in take_by(parent_job_ids, max_workers):
+            self._merge_batch_in_parallel(
+                batch_parent_job_ids,
+                max_workers=max_workers,
+                merged_job_count=merged_job_count,
+                total_job_count=len(parent_job_ids),
+            )
+            merged_job_count += len(batch_parent_job_ids)
+
+    def _merge_batch_in_parallel(
+        self,
+        parent_job_ids: Sequence[int],
+        *,
+        max_workers: int,
+        merged_job_count: int,
+        total_job_count: int,
+    ):
+        global _merge_worker_context
+
+        worker_context = {}  # parent job id -> (merger conf, consensus datasets)
+        job_items = {}  # parent job id -> {(item id, subset): source item}
+        for parent_job_id in parent_job_ids:
+            consensus_datasets = self._get_consensus_datasets(parent_job_id)
+            worker_context[parent_job_id] = (
+                self._get_merger_conf(consensus_datasets),
+                consensus_datasets,
+            )
+
+            # The merged item is made from the item of the first dataset, as in the merger
+            items = {}
+            for dataset in consensus_datasets:
+                for item in dataset:
+                    items.setdefault((item.id, item.subset), item)
+            job_items[parent_job_id] = items
+
+        items_per_job = math.ceil(
+            sum(map(len, job_items.values())) / (max_workers * self._FRAME_JOBS_PER_WORKER)
+        )
+        frame_jobs = [
+            (parent_job_id, item_keys)
+            for parent_job_id, items in job_items.items()
+            for item_keys in take_by(list(items.keys()), items_per_job)
+        ]
+
+        merged_annotations = {
+            parent_job_id: {} for parent_job_id in parent_job_ids
+        }  # parent job id -> {(item id, subset): annotations}
+        remaining_frame_jobs = Counter(parent_job_id for parent_job_id, _ in frame_jobs)
+
+        def _save_job(parent_job_id: int):
+            consensus_datasets = worker_context[parent_job_id][1]
+            items = job_items[parent_job_id]
+            annotations = merged_annotations.pop(parent_job_id)
+            merged_dataset = dm.Dataset.from_iterable(
+                (item.wrap(annotations=annotations[item_key]) for item_key, item in items.items()),
+                categories=consensus_datasets[0].categories(),
+                media_type=consensus_datasets[0].media_type(),
+            )
+            self._save_merged_annotations(parent_job_id, merged_dataset)
+
+        # jobs without frames don't need to be sent to the workers
+        for parent_job_id in parent_job_ids:
+            if not remaining_frame_jobs[parent_job_id]:
+                _save_job(parent_job_id)
+
+        if not frame_jobs:
+            return
+
+        # The workers get the datasets by forking, so only the item keys are sent to them.
+        # The worker jobs don't use the DB, so the fork context is safe to use here.
+        _merge_worker_context = worker_context
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(max_workers, len(frame_jobs)),
+                mp_context=multiprocessing.get_context("fork"),
+            ) as executor:
+                futures = {}  # future -> parent job id
+                for parent_job_id, item_keys in frame_jobs:
+                    future = executor.submit(_merge_frames_in_worker, parent_job_id, item_keys)
+                    futures[future] = parent_job_id
+
+                for finished_count, future in enumerate(
+                    concurrent.futures.as_completed(futures), start=1
+                ):
+                    parent_job_id = futures[future]
+                    for item_key, item_annotations in future.result():
+                        merged_annotations[parent_job_id][item_key] = [
+                            ann.to_annotation() if isinstance(ann, _PickledRleMask) else ann
+                            for ann in item_annotations
+                        ]
+
+                    remaining_frame_jobs[parent_job_id] -= 1
+                    if not remaining_frame_jobs[parent_job_id]:
+                        _save_job(parent_job_id)
+
+                    _report_progress(
+                        (merged_job_count + finished_count / len(frame_jobs) * len(parent_job_ids))
+                        / total_job_count
+                    )
+        finally:
+            _merge_worker_context = None
+
+    def _merge_jobs(self, parent_job_ids: Sequence[int]):
+        max_workers = settings.CVAT_CONSENSUS_MERGING_WORKERS
+        if 1 < max_workers:
+            self._merge_in_parallel(parent_job_ids, max_workers=max_workers)
+        else:
+            for merged_count, parent_job_id in enumerate(parent_job_ids, start=1):
+                self._merge_consensus_jobs(parent_job_id)
+                _report_progress(merged_count / len(parent_job_ids))
+
     @transaction.atomic
     def merge_all_consensus_jobs(self) -> None:
-        for parent_job_id in self._jobs.keys():
-            self._merge_consensus_jobs(parent_job_id)
+        self._merge_jobs(list(self._jobs.keys()))
 
     @transaction.atomic
     def merge_single_consensus_job(self, parent_job_id: int) -> None:
-        self._merge_consensus_jobs(parent_job_id)
+        self._merge_jobs([parent_job_id])
+
+
+def _report_progress(progress: float):
+    if rq_job := rq.get_current_job():
+        rq_job_meta = BaseRQMeta.for_job(rq_job)
+        rq_job_meta.progress = progress
+        rq_job_meta.save()
+
+
+@attrs.define(kw_only=True)
+class _PickledRleMask:
+    # dm.RleMask keeps a lazy mask decoder, which can't be pickled,
+    # so RLE masks are sent from the workers in this form
+    rle: dict
+    id: int
+    label: int | None
+    z_order: int
+    group: int
+    attributes: dict
+
+    @classmethod
+    def from_annotation(cls, ann: dm.RleMask) -> _PickledRleMask:
+        return cls(
+            rle=ann.rle,
+            id=ann.id,
+            label=ann.label,
+            z_order=ann.z_order,
+            group=ann.group,
+            attributes=ann.attributes,
+        )
+
+    def to_annotation(self) -> dm.RleMask:
+        return dm.RleMask(
+            rle=self.rle,
+            id=self.id,
+            label=self.label,
+            z_order=self.z_order,
+            group=self.group,
+            attributes=self.attributes,
+        )
+
+
+_merge_worker_context: dict[int, tuple[IntersectMerge.Conf, list[dm.Dataset]]] | None = None
+
+
+def _merge_frames_in_worker(
+    parent_job_id: int, item_keys: Sequence[tuple[str, str]]
+) -> list[tuple[tuple[str, str], list[dm.Annotation | _PickledRleMask]]]:
+    merger_conf, consensus_datasets = _merge_worker_context[parent_job_id]
+
+    frame_datasets = [
+        dm.Dataset.from_iterable(
+            (
+                item
+                for item_id, subset in item_keys
+                if (item := dataset.get(item_id, subset)) is not None
+            ),
+            categories=dataset.categories(),
+            media_type=dataset.media_type(),
+        )
+        for dataset in consensus_datasets
+    ]
+
+    merged_dataset = IntersectMerge(conf=merger_conf)(*frame_datasets)
+    return [
+        (
+            (item.id, item.subset),
+            [
+                _PickledRleMask.from_annotation(ann) if isinstance(ann, dm.RleMask) else ann
+                for ann in item.annotations
+            ],
+        )
+        for item in merged_dataset
+    ]
 
 
 class MergingNotAvailable(Exception):
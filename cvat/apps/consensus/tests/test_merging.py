@@ -0,0 +1,105 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+import random
+from unittest import TestCase, mock
+
+import datumaro as dm
+import numpy as np
+from django.test import override_settings
+from pycocotools import mask as mask_utils
+
+from cvat.apps.consensus.merging_manager import _TaskMerger
+from cvat.apps.consensus.models import ConsensusSettings
+
+
+class TestParallelMerging(TestCase):
+    _PARENT_JOB_IDS = [1, 2, 3]
+    _REPLICA_COUNT = 3
+    _FRAME_COUNT = 7
+
+    def _make_consensus_datasets(self, parent_job_id: int) -> list[dm.Dataset]:
+        # The merger modifies the merged annotations, so the datasets are created for each merge
+        rng = random.Random(parent_job_id)
+
+        base_boxes = {
+            frame: [
+                (rng.randint(0, 60), rng.randint(0, 60), rng.randint(10, 30), rng.randint(10, 30))
+                for _ in range(rng.randint(0, 4))
+            ]
+            for frame in range(self._FRAME_COUNT)
+        }
+
+        def make_mask(x, y, w, h):
+            image = np.zeros((100, 100), dtype=np.uint8)
+            image[y : y + h, x : x + w] = 1
+            return mask_utils.encode(np.asfortranarray(image))
+
+        datasets = []
+        for _ in range(self._REPLICA_COUNT):
+            items = []
+            for frame, boxes in base_boxes.items():
+                annotations = []
+                for i, (x, y, w, h) in enumerate(boxes):
+                    x += rng.randint(-2, 2)
+                    y += rng.randint(-2, 2)
+                    label = rng.choice([0, 0, 1])
+                    annotations.append(dm.Bbox(x, y, w, h, label=label, id=i))
+                    annotations.append(dm.RleMask(make_mask(x, y, w, h), label=label, id=100 + i))
+
+                items.append(
+                    dm.DatasetItem(
+                        id=f"frame_{frame}",
+                        media=dm.Image.from_file(path=f"frame_{frame}.jpg", size=(100, 100)),
+                        annotations=annotations,
+                    )
+                )
+
+            datasets.append(dm.Dataset.from_iterable(items, categories=["a", "b"]))
+
+        return datasets
+
+    def _merge(self) -> dict[int, list]:
+        merged_jobs = {}
+
+        def save_merged_annotations(parent_job_id: int, merged_dataset: dm.Dataset):
+            merged_jobs[parent_job_id] = [
+                (item.id, item.subset, item.annotations)
+                for item in sorted(merged_dataset, key=lambda item: item.id)
+            ]
+
+        merger = _TaskMerger.__new__(_TaskMerger)
+        merger._settings = ConsensusSettings(quorum=0.5, iou_threshold=0.4)
+
+        with (
+            mock.patch.object(merger, "check_merging_available"),
+            mock.patch.object(
+                merger, "_get_consensus_datasets", side_effect=self._make_consensus_datasets
+            ),
+            mock.patch.object(
+                merger, "_save_merged_annotations", side_effect=save_merged_annotations
+            ),
+        ):
+            merger._merge_jobs(self._PARENT_JOB_IDS)
+
+        return merged_jobs
+
+    def test_can_merge_jobs_in_parallel_as_serially(self):
+        with override_settings(CVAT_CONSENSUS_MERGING_WORKERS=1):
+            expected = self._merge()
+
+        # more jobs than workers, so the jobs are merged in several batches
+        with override_settings(CVAT_CONSENSUS_MERGING_WORKERS=2):
+            actual = self._merge()
+
+        self.assertEqual(sorted(expected), self._PARENT_JOB_IDS)
+        self.assertTrue(
+            any(
+                isinstance(ann, dm.RleMask)
+                for items in actual.values()
+                for _, _, annotations in items
+                for ann in annotations
+            )
+        )
+        self.assertEqual(expected, actual)
@@ -18,6 +18,318 @@ from cvat.apps.engine.models import DimensionType, ShapeType
 from cvat.apps.engine.serializers import LabeledDataSerializer
 
 
+class ShapeTable(Sequence):
+    """
+    A columnar store for labeled shapes.
+
+    The shape fields are kept in NumPy arrays, the point coordinates and the attributes
+    are kept in shared buffers with per-shape offsets. Such a table takes much less memory
+    than a list of shape dicts and allows selecting shapes by frame without iterating
+    over them. Shape dicts are only created when the shapes are accessed.
+    """
+
+    _SCALAR_FIELDS = {
+        "id": np.int64,
+        "frame": np.int64,
+        "label_id": np.int64,
+        "group": np.int64,
+        "z_order": np.int64,
+        "rotation": np.float64,
+        "occluded": np.bool_,
+        "outside": np.bool_,
+    }
+    _CATEGORICAL_FIELDS = ("type", "source")
+    _BUFFER_FIELDS = ("points", "attributes")
+
+    # field states
+    _PRESENT = 0
+    _NONE = 1
+    _MISSING = 2
+
+    def __init__(self, shapes: Sequence[dict] = ()):
+        self._columns: dict[str, np.ndarray] = {}
+        self._states: dict[str, np.ndarray] = {}
+        self._categories: dict[str, list] = {}
+
+        scalar_values = {field: [] for field in self._SCALAR_FIELDS}
+        categorical_codes = {field: [] for field in self._CATEGORICAL_FIELDS}
+        category_codes = {field: {} for field in self._CATEGORICAL_FIELDS}
+        states = {field: [] for field in self._all_fields()}
+
+        points = []
+        point_counts = []
+        attr_spec_ids = []
+        attr_values = []
+        attr_counts = []
+        attr_value_cache = {}
+        extras = []
+
+        for shape in shapes:
+            extra = {}
+            for field, value in shape.items():
+                if field in self._SCALAR_FIELDS or field in self._CATEGORICAL_FIELDS:
+                    continue
+                if field == "points" and isinstance(value, list):
+                    continue
+                if field == "attributes" and self._is_plain_attribute_list(value):
+                    continue
+
+                extra[field] = value
+            extras.append(extra or None)
+
+            for field in self._SCALAR_FIELDS:
+                value = shape.get(field)
+                states[field].append(self._get_state(shape, field))
+                scalar_values[field].append(value if value is not None else 0)
+
+            for field in self._CATEGORICAL_FIELDS:
+                value = shape.get(field)
+                states[field].append(self._get_state(shape, field))
+                categorical_codes[field].append(
+                    category_codes[field].setdefault(value, len(category_codes[field]))
+                )
+
+            if "points" in extra or "points" not in shape:
+                states["points"].append(self._MISSING)
+                point_counts.append(0)
+            else:
+                states["points"].append(self._PRESENT)
+                points.extend(shape["points"])
+                point_counts.append(len(shape["points"]))
+
+            if "attributes" in extra or "attributes" not in shape:
+                states["attributes"].append(self._MISSING)
+                attr_counts.append(0)
+            else:
+                states["attributes"].append(self._PRESENT)
+                for attr in shape["attributes"]:
+                    attr_spec_ids.append(attr["spec_id"])
+                    # many shapes have the same attribute values, keep only one copy of each
+                    attr_values.append(attr_value_cache.setdefault(attr["value"], attr["value"]))
+                attr_counts.append(len(shape["attributes"]))
+
+        for field, dtype in self._SCALAR_FIELDS.items():
+            self._columns[field] = np.array(scalar_values[field], dtype=dtype)
+
+        for field in self._CATEGORICAL_FIELDS:
+            self._columns[field] = np.array(categorical_codes[field], dtype=np.int32)
+            self._categories[field] = list(category_codes[field])
+
+        for field, field_states in states.items():
+            self._states[field] = np.array(field_states, dtype=np.int8)
+
+        self._points = np.array(points, dtype=np.float64)
+        self._point_offsets = self._make_offsets(point_counts)
+        self._attr_spec_ids = np.array(attr_spec_ids, dtype=np.int64)
+        self._attr_values = self._make_object_array(attr_values)
+        self._attr_offsets = self._make_offsets(attr_counts)
+        self._extras = self._make_object_array(extras)
+
+    @classmethod
+    def _all_fields(cls) -> tuple[str, ...]:
+        return (*cls._SCALAR_FIELDS, *cls._CATEGORICAL_FIELDS, *cls._BUFFER_FIELDS)
+
+    @classmethod
+    def _get_state(cls, shape: dict, field: str) -> int:
+        if field not in shape:
+            return cls._MISSING
+        elif shape[field] is None:
+            return cls._NONE
+        else:
+            return cls._PRESENT
+
+    @staticmethod
+    def _is_plain_attribute_list(attributes) -> bool:
+        return isinstance(attributes, list) and all(
+            isinstance(attr, dict) and attr.keys() == {"spec_id", "value"} for attr in attributes
+        )
+
+    @staticmethod
+    def _make_object_array(values: list) -> np.ndarray:
+        array = np.empty(len(values), dtype=object)
+        try:
+            array[:] = values
+        except ValueError:
+            # nested sequences can be treated as extra array dimensions
+            for i, value in enumerate(values):
+                array[i] = value
+        return array
+
+    @staticmethod
+    def _make_offsets(counts) -> np.ndarray:
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return offsets
+
+    @classmethod
+    def _get_ragged_positions(
+        cls, offsets: np.ndarray, indices: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        "Returns buffer positions of the selected items and offsets of the items in the result"
+        starts = offsets[indices]
+        counts = offsets[indices + 1] - starts
+        new_offsets = cls._make_offsets(counts)
+        positions = np.repeat(starts - new_offsets[:-1], counts) + np.arange(
+            new_offsets[-1], dtype=np.int64
+        )
+        return positions, new_offsets
+
+    def __len__(self) -> int:
+        return len(self._extras)
+
+    @property
+    def frames(self) -> np.ndarray:
+        return self._columns["frame"]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("shape index out of range")
+
+        return self._make_shape(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._make_shape(index)
+
+    def _make_shape(self, index: int) -> dict:
+        shape = {}
+
+        for field in self._SCALAR_FIELDS:
+            state = self._states[field][index]
+            if state == self._PRESENT:
+                shape[field] = self._columns[field][index].item()
+            elif state == self._NONE:
+                shape[field] = None
+
+        for field in self._CATEGORICAL_FIELDS:
+            state = self._states[field][index]
+            if state == self._PRESENT:
+                shape[field] = self._categories[field][self._columns[field][index]]
+            elif state == self._NONE:
+                shape[field] = None
+
+        if self._states["points"][index] == self._PRESENT:
+            shape["points"] = self._points[
+                self._point_offsets[index] : self._point_offsets[index + 1]
+            ].tolist()
+
+        if self._states["attributes"][index] == self._PRESENT:
+            attrs_start = self._attr_offsets[index]
+            attrs_stop = self._attr_offsets[index + 1]
+            shape["attributes"] = [
+                {"spec_id": spec_id, "value": value}
+                for spec_id, value in zip(
+                    self._attr_spec_ids[attrs_start:attrs_stop].tolist(),
+                    self._attr_values[attrs_start:attrs_stop],
+                )
+            ]
+
+        if (extra := self._extras[index]) is not None:
+            shape.update(faster_deepcopy(extra))
+
+        return shape
+
+    def to_list(self) -> list[dict]:
+        return list(self)
+
+    def take(self, indices: np.ndarray) -> "ShapeTable":
+        "Returns a table with the shapes at the specified positions, in the specified order"
+
+        if indices.dtype == np.bool_:
+            indices = np.flatnonzero(indices)
+        indices = indices.astype(np.int64, copy=False)
+
+        table = ShapeTable()
+        table._columns = {field: column[indices] for field, column in self._columns.items()}
+        table._states = {field: states[indices] for field, states in self._states.items()}
+        table._categories = self._categories
+        point_positions, table._point_offsets = self._get_ragged_positions(
+            self._point_offsets, indices
+        )
+        table._points = self._points[point_positions]
+        attr_positions, table._attr_offsets = self._get_ragged_positions(
+            self._attr_offsets, indices
+        )
+        table._attr_spec_ids = self._attr_spec_ids[attr_positions]
+        table._attr_values = self._attr_values[attr_positions]
+        table._extras = self._extras[indices]
+        return table
+
+    def slice(self, start: int, stop: int) -> "ShapeTable":
+        "Returns a table with the shapes in the [start; stop] frame range"
+        return self.take((start <= self.frames) & (self.frames <= stop))
+
+    def filter_frames(
+        self,
+        *,
+        included_frames: Optional[Container[int]] = None,
+        deleted_frames: Optional[Container[int]] = None,
+    ) -> "ShapeTable":
+        mask = np.ones(len(self), dtype=np.bool_)
+
+        if included_frames is not None:
+            mask &= np.isin(self.frames, np.fromiter(included_frames, dtype=np.int64))
+
+        if deleted_frames is not None:
+            mask &= ~np.isin(self.frames, np.fromiter(deleted_frames, dtype=np.int64))
+
+        return self.take(mask)
+
+    @classmethod
+    def concat(cls, tables: Sequence["ShapeTable"]) -> "ShapeTable":
+        table = ShapeTable()
+
+        for field in cls._SCALAR_FIELDS:
+            table._columns[field] = np.concatenate(
+                [table._columns[field]] + [t._columns[field] for t in tables]
+            )
+
+        for field in cls._CATEGORICAL_FIELDS:
+            # different tables can have different category codes
+            category_codes = {}
+            field_columns = [table._columns[field]]
+            for t in tables:
+                code_mapping = np.array(
+                    [
+                        category_codes.setdefault(value, len(category_codes))
+                        for value in t._categories[field]
+                    ],
+                    dtype=np.int32,
+                )
+                field_columns.append(code_mapping[t._columns[field]])
+
+            table._columns[field] = np.concatenate(field_columns)
+            table._categories[field] = list(category_codes)
+
+        for field in cls._all_fields():
+            table._states[field] = np.concatenate(
+                [table._states[field]] + [t._states[field] for t in tables]
+            )
+
+        def _concat_offsets(offsets_list):
+            shifted_offsets = [np.zeros(1, dtype=np.int64)]
+            shift = 0
+            for offsets in offsets_list:
+                shifted_offsets.append(offsets[1:] + shift)
+                shift += offsets[-1]
+            return np.concatenate(shifted_offsets)
+
+        table._points = np.concatenate([table._points] + [t._points for t in tables])
+        table._point_offsets = _concat_offsets([t._point_offsets for t in tables])
+        table._attr_spec_ids = np.concatenate(
+            [table._attr_spec_ids] + [t._attr_spec_ids for t in tables]
+        )
+        table._attr_values = np.concatenate([table._attr_values] + [t._attr_values for t in tables])
+        table._attr_offsets = _concat_offsets([t._attr_offsets for t in tables])
+        table._extras = np.concatenate([table._extras] + [t._extras for t in tables])
+        return table
+
+
 class AnnotationIR:
     def __init__(self, dimension, data=None):
         self.reset()
@@ -163,9 +475,12 @@ class AnnotationIR:
         splitted_data.tags = [
             deepcopy(t) for t in self.tags if self._is_shape_inside(t, start, stop)
         ]
-        splitted_data.shapes = [
-            deepcopy(s) for s in self.shapes if self._is_shape_inside(s, start, stop)
-        ]
+        if isinstance(self.shapes, ShapeTable):
+            splitted_data.shapes = self.shapes.slice(start, stop)
+        else:
+            splitted_data.shapes = [
+                deepcopy(s) for s in self.shapes if self._is_shape_inside(s, start, stop)
+            ]
         splitted_tracks = []
         for t in self.tracks:
             if self._is_track_inside(t, start, stop):
@@ -182,6 +497,11 @@ class AnnotationIR:
         self.shapes = []
         self.tracks = []
 
+    def use_shape_table(self):
+        "Moves the shapes into a ShapeTable to reduce memory use and speed up processing"
+        if not isinstance(self.shapes, ShapeTable):
+            self.shapes = ShapeTable(self.shapes)
+
 
 class AnnotationManager:
     def __init__(self, data: AnnotationIR, *, dimension: DimensionType):
@@ -192,12 +512,41 @@ class AnnotationManager:
         tags = TagManager(self.data.tags, dimension=self.dimension)
         tags.merge(data.tags, start_frame, overlap)
 
-        shapes = ShapeManager(self.data.shapes, dimension=self.dimension)
-        shapes.merge(data.shapes, start_frame, overlap)
+        if isinstance(self.data.shapes, ShapeTable):
+            self.data.shapes = self._merge_shape_tables(
+                self.data.shapes, data.shapes, start_frame, overlap
+            )
+        else:
+            shapes = ShapeManager(self.data.shapes, dimension=self.dimension)
+            shapes.merge(data.shapes, start_frame, overlap)
 
         tracks = TrackManager(self.data.tracks, dimension=self.dimension)
         tracks.merge(data.tracks, start_frame, overlap)
 
+    def _merge_shape_tables(
+        self,
+        old_shapes: ShapeTable,
+        shapes: ShapeTable | Sequence[dict],
+        start_frame: int,
+        overlap: int,
+    ) -> ShapeTable:
+        if not isinstance(shapes, ShapeTable):
+            shapes = ShapeTable(shapes)
+
+        # Only the shapes in the overlapping frames can be matched, so only these shapes
+        # are converted to dicts and merged as usual. The results are the same as
+        # for the shape lists, including the shape order.
+        old_int_shapes = old_shapes.take(old_shapes.frames >= start_frame).to_list()
+        int_shapes_mask = shapes.frames < start_frame + overlap
+
+        shape_manager = ShapeManager(list(old_int_shapes), dimension=self.dimension)
+        shape_manager.merge(shapes.take(int_shapes_mask).to_list(), start_frame, overlap)
+        added_int_shapes = shape_manager.objects[len(old_int_shapes) :]
+
+        return ShapeTable.concat(
+            [old_shapes, shapes.take(~int_shapes_mask), ShapeTable(added_int_shapes)]
+        )
+
     def clear_frames(self, frames: Container[int]):
         if not isinstance(frames, set):
             frames = set(frames)
@@ -205,8 +554,11 @@ class AnnotationManager:
         tags = TagManager(self.data.tags, dimension=self.dimension)
         tags.clear_frames(frames)
 
-        shapes = ShapeManager(self.data.shapes, dimension=self.dimension)
-        shapes.clear_frames(frames)
+        if isinstance(self.data.shapes, ShapeTable):
+            self.data.shapes = self.data.shapes.filter_frames(deleted_frames=frames)
+        else:
+            shapes = ShapeManager(self.data.shapes, dimension=self.dimension)
+            shapes.clear_frames(frames)
 
         if self.data.tracks:
             # Tracks are not expected in the cases this function is supposed to be used
@@ -224,11 +576,16 @@ class AnnotationManager:
         shapes = self.data.shapes
         tracks = TrackManager(self.data.tracks, dimension=self.dimension)
 
-        if included_frames is not None:
-            shapes = [s for s in shapes if s["frame"] in included_frames]
+        if isinstance(shapes, ShapeTable):
+            shapes = shapes.filter_frames(
+                included_frames=included_frames, deleted_frames=deleted_frames
+            ).to_list()
+        else:
+            if included_frames is not None:
+                shapes = [s for s in shapes if s["frame"] in included_frames]
 
-        if deleted_frames is not None:
-            shapes = [s for s in shapes if s["frame"] not in deleted_frames]
+            if deleted_frames is not None:
+                shapes = [s for s in shapes if s["frame"] not in deleted_frames]
 
         return shapes + tracks.to_shapes(
             end_frame,
@@ -513,7 +870,7 @@ class TrackManager(ObjectManager):
                 shape["group"] = track["group"]
                 shape["track_id"] = track_id
                 shape["source"] = track["source"]
-                shape["attributes"] += track["attributes"]
+                shape["attributes"] = shape["attributes"] + track["attributes"]
                 shape["elements"] = []
 
                 track_shapes[shape["frame"]] = shape
@@ -644,26 +1001,57 @@ class TrackManager(ObjectManager):
         # to produce the requested track frames.
         deleted_frames = deleted_frames or []
 
-        def copy_shape(source, frame, points=None, rotation=None):
-            copied = source.copy()
-            copied["attributes"] = faster_deepcopy(source["attributes"])
+        if included_frames is not None:
+            included_frames = set(included_frames)
 
-            copied["keyframe"] = False
-            copied["frame"] = frame
-            if rotation is not None:
-                copied["rotation"] = rotation
+        def copy_points(points):
+            if isinstance(points, np.ndarray):
+                return points.tolist()
+            elif not isinstance(points, tuple):
+                return points.copy()
 
-            if points is None:
-                points = copied["points"]
+            return points
 
-            if isinstance(points, np.ndarray):
+        def copy_shapes(source, frames, points=None, rotations=None):
+            if not frames:
+                return []
+
+            # Interpolated shapes are not modified in place,
+            # so all the copies of a shape can share the same attributes
+            attributes = faster_deepcopy(source["attributes"])
+
+            if points is None:
+                points = [copy_points(source["points"]) for _ in frames]
+            elif isinstance(points, np.ndarray):
                 points = points.tolist()
-            elif not isinstance(points, tuple):
-                points = points.copy()
 
-            copied["points"] = points
+            shapes = []
+            for i, frame in enumerate(frames):
+                copied = source.copy()
+                copied["attributes"] = attributes
+                copied["keyframe"] = False
+                copied["frame"] = frame
+                if rotations is not None:
+                    copied["rotation"] = rotations[i]
+                copied["points"] = points[i]
+                shapes.append(copied)
 
-            return copied
+            return shapes
+
+        def get_frames(start, stop):
+            if included_frames is None:
+                return list(range(start, stop))
+            elif len(included_frames) < stop - start:
+                # Only a small part of the frames can be requested, e.g. in windowed exports
+                return sorted(frame for frame in included_frames if start <= frame < stop)
+
+            return [frame for frame in range(start, stop) if frame in included_frames]
+
+        def get_interpolated_frames(shape0, shape1):
+            frames = get_frames(shape0["frame"] + 1, shape1["frame"])
+            distance = shape1["frame"] - shape0["frame"]
+            offsets = (np.array(frames, dtype=int) - shape0["frame"]) / distance
+            return frames, offsets
 
         def find_angle_diff(right_angle, left_angle):
             angle_diff = right_angle - left_angle
@@ -676,23 +1064,20 @@ class TrackManager(ObjectManager):
             return angle_diff
 
         def simple_interpolation(shape0, shape1):
-            shapes = []
-            distance = shape1["frame"] - shape0["frame"]
-            diff = np.subtract(shape1["points"], shape0["points"])
-
-            for frame in range(shape0["frame"] + 1, shape1["frame"]):
-                offset = (frame - shape0["frame"]) / distance
-                rotation = (
-                    shape0["rotation"]
-                    + find_angle_diff(shape1["rotation"], shape0["rotation"]) * offset
-                    + 360
-                ) % 360
-                points = shape0["points"] + diff * offset
+            frames, offsets = get_interpolated_frames(shape0, shape1)
+            if not frames:
+                return []
 
-                if included_frames is None or frame in included_frames:
-                    shapes.append(copy_shape(shape0, frame, points, rotation))
+            # All the frames between the keyframes are computed at once
+            diff = np.subtract(shape1["points"], shape0["points"])
+            points = np.asarray(shape0["points"]) + diff * offsets[:, np.newaxis]
+            rotations = (
+                shape0["rotation"]
+                + find_angle_diff(shape1["rotation"], shape0["rotation"]) * offsets
+                + 360
+            ) % 360
 
-            return shapes
+            return copy_shapes(shape0, frames, points, rotations.tolist())
 
         def simple_3d_interpolation(shape0, shape1):
             result = simple_interpolation(shape0, shape1)
@@ -715,14 +1100,10 @@ class TrackManager(ObjectManager):
             if len(shape0["points"]) == 2 and len(shape1["points"]) == 2:
                 return simple_interpolation(shape0, shape1)
             else:
-                shapes = []
-                for frame in range(shape0["frame"] + 1, shape1["frame"]):
-                    if included_frames is None or frame in included_frames:
-                        shapes.append(copy_shape(shape0, frame))
+                frames, _ = get_interpolated_frames(shape0, shape1)
+                return copy_shapes(shape0, frames)
 
-            return shapes
-
-        def interpolate_position(left_position, right_position, offset):
+        def interpolate_positions(left_position, right_position, offsets):
             def to_array(points):
                 return np.asarray([[point["x"], point["y"]] for point in points]).flatten()
 
@@ -893,22 +1274,31 @@ class TrackManager(ObjectManager):
             matching = match_left_right(left_offset_vec, right_offset_vec)
             completed_matching = match_right_left(left_offset_vec, right_offset_vec, matching)
 
-            interpolated_points = []
-            for left_point_index, left_point in enumerate(left_points):
+            # The point matching doesn't depend on the offset,
+            # so the points can be interpolated for all the offsets at once
+            left_indexes = []
+            right_indexes = []
+            for left_point_index in range(len(left_points)):
                 for right_point_index in completed_matching[left_point_index]:
-                    right_point = right_points[right_point_index]
-                    interpolated_points.append(
-                        {
-                            "x": left_point["x"] + (right_point["x"] - left_point["x"]) * offset,
-                            "y": left_point["y"] + (right_point["y"] - left_point["y"]) * offset,
-                        }
-                    )
-
-            reducedPoints = reduce_interpolation(
-                interpolated_points, completed_matching, left_points, right_points
+                    left_indexes.append(left_point_index)
+                    right_indexes.append(right_point_index)
+
+            left_matched = np.asarray(left_position["points"]).reshape(-1, 2)[left_indexes]
+            right_matched = np.asarray(right_position["points"]).reshape(-1, 2)[right_indexes]
+            interpolated = (
+                left_matched
+                + (right_matched - left_matched) * np.asarray(offsets)[:, np.newaxis, np.newaxis]
             )
 
-            return to_array(reducedPoints).tolist()
+            positions = []
+            for frame_points in interpolated:
+                interpolated_points = [{"x": x, "y": y} for x, y in frame_points]
+                reducedPoints = reduce_interpolation(
+                    interpolated_points, completed_matching, left_points, right_points
+                )
+                positions.append(to_array(reducedPoints).tolist())
+
+            return positions
 
         def polyshape_interpolation(shape0, shape1):
             shapes = []
@@ -920,13 +1310,9 @@ class TrackManager(ObjectManager):
                 shape0["points"] = shape0["points"] + shape0["points"][:2]
                 shape1["points"] = shape1["points"] + shape1["points"][:2]
 
-            distance = shape1["frame"] - shape0["frame"]
-            for frame in range(shape0["frame"] + 1, shape1["frame"]):
-                offset = (frame - shape0["frame"]) / distance
-                points = interpolate_position(shape0, shape1, offset)
-
-                if included_frames is None or frame in included_frames:
-                    shapes.append(copy_shape(shape0, frame, points))
+            frames, offsets = get_interpolated_frames(shape0, shape1)
+            if frames:
+                shapes = copy_shapes(shape0, frames, interpolate_positions(shape0, shape1, offsets))
 
             if is_polygon:
                 # Remove the extra point added
@@ -964,12 +1350,8 @@ class TrackManager(ObjectManager):
 
             return shapes
 
-        def propagate(shape: dict, end_frame, *, included_frames=None):
-            return [
-                copy_shape(shape, i)
-                for i in range(shape["frame"] + 1, end_frame)
-                if included_frames is None or i in included_frames
-            ]
+        def propagate(shape: dict, end_frame):
+            return copy_shapes(shape, get_frames(shape["frame"] + 1, end_frame))
 
         shapes = []
         prev_shape: dict | None = None
@@ -1023,7 +1405,7 @@ class TrackManager(ObjectManager):
         if prev_shape and (not prev_shape["outside"] or include_outside):
             # When the latest keyframe of a track is less than the end_frame
             # and it is not outside, need to propagate
-            shapes.extend(propagate(prev_shape, end_frame, included_frames=included_frames))
+            shapes.extend(propagate(prev_shape, end_frame))
 
         shapes = [
             shape
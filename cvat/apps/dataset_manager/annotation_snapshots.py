@@ -0,0 +1,85 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+import json
+import zlib
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+class AnnotationSnapshotCache:
+    """
+    Keeps serialized job annotations, so repeated reads of unchanged jobs
+    don't need to query and serialize the annotations again.
+
+    Each snapshot is stored with the version of the job annotations it was made for.
+    A snapshot is only returned if the requested version matches the stored one.
+    """
+
+    _CACHE_NAME = "media"
+    _KEY_PREFIX = "annotations:job-snapshot-"
+    _FIELDS = ("tags", "shapes", "tracks")
+
+    @classmethod
+    def _cache(cls):
+        return caches[cls._CACHE_NAME]
+
+    @classmethod
+    def _make_key(cls, job_id: int) -> str:
+        return f"{cls._KEY_PREFIX}{job_id}"
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return 0 < settings.CVAT_ANNOTATION_SNAPSHOT_CACHE_TTL
+
+    @classmethod
+    def get(cls, job_id: int, version: str) -> Optional[dict[str, list[dict[str, Any]]]]:
+        if not cls.is_enabled():
+            return None
+
+        item = cls._cache().get(cls._make_key(job_id))
+        if not item:
+            return None
+
+        item_version, data = item
+        if item_version != version:
+            return None
+
+        return dict(zip(cls._FIELDS, json.loads(zlib.decompress(data))))
+
+    @classmethod
+    def set(cls, job_id: int, version: str, annotations: dict[str, list[dict[str, Any]]]) -> None:
+        if not cls.is_enabled():
+            return
+
+        data = zlib.compress(
+            json.dumps(
+                [annotations[field] for field in cls._FIELDS], separators=(",", ":")
+            ).encode(),
+            level=1,
+        )
+        if settings.CVAT_CACHE_ITEM_MAX_SIZE < len(data):
+            return
+
+        # The snapshot is only stored if the data it was made from is committed.
+        # Otherwise, the snapshot can include changes that are rolled back later.
+        transaction.on_commit(
+            lambda: cls._cache().set(
+                cls._make_key(job_id),
+                (version, data),
+                timeout=settings.CVAT_ANNOTATION_SNAPSHOT_CACHE_TTL,
+            )
+        )
+
+    @classmethod
+    def delete_many(cls, job_ids: Iterable[int]) -> None:
+        if not cls.is_enabled():
+            return
+
+        keys = [cls._make_key(job_id) for job_id in job_ids]
+        transaction.on_commit(lambda: cls._cache().delete_many(keys))
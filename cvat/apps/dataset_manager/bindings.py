@@ -5,11 +5,13 @@
 
 from __future__ import annotations
 
+import math
 import os.path as osp
 import re
 import sys
+from bisect import bisect_left, bisect_right
 from collections import OrderedDict, defaultdict
-from collections.abc import Iterable, Iterator, Mapping, Sequence
+from collections.abc import Container, Iterable, Iterator, Mapping, Sequence
 from functools import partial, reduce
 from operator import add
 from pathlib import Path
@@ -20,6 +22,7 @@ import attr
 import datumaro as dm
 import datumaro.util
 import defusedxml.ElementTree as ET
+import numpy as np
 import rq
 from attr import attrib, attrs
 from attrs.converters import to_bool
@@ -48,15 +51,165 @@ from cvat.apps.engine.models import (
     Task,
 )
 from cvat.apps.engine.rq import ImportRQMeta
+from cvat.apps.engine.utils import take_by
 
 from ..engine.log import ServerLogManager
-from .annotation import AnnotationIR, AnnotationManager, TrackManager
+from .annotation import AnnotationIR, AnnotationManager, ShapeTable, TrackManager
 from .formats.transformations import MaskConverter
 
 slogger = ServerLogManager(__name__)
 
 CVAT_INTERNAL_ATTRIBUTES = {'occluded', 'outside', 'keyframe', 'track_id', 'rotation'}
 
+class _AnnotationsByFrame:
+    """
+    Allows getting the annotations of a frame range without scanning all the annotations.
+    Each window in windowed frame grouping only needs the annotations of its frames.
+
+    The results are the same as from AnnotationManager.to_shapes() with the same frames,
+    including the shape order on each frame and the track ids.
+    """
+
+    def __init__(self, annotation_ir: AnnotationIR, *, deleted_frames: Sequence[int]):
+        self._annotation_ir = annotation_ir
+        self._deleted_frames = deleted_frames
+
+        shapes = annotation_ir.shapes
+        if isinstance(shapes, ShapeTable):
+            self._shape_order = np.argsort(shapes.frames, kind="stable")
+            self._shape_frames = shapes.frames[self._shape_order]
+        else:
+            self._shapes_by_frame: dict[int, list[dict]] = defaultdict(list)
+            for shape in shapes:
+                self._shapes_by_frame[shape["frame"]].append(shape)
+
+        self._tags_by_frame: dict[int, list[dict]] = defaultdict(list)
+        for tag in annotation_ir.tags:
+            self._tags_by_frame[tag["frame"]].append(tag)
+
+        track_ranges = []
+        for idx, track in enumerate(annotation_ir.tracks):
+            track_range = self.get_track_range(track, deleted_frames=deleted_frames)
+            if track_range:
+                track_ranges.append((*track_range, idx))
+
+        track_ranges.sort()
+        self._track_ranges = track_ranges
+        self._track_starts = [start for start, _, _ in track_ranges]
+
+    @staticmethod
+    def get_track_range(
+        track: dict, *, deleted_frames: Container[int]
+    ) -> tuple[int, int | float] | None:
+        """
+        Returns the first and the last frames, where the track can have shapes.
+        A track can only have shapes after its first keyframe. If the last keyframe
+        is outside, there are no shapes after it, otherwise the track lasts till the end.
+        """
+
+        keyframes = [shape for shape in track["shapes"] if shape["frame"] not in deleted_frames]
+        if not keyframes:
+            return None
+
+        first_keyframe = min(keyframes, key=lambda shape: shape["frame"])
+        last_keyframe = max(keyframes, key=lambda shape: shape["frame"])
+        return (
+            first_keyframe["frame"],
+            last_keyframe["frame"] if last_keyframe["outside"] else math.inf,
+        )
+
+    @classmethod
+    def iterate_track_shapes(
+        cls,
+        track: dict,
+        end_frame: int,
+        dimension: DimensionType | str,
+        *,
+        window_size: int,
+    ) -> Iterator[dict]:
+        """
+        Yields the same shapes as TrackManager.get_interpolated_shapes() for the whole track,
+        but interpolates them for windows of frames, in the frame order.
+        Only the keyframes around a window are used for the window.
+        """
+
+        track_range = cls.get_track_range(track, deleted_frames=())
+        if not track_range:
+            return
+
+        keyframes = sorted(track["shapes"], key=lambda shape: shape["frame"])
+        keyframe_numbers = [shape["frame"] for shape in keyframes]
+
+        first_frame, last_frame = track_range
+        for window_start in range(first_frame, min(last_frame + 1, end_frame), window_size):
+            window_stop = min(window_start + window_size, end_frame)
+
+            # Attributes are propagated between the keyframes in place,
+            # so the previous keyframes are already updated by the previous windows
+            window_keyframes = keyframes[
+                max(0, bisect_right(keyframe_numbers, window_start) - 1):
+                bisect_left(keyframe_numbers, window_stop) + 1
+            ]
+            yield from TrackManager.get_interpolated_shapes(
+                dict(track, shapes=window_keyframes),
+                0,
+                end_frame,
+                dimension,
+                included_frames=range(window_start, window_stop),
+            )
+
+    def get_shapes(
+        self, frames: set[int], end_frame: int, *, use_server_track_ids: bool
+    ) -> list[dict]:
+        if not frames:
+            return []
+
+        first_frame = min(frames)
+        last_frame = max(frames)
+
+        shapes = self._annotation_ir.shapes
+        if isinstance(shapes, ShapeTable):
+            shape_indices = np.sort(self._shape_order[
+                np.searchsorted(self._shape_frames, first_frame, side="left"):
+                np.searchsorted(self._shape_frames, last_frame, side="right")
+            ])
+            shapes = shapes.take(shape_indices).filter_frames(
+                included_frames=frames, deleted_frames=self._deleted_frames
+            ).to_list()
+        else:
+            shapes = [
+                shape
+                for frame in sorted(frames)
+                if frame not in self._deleted_frames
+                for shape in self._shapes_by_frame.get(frame, [])
+            ]
+
+        track_indices = sorted(
+            idx
+            for _, stop, idx in self._track_ranges[:bisect_right(self._track_starts, last_frame)]
+            if first_frame <= stop
+        )
+        track_shapes = TrackManager(
+            [self._annotation_ir.tracks[idx] for idx in track_indices],
+            dimension=self._annotation_ir.dimension,
+        ).to_shapes(
+            end_frame,
+            included_frames=frames,
+            deleted_frames=self._deleted_frames,
+            include_outside=False,
+            use_server_track_ids=use_server_track_ids,
+        )
+
+        if not use_server_track_ids:
+            # The track ids are the track positions in the whole list
+            for shape in track_shapes:
+                shape["track_id"] = track_indices[shape["track_id"]]
+
+        return shapes + track_shapes
+
+    def get_tags(self, frames: set[int]) -> list[dict]:
+        return [tag for frame in sorted(frames) for tag in self._tags_by_frame.get(frame, [])]
+
 class InstanceLabelData:
     class Attribute(NamedTuple):
         name: str
@@ -447,25 +600,40 @@ class CommonData(InstanceLabelData):
             attributes=self._export_attributes(tag["attributes"]),
         )
 
-    def _export_track(self, track, idx):
+    def _export_track(self, track, idx, *, window_size: int | None = None):
         track['shapes'] = list(filter(lambda x: not self._is_frame_deleted(x['frame']), track['shapes']))
-        tracked_shapes = TrackManager.get_interpolated_shapes(
-            track, 0, self.stop + 1, self._annotation_ir.dimension)
-        for tracked_shape in tracked_shapes:
-            tracked_shape["attributes"] += track["attributes"]
-            tracked_shape["track_id"] = track["track_id"] if self._use_server_track_ids else idx
-            tracked_shape["group"] = track["group"]
-            tracked_shape["source"] = track["source"]
-            tracked_shape["label_id"] = track["label_id"]
+        if window_size:
+            tracked_shapes = _AnnotationsByFrame.iterate_track_shapes(
+                track, self.stop + 1, self._annotation_ir.dimension, window_size=window_size
+            )
+        else:
+            tracked_shapes = TrackManager.get_interpolated_shapes(
+                track, 0, self.stop + 1, self._annotation_ir.dimension)
+
+        # The keyframes are returned as is, so the shapes are not modified in place
+        shapes = (
+            self._export_tracked_shape(dict(tracked_shape,
+                attributes=tracked_shape["attributes"] + track["attributes"],
+                track_id=track["track_id"] if self._use_server_track_ids else idx,
+                group=track["group"],
+                source=track["source"],
+                label_id=track["label_id"],
+            ))
+            for tracked_shape in tracked_shapes
+            if not self._is_frame_deleted(tracked_shape["frame"])
+        )
 
         return CommonData.Track(
             id=track["id"],
             label=self._get_label_name(track["label_id"]),
             group=track["group"],
             source=track["source"],
-            shapes=[self._export_tracked_shape(shape)
-                for shape in tracked_shapes if not self._is_frame_deleted(shape["frame"])],
-            elements=[self._export_track(element, i) for i, element in enumerate(track.get("elements", []))]
+            # The windowed shapes are produced lazily, when the track is read
+            shapes=shapes if window_size else list(shapes),
+            elements=[
+                self._export_track(element, i, window_size=window_size)
+                for i, element in enumerate(track.get("elements", []))
+            ]
         )
 
     @staticmethod
@@ -477,7 +645,43 @@ class CommonData(InstanceLabelData):
             type=label.type
         )
 
-    def group_by_frame(self, include_empty: bool = False):
+    def group_by_frame(self, include_empty: bool = False, *, window_size: int | None = None):
+        """
+        window_size: if set, the annotations are grouped for windows of this number of frames,
+            and the frames are returned in the frame order. Only the prepared annotations
+            of one window are kept in memory, including the interpolated track shapes.
+            The source annotations are still kept in memory fully.
+        """
+
+        included_frames = self.get_included_frames()
+
+        if not window_size:
+            return iter(self._group_frames(included_frames, include_empty=include_empty).values())
+
+        def _iterate_windows():
+            annotations_by_frame = _AnnotationsByFrame(
+                self._annotation_ir, deleted_frames=self.deleted_frames.keys()
+            )
+
+            for window in take_by(sorted(included_frames), window_size):
+                yield from sorted(
+                    self._group_frames(
+                        set(window),
+                        include_empty=include_empty,
+                        annotations_by_frame=annotations_by_frame,
+                    ).values(),
+                    key=lambda frame: frame.frame,
+                )
+
+        return _iterate_windows()
+
+    def _group_frames(
+        self,
+        included_frames: set[int],
+        *,
+        include_empty: bool,
+        annotations_by_frame: _AnnotationsByFrame | None = None,
+    ):
         frames = {}
         def get_frame(idx):
             frame_info = self._frame_info[idx]
@@ -499,26 +703,30 @@ class CommonData(InstanceLabelData):
                 )
             return frames[frame]
 
-        included_frames = self.get_included_frames()
-
         if include_empty:
-            for idx in sorted(set(self._frame_info) & included_frames):
+            for idx in sorted(idx for idx in included_frames if idx in self._frame_info):
                 get_frame(idx)
 
-        anno_manager = AnnotationManager(
-            self._annotation_ir, dimension=self._annotation_ir.dimension
-        )
-        for shape in sorted(
-            anno_manager.to_shapes(
+        if annotations_by_frame is not None:
+            shapes = annotations_by_frame.get_shapes(
+                included_frames, self.stop + 1, use_server_track_ids=self._use_server_track_ids
+            )
+            tags = annotations_by_frame.get_tags(included_frames)
+        else:
+            anno_manager = AnnotationManager(
+                self._annotation_ir, dimension=self._annotation_ir.dimension
+            )
+            shapes = anno_manager.to_shapes(
                 self.stop + 1,
                 # Skip outside, deleted and excluded frames
                 included_frames=included_frames,
                 deleted_frames=self.deleted_frames.keys(),
                 include_outside=False,
                 use_server_track_ids=self._use_server_track_ids,
-            ),
-            key=lambda shape: shape.get("z_order", 0)
-        ):
+            )
+            tags = self._annotation_ir.tags
+
+        for shape in sorted(shapes, key=lambda shape: shape.get("z_order", 0)):
             shape_data = ''
 
             if 'track_id' in shape:
@@ -537,12 +745,12 @@ class CommonData(InstanceLabelData):
                     label = self._export_label(label)
                     get_frame(shape['frame']).labels.update({label.id: label})
 
-        for tag in self._annotation_ir.tags:
+        for tag in tags:
             if tag['frame'] not in included_frames:
                 continue
             get_frame(tag['frame']).tags.append(self._export_tag(tag))
 
-        return iter(frames.values())
+        return frames
 
     @property
     def shapes(self):
@@ -571,8 +779,16 @@ class CommonData(InstanceLabelData):
 
     @property
     def tracks(self):
+        return self.iterate_tracks()
+
+    def iterate_tracks(self, *, window_size: int | None = None):
+        """
+        window_size: if set, the track shapes are interpolated for windows of this number
+            of frames, when they are read. The shapes of each track can only be read once then.
+        """
+
         for idx, track in enumerate(self._annotation_ir.tracks):
-            yield self._export_track(track, idx)
+            yield self._export_track(track, idx, window_size=window_size)
 
     @property
     def tags(self):
@@ -1247,30 +1463,104 @@ class ProjectData(InstanceLabelData):
             task_id=task_id
         )
 
-    def _export_track(self, track: dict, task_id: int, task_size: int, idx: int):
+    def _export_track(
+        self, track: dict, task_id: int, task_size: int, idx: int, *, window_size: int | None = None
+    ):
         track['shapes'] = list(filter(lambda x: (task_id, x['frame']) not in self._deleted_frames, track['shapes']))
-        tracked_shapes = TrackManager.get_interpolated_shapes(
-            track, 0, task_size, self._annotation_irs[task_id].dimension
+        if window_size:
+            tracked_shapes = _AnnotationsByFrame.iterate_track_shapes(
+                track, task_size, self._annotation_irs[task_id].dimension, window_size=window_size
+            )
+        else:
+            tracked_shapes = TrackManager.get_interpolated_shapes(
+                track, 0, task_size, self._annotation_irs[task_id].dimension
+            )
+
+        # The keyframes are returned as is, so the shapes are not modified in place
+        shapes = (
+            self._export_tracked_shape(dict(tracked_shape,
+                attributes=tracked_shape["attributes"] + track["attributes"],
+                track_id=track["track_id"] if self._use_server_track_ids else idx,
+                group=track["group"],
+                source=track["source"],
+                label_id=track["label_id"],
+            ), task_id)
+            for tracked_shape in tracked_shapes
+            if (task_id, tracked_shape["frame"]) not in self._deleted_frames
         )
-        for tracked_shape in tracked_shapes:
-            tracked_shape["attributes"] += track["attributes"]
-            tracked_shape["track_id"] = track["track_id"] if self._use_server_track_ids else idx
-            tracked_shape["group"] = track["group"]
-            tracked_shape["source"] = track["source"]
-            tracked_shape["label_id"] = track["label_id"]
 
         return ProjectData.Track(
             label=self._get_label_name(track["label_id"]),
             group=track["group"],
             source=track["source"],
-            shapes=[self._export_tracked_shape(shape, task_id) for shape in tracked_shapes
-                if (task_id, shape["frame"]) not in self._deleted_frames],
+            # The windowed shapes are produced lazily, when the track is read
+            shapes=shapes if window_size else list(shapes),
             task_id=task_id,
-            elements=[self._export_track(element, task_id, task_size, i)
-                for i, element in enumerate(track.get("elements", []))]
+            elements=[
+                self._export_track(element, task_id, task_size, i, window_size=window_size)
+                for i, element in enumerate(track.get("elements", []))
+            ]
         )
 
-    def group_by_frame(self, include_empty: bool = False):
+    def group_by_frame(self, include_empty: bool = False, *, window_size: int | None = None):
+        """
+        window_size: if set, the annotations are grouped for windows of this number of frames,
+            and the frames are returned in the task and frame order. Only the prepared
+            annotations of one window are kept in memory, including the interpolated
+            track shapes. The source annotations are still kept in memory fully.
+        """
+
+        if not window_size:
+            return iter(self._group_frames(include_empty=include_empty).values())
+
+        def _iterate_windows():
+            for task_id in sorted(self._db_tasks):
+                task_data = self._task_data(task_id)
+                annotations_by_frame = _AnnotationsByFrame(
+                    self._annotation_irs[task_id], deleted_frames=task_data.deleted_frames.keys()
+                )
+
+                for window in take_by(sorted(task_data.get_included_frames()), window_size):
+                    yield from sorted(
+                        self._group_frames(
+                            {task_id: set(window)},
+                            include_empty=include_empty,
+                            annotations_by_frame={task_id: annotations_by_frame},
+                        ).values(),
+                        key=lambda frame: frame.frame,
+                    )
+
+            # Tags are also exported on the task frames that are not included
+            task_frames = defaultdict(set)
+            for task_id, frame in self._frame_info:
+                task_frames[task_id].add(frame)
+
+            yield from self._group_frames(
+                {
+                    task_id: frames - self._task_data(task_id).get_included_frames()
+                    for task_id, frames in task_frames.items()
+                },
+                include_empty=False,
+                include_shapes=False,
+            ).values()
+
+        return _iterate_windows()
+
+    def _group_frames(
+        self,
+        included_frames: dict[int, set[int]] | None = None,
+        *,
+        include_empty: bool,
+        include_shapes: bool = True,
+        annotations_by_frame: dict[int, _AnnotationsByFrame] | None = None,
+    ) -> dict[tuple[str, int], ProjectData.Frame]:
+        """
+        included_frames: the frames to group in each task. By default, the included frames
+            of all the tasks are grouped, and tags are grouped on all the task frames.
+        annotations_by_frame: the task annotations indexed by frame, if available.
+            Allows to avoid scanning all the task annotations for few frames.
+        """
+
         frames: dict[tuple[str, int], ProjectData.Frame] = {}
         def get_frame(task_id: int, idx: int) -> ProjectData.Frame:
             frame_info = self._frame_info[(task_id, idx)]
@@ -1290,7 +1580,15 @@ class ProjectData(InstanceLabelData):
                 )
             return frames[(frame_info["subset"], abs_frame)]
 
-        if include_empty:
+        if include_empty and included_frames is not None:
+            for task_id, frame in sorted(
+                (task_id, frame)
+                for task_id, task_frames in included_frames.items()
+                for frame in task_frames
+            ):
+                if (task_id, frame) in self._frame_info:
+                    get_frame(task_id, frame)
+        elif include_empty:
             for task_id, frame in sorted(self._frame_info):
                 if not self._tasks_data.get(task_id):
                     self.init_task_data(task_id)
@@ -1301,22 +1599,35 @@ class ProjectData(InstanceLabelData):
 
         for task_data in self.all_task_data:
             task: Task = task_data.db_instance
+            if included_frames is None:
+                task_included_frames = task_data.get_included_frames()
+            elif task.id in included_frames:
+                task_included_frames = included_frames[task.id]
+            else:
+                continue
 
-            anno_manager = AnnotationManager(
-                self._annotation_irs[task.id], dimension=self._annotation_irs[task.id].dimension
-            )
-            task_included_frames = task_data.get_included_frames()
+            task_annotations_by_frame = (annotations_by_frame or {}).get(task.id)
 
-            for shape in sorted(
-                anno_manager.to_shapes(
+            task_shapes = []
+            if include_shapes and task_annotations_by_frame is not None:
+                task_shapes = task_annotations_by_frame.get_shapes(
+                    task_included_frames,
+                    task.data.size,
+                    use_server_track_ids=self._use_server_track_ids,
+                )
+            elif include_shapes:
+                anno_manager = AnnotationManager(
+                    self._annotation_irs[task.id], dimension=self._annotation_irs[task.id].dimension
+                )
+                task_shapes = anno_manager.to_shapes(
                     task.data.size,
                     included_frames=task_included_frames,
                     deleted_frames=task_data.deleted_frames.keys(),
                     include_outside=False,
                     use_server_track_ids=self._use_server_track_ids,
-                ),
-                key=lambda shape: shape.get("z_order", 0)
-            ):
+                )
+
+            for shape in sorted(task_shapes, key=lambda shape: shape.get("z_order", 0)):
                 assert (task.id, shape['frame']) in self._frame_info
 
                 if 'track_id' in shape:
@@ -1327,12 +1638,19 @@ class ProjectData(InstanceLabelData):
                     exported_shape = self._export_labeled_shape(shape, task.id)
                 get_frame(task.id, shape['frame']).labeled_shapes.append(exported_shape)
 
-            for tag in self._annotation_irs[task.id].tags:
+            if task_annotations_by_frame is not None:
+                task_tags = task_annotations_by_frame.get_tags(task_included_frames)
+            else:
+                task_tags = self._annotation_irs[task.id].tags
+
+            for tag in task_tags:
                 if (task.id, tag['frame']) not in self._frame_info:
                     continue
+                if included_frames is not None and tag['frame'] not in task_included_frames:
+                    continue
                 get_frame(task.id, tag['frame']).tags.append(self._export_tag(tag, task.id))
 
-        return iter(frames.values())
+        return frames
 
     @property
     def shapes(self):
@@ -1343,10 +1661,20 @@ class ProjectData(InstanceLabelData):
 
     @property
     def tracks(self):
+        return self.iterate_tracks()
+
+    def iterate_tracks(self, *, window_size: int | None = None):
+        """
+        window_size: if set, the track shapes are interpolated for windows of this number
+            of frames, when they are read. The shapes of each track can only be read once then.
+        """
+
         idx = 0
         for task in self._db_tasks.values():
             for track in self._annotation_irs[task.id].tracks:
-                yield self._export_track(track, task.id, task.data.size, idx)
+                yield self._export_track(
+                    track, task.id, task.data.size, idx, window_size=window_size
+                )
 
     @property
     def tags(self):
@@ -3,13 +3,18 @@
 #
 # SPDX-License-Identifier: MIT
 
+import hashlib
+import json
 import os
 import os.path as osp
+import shutil
 import zipfile
 from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import ExitStack
 from glob import glob
 from io import BufferedWriter
-from typing import Callable, Union
+from typing import BinaryIO, Callable, Union
 
 from datumaro.components.annotation import (
     AnnotationType,
@@ -27,6 +32,7 @@ from datumaro.components.importer import Importer
 from datumaro.components.media import Image
 from datumaro.plugins.data_formats.cvat.base import CvatImporter as _CvatImporter
 from defusedxml import ElementTree
+from django.conf import settings
 
 from cvat.apps.dataset_manager.bindings import (
     CVATProjectDataExtractor,
@@ -40,8 +46,19 @@ from cvat.apps.dataset_manager.bindings import (
     import_dm_annotations,
     match_dm_item,
 )
-from cvat.apps.dataset_manager.util import make_zip_archive
-from cvat.apps.engine.frame_provider import FrameOutputType, FrameQuality, make_frame_provider
+from cvat.apps.dataset_manager.util import (
+    ExportCacheManager,
+    TmpDirManager,
+    extend_export_file_lifetime,
+    get_export_cache_lock,
+    make_zip_archive,
+)
+from cvat.apps.engine.frame_provider import (
+    FrameOutputType,
+    FrameQuality,
+    IFrameProvider,
+    make_frame_provider,
+)
 
 from .registry import dm_env, exporter, importer
 
@@ -839,7 +856,11 @@ def dump_as_cvat_annotation(dumper, annotations):
     dumper.open_root()
     dumper.add_meta(annotations.meta)
 
-    for frame_annotation in annotations.group_by_frame(include_empty=True):
+    # The frames are prepared and written by windows, to avoid keeping all the annotations
+    # with the interpolated track shapes in memory at once
+    for frame_annotation in annotations.group_by_frame(
+        include_empty=True, window_size=settings.CVAT_EXPORT_FRAME_WINDOW_SIZE
+    ):
         frame_id = frame_annotation.frame
         image_attrs = OrderedDict([("id", str(frame_id)), ("name", frame_annotation.name)])
         if isinstance(annotations, ProjectData):
@@ -1140,19 +1161,14 @@ def dump_as_cvat_interpolation(dumper, annotations):
         elif shape.type == "cuboid":
             dumper.open_cuboid(dump_data)
         elif shape.type == "skeleton":
-            if element_shapes and element_shapes.get(shape.frame):
+            if element_shapes:
                 dumper.open_skeleton(dump_data)
-                for element_shape, label in element_shapes.get(shape.frame, []):
+                for element_shape, label in element_shapes:
                     dump_shape(element_shape, label=label)
         else:
             raise NotImplementedError("unknown shape type")
 
-        if (
-            shape.type == "skeleton"
-            and element_shapes
-            and element_shapes.get(shape.frame)
-            or shape.type != "skeleton"
-        ):
+        if (shape.type == "skeleton" and element_shapes) or shape.type != "skeleton":
             for attr in shape.attributes:
                 dumper.add_attribute(OrderedDict([("name", attr.name), ("value", attr.value)]))
 
@@ -1171,7 +1187,7 @@ def dump_as_cvat_interpolation(dumper, annotations):
         elif shape.type == "cuboid":
             dumper.close_cuboid()
         elif shape.type == "skeleton":
-            if element_shapes and element_shapes.get(shape.frame):
+            if element_shapes:
                 dumper.close_skeleton()
         else:
             raise NotImplementedError("unknown shape type")
@@ -1197,20 +1213,30 @@ def dump_as_cvat_interpolation(dumper, annotations):
             dump_data["group_id"] = str(track.group)
         dumper.open_track(dump_data)
 
-        element_shapes = {}
-        for element_track in track.elements:
-            for element_shape in element_track.shapes:
-                if element_shape.frame not in element_shapes:
-                    element_shapes[element_shape.frame] = []
-                element_shapes[element_shape.frame].append((element_shape, element_track.label))
+        # The track shapes can be produced lazily, so the element shapes are read
+        # in the frame order together with the skeleton shapes
+        element_iters = [iter(element_track.shapes) for element_track in track.elements]
+        next_element_shapes = [next(element_iter, None) for element_iter in element_iters]
 
         for shape in track.shapes:
+            element_shapes = []
+            for i, element_track in enumerate(track.elements):
+                while (
+                    next_element_shapes[i] is not None
+                    and next_element_shapes[i].frame < shape.frame
+                ):
+                    next_element_shapes[i] = next(element_iters[i], None)
+
+                element_shape = next_element_shapes[i]
+                if element_shape is not None and element_shape.frame == shape.frame:
+                    element_shapes.append((element_shape, element_track.label))
+
             dump_shape(shape, element_shapes)
 
         dumper.close_track()
 
     counter = 0
-    for track in annotations.tracks:
+    for track in annotations.iterate_tracks(window_size=settings.CVAT_EXPORT_FRAME_WINDOW_SIZE):
         dump_track(counter, track)
         counter += 1
 
@@ -1578,14 +1604,29 @@ def dump_project_anno(dst_file: BufferedWriter, project_data: ProjectData, callb
     dumper.close_document()
 
 
-def dump_media_files(
-    instance_data: Union[TaskData, JobData], img_dir: str, project_data: ProjectData = None
-):
-    frame_provider = make_frame_provider(instance_data.db_instance)
-
+def _get_media_file_names(
+    instance_data: Union[TaskData, JobData], project_data: ProjectData = None
+) -> dict[int, str]:
     ext = ""
     if instance_data.meta[instance_data.META_FIELD]["mode"] == "interpolation":
-        ext = frame_provider.VIDEO_FRAME_EXT
+        ext = IFrameProvider.VIDEO_FRAME_EXT
+
+    return {
+        frame_id: (
+            instance_data.frame_info[frame_id]["path"]
+            if project_data is None
+            else project_data.frame_info[(instance_data.db_instance.id, frame_id)]["path"]
+        )
+        + ext
+        # exclude deleted frames and honeypots
+        for frame_id in sorted(instance_data.get_included_frames())
+    }
+
+
+def _iterate_media_files(
+    instance_data: Union[TaskData, JobData], frame_names: dict[int, str]
+) -> Iterator[tuple[str, bytes]]:
+    frame_provider = make_frame_provider(instance_data.db_instance)
 
     frames = frame_provider.iterate_frames(
         start_frame=instance_data.start,
@@ -1593,31 +1634,87 @@ def dump_media_files(
         quality=FrameQuality.ORIGINAL,
         out_type=FrameOutputType.BUFFER,
     )
-    included_frames = instance_data.get_included_frames()
 
     for frame_id, frame in zip(instance_data.rel_range, frames):
-        # exclude deleted frames and honeypots
-        if frame_id not in included_frames:
+        if frame_id not in frame_names:
             continue
-        frame_name = (
-            instance_data.frame_info[frame_id]["path"]
-            if project_data is None
-            else project_data.frame_info[(instance_data.db_instance.id, frame_id)]["path"]
-        )
-        img_path = osp.join(img_dir, frame_name + ext)
+
+        yield frame_names[frame_id], frame.data.getvalue()
+
+
+def dump_media_files(
+    instance_data: Union[TaskData, JobData], img_dir: str, project_data: ProjectData = None
+):
+    frame_names = _get_media_file_names(instance_data, project_data)
+
+    for frame_name, frame_data in _iterate_media_files(instance_data, frame_names):
+        img_path = osp.join(img_dir, frame_name)
         os.makedirs(osp.dirname(img_path), exist_ok=True)
         with open(img_path, "wb") as f:
-            f.write(frame.data.getvalue())
+            f.write(frame_data)
+
+
+def open_media_archive(
+    instance_data: Union[TaskData, JobData], project_data: ProjectData = None
+) -> BinaryIO:
+    """
+    Returns an opened zip archive with the media files of the task or job.
+
+    The media files don't change when the annotations are changed, so the archives are kept
+    in the export cache, and repeated exports with images only copy the files from there.
+    The archive is identified by the list of the exported files. For instance, frame deletion
+    requires a new archive.
+    """
+
+    db_instance = instance_data.db_instance
+    frame_names = _get_media_file_names(instance_data, project_data)
+
+    media_id = hashlib.blake2b(
+        json.dumps([instance_data.db_data.id, sorted(frame_names.items())]).encode(),
+        digest_size=16,
+    ).hexdigest()
+    media_file_path = ExportCacheManager.make_media_file_path(
+        instance_type=db_instance.__class__.__name__,
+        instance_id=db_instance.id,
+        instance_timestamp=db_instance.created_date.timestamp(),
+        media_id=media_id,
+    )
+    lock_params = dict(
+        ttl=settings.EXPORT_CACHE_LOCK_TTL,
+        acquire_timeout=settings.EXPORT_CACHE_LOCK_ACQUISITION_TIMEOUT,
+    )
+
+    # An opened file can still be read after the file is removed by the cache cleanup
+    with get_export_cache_lock(media_file_path, **lock_params):
+        if osp.exists(media_file_path):
+            extend_export_file_lifetime(media_file_path)
+            return open(media_file_path, "rb")
+
+    with TmpDirManager.get_tmp_directory() as temp_dir:
+        temp_file = osp.join(temp_dir, "media.zip")
+
+        # The media files are already compressed, so they are stored as is
+        with zipfile.ZipFile(temp_file, "w", compression=zipfile.ZIP_STORED) as archive:
+            for frame_name, frame_data in _iterate_media_files(instance_data, frame_names):
+                archive.writestr(osp.normpath(frame_name), frame_data)
+
+        with get_export_cache_lock(media_file_path, **lock_params):
+            shutil.move(temp_file, media_file_path)
+            return open(media_file_path, "rb")
 
 
 def _export_task_or_job(dst_file, temp_dir, instance_data, anno_callback, save_images=False):
     with open(osp.join(temp_dir, "annotations.xml"), "wb") as f:
         dump_task_or_job_anno(f, instance_data, anno_callback)
 
-    if save_images:
-        dump_media_files(instance_data, osp.join(temp_dir, "images"))
+    with ExitStack() as es:
+        media_archives = []
+        if save_images and settings.EXPORT_MEDIA_CACHE_ENABLED:
+            media_archives.append((es.enter_context(open_media_archive(instance_data)), "images"))
+        elif save_images:
+            dump_media_files(instance_data, osp.join(temp_dir, "images"))
 
-    make_zip_archive(temp_dir, dst_file)
+        make_zip_archive(temp_dir, dst_file, included_archives=media_archives)
 
 
 def _export_project(
@@ -1630,14 +1727,22 @@ def _export_project(
     with open(osp.join(temp_dir, "annotations.xml"), "wb") as f:
         dump_project_anno(f, project_data, anno_callback)
 
-    if save_images:
-        for task_data in project_data.all_task_data:
-            subset = get_defaulted_subset(task_data.db_instance.subset, project_data.subsets)
-            subset_dir = osp.join(temp_dir, "images", subset)
-            os.makedirs(subset_dir, exist_ok=True)
-            dump_media_files(task_data, subset_dir, project_data)
+    with ExitStack() as es:
+        media_archives = []
+        if save_images:
+            for task_data in project_data.all_task_data:
+                subset = get_defaulted_subset(task_data.db_instance.subset, project_data.subsets)
+                subset_dir = osp.join("images", subset)
+
+                if settings.EXPORT_MEDIA_CACHE_ENABLED:
+                    media_archives.append(
+                        (es.enter_context(open_media_archive(task_data, project_data)), subset_dir)
+                    )
+                else:
+                    os.makedirs(osp.join(temp_dir, subset_dir), exist_ok=True)
+                    dump_media_files(task_data, osp.join(temp_dir, subset_dir), project_data)
 
-    make_zip_archive(temp_dir, dst_file)
+        make_zip_archive(temp_dir, dst_file, included_archives=media_archives)
 
 
 @exporter(name="CVAT for video", ext="ZIP", version="1.1")
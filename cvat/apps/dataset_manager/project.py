@@ -46,7 +46,7 @@ def export_project(
     # https://github.com/cvat-ai/cvat/issues/217
     with transaction.atomic():
         project = ProjectAnnotationAndData(project_id)
-        project.init_from_db()
+        project.init_from_db(use_shape_table=True, parallel=True)
 
     exporter = make_exporter(format_name)
     with open(dst_file, "wb") as f:
@@ -139,17 +139,19 @@ class ProjectAnnotationAndData:
         if attributes:
             bulk_create(models.AttributeSpec, [a[1] for a in attributes])
 
-    def _init_task_from_db(self, task_id: int) -> None:
+    def _init_task_from_db(
+        self, task_id: int, *, use_shape_table: bool = False, parallel: bool = False
+    ) -> None:
         annotation = TaskAnnotation(pk=task_id)
-        annotation.init_from_db()
+        annotation.init_from_db(use_shape_table=use_shape_table, parallel=parallel)
         self.task_annotations[task_id] = annotation
         self.annotation_irs[task_id] = annotation.ir_data
 
-    def init_from_db(self):
+    def init_from_db(self, *, use_shape_table: bool = False, parallel: bool = False):
         self.reset()
 
         for task in self.db_tasks:
-            self._init_task_from_db(task.id)
+            self._init_task_from_db(task.id, use_shape_table=use_shape_table, parallel=parallel)
 
     def export(
         self,
@@ -3,21 +3,27 @@
 #
 # SPDX-License-Identifier: MIT
 
+import hashlib
 import io
 import itertools
+import json
 from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
 from copy import deepcopy
 from enum import Enum
-from typing import Callable, Optional, Union
+from functools import wraps
+from typing import Any, Callable, Optional, Union
 
 from datumaro.components.errors import DatasetError, DatasetImportError, DatasetNotFoundError
+from django import db
 from django.conf import settings
 from django.db import transaction
 from django.db.models.query import Prefetch, QuerySet
 from rest_framework.exceptions import ValidationError
 
-from cvat.apps.dataset_manager.annotation import AnnotationIR, AnnotationManager
+from cvat.apps.dataset_manager.annotation import AnnotationIR, AnnotationManager, ShapeTable
+from cvat.apps.dataset_manager.annotation_snapshots import AnnotationSnapshotCache
 from cvat.apps.dataset_manager.bindings import (
     CvatDatasetNotFoundError,
     CvatImportError,
@@ -28,7 +34,7 @@ from cvat.apps.dataset_manager.formats.registry import make_exporter, make_impor
 from cvat.apps.dataset_manager.util import TmpDirManager, faster_deepcopy
 from cvat.apps.engine import models, serializers
 from cvat.apps.engine.log import DatasetLogManager
-from cvat.apps.engine.model_utils import add_prefetch_fields, bulk_create, get_cached
+from cvat.apps.engine.model_utils import add_prefetch_fields, bulk_copy, get_cached
 from cvat.apps.engine.plugins import plugin_decorator
 from cvat.apps.engine.utils import av_scan_paths, take_by
 from cvat.apps.events.handlers import handle_annotations_change
@@ -37,6 +43,56 @@ from cvat.apps.profiler import silk_profile
 dlogger = DatasetLogManager()
 
 
+def _run_with_own_db_connection(func: Callable) -> Callable:
+    # Django opens a separate DB connection in each thread.
+    # The connection must be closed when the thread finishes its work.
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            db.connections.close_all()
+
+    return wrapper
+
+
+class _MergedShapeTables:
+    """
+    Keeps the merged job shapes in several tables to avoid copying all the merged shapes
+    on each job merge. Only the shapes starting from the specified frame are needed
+    for the merge, so only the tables with such shapes are concatenated.
+    The concatenated shapes have the same order as after merging in a single table.
+    """
+
+    def __init__(self):
+        # tables with the max frame in this and the previous tables
+        self._tables: list[tuple[ShapeTable, int]] = []
+
+    def push(self, table: ShapeTable):
+        if not len(table):
+            return
+
+        max_frame = int(table.frames.max())
+        if self._tables:
+            max_frame = max(max_frame, self._tables[-1][1])
+
+        self._tables.append((table, max_frame))
+
+    def pop_from(self, frame: int) -> ShapeTable:
+        "Removes and concatenates the last tables, which include the shapes from the frame"
+        first_table_index = len(self._tables)
+        while first_table_index and frame <= self._tables[first_table_index - 1][1]:
+            first_table_index -= 1
+
+        tables = [table for table, _ in self._tables[first_table_index:]]
+        del self._tables[first_table_index:]
+
+        if len(tables) == 1:
+            return tables[0]
+
+        return ShapeTable.concat(tables)
+
+
 class dotdict(OrderedDict):
     """dot.notation access to dictionary attributes"""
 
@@ -327,22 +383,22 @@ class JobAnnotation:
                 if elements or parent_track is None:
                     track["elements"] = elements
 
-            db_tracks = bulk_create(models.LabeledTrack, db_tracks)
+            db_tracks = bulk_copy(models.LabeledTrack, db_tracks)
 
             for db_attr_val in db_track_attr_vals:
                 db_attr_val.track_id = db_tracks[db_attr_val.track_id].id
 
-            bulk_create(models.LabeledTrackAttributeVal, db_track_attr_vals)
+            bulk_copy(models.LabeledTrackAttributeVal, db_track_attr_vals)
 
             for db_shape in db_shapes:
                 db_shape.track_id = db_tracks[db_shape.track_id].id
 
-            db_shapes = bulk_create(models.TrackedShape, db_shapes)
+            db_shapes = bulk_copy(models.TrackedShape, db_shapes)
 
             for db_attr_val in db_shape_attr_vals:
                 db_attr_val.shape_id = db_shapes[db_attr_val.shape_id].id
 
-            bulk_create(models.TrackedShapeAttributeVal, db_shape_attr_vals)
+            bulk_copy(models.TrackedShapeAttributeVal, db_shape_attr_vals)
 
             shape_idx = 0
             for track, db_track in zip(tracks, db_tracks):
@@ -384,12 +440,12 @@ class JobAnnotation:
                 if shape_elements or parent_shape is None:
                     shape["elements"] = shape_elements
 
-            db_shapes = bulk_create(models.LabeledShape, db_shapes)
+            db_shapes = bulk_copy(models.LabeledShape, db_shapes)
 
             for db_attr_val in db_attr_vals:
                 db_attr_val.shape_id = db_shapes[db_attr_val.shape_id].id
 
-            bulk_create(models.LabeledShapeAttributeVal, db_attr_vals)
+            bulk_copy(models.LabeledShapeAttributeVal, db_attr_vals)
 
             for shape, db_shape in zip(shapes, db_shapes):
                 shape["id"] = db_shape.id
@@ -420,12 +476,12 @@ class JobAnnotation:
             db_tags.append(db_tag)
             tag["attributes"] = attributes
 
-        db_tags = bulk_create(models.LabeledImage, db_tags)
+        db_tags = bulk_copy(models.LabeledImage, db_tags)
 
         for db_attr_val in db_attr_vals:
             db_attr_val.image_id = db_tags[db_attr_val.tag_id].id
 
-        bulk_create(models.LabeledImageAttributeVal, db_attr_vals)
+        bulk_copy(models.LabeledImageAttributeVal, db_attr_vals)
 
         for tag, db_tag in zip(tags, db_tags):
             tag["id"] = db_tag.id
@@ -444,7 +500,11 @@ class JobAnnotation:
     def _data_is_empty(data):
         return not (data["tags"] or data["shapes"] or data["tracks"])
 
+    def _invalidate_snapshot(self):
+        AnnotationSnapshotCache.delete_many([self.db_job.id])
+
     def _create(self, data):
+        self._invalidate_snapshot()
         self.reset()
         self._save_tags_to_db(data["tags"])
         self._save_shapes_to_db(data["shapes"])
@@ -478,7 +538,14 @@ class JobAnnotation:
 
         # in case with "update" must be called prior any annotations in database changes
         # as this annotations are used to count removed/added shapes
-        handle_annotations_change(self.db_job, data.data, "update")
+        # The previous tracks are only needed if tracks are updated
+        snapshot = self._get_cached_snapshot() if data.tracks else None
+        handle_annotations_change(
+            self.db_job,
+            data.data,
+            "update",
+            previous_tracks=snapshot["tracks"] if snapshot else None,
+        )
         self._delete(data)
         self._create(data)
 
@@ -576,6 +643,7 @@ class JobAnnotation:
                 "tracks": data["tracks"],
             }
 
+        self._invalidate_snapshot()
         self.reset()
         return deleted_data
 
@@ -773,12 +841,48 @@ class JobAnnotation:
     def _init_version_from_db(self):
         self.ir_data.version = 0  # FIXME: should be removed in the future
 
+    def _get_snapshot_version(self) -> str:
+        # Annotations can only be changed with the job updated date changed,
+        # but the default attribute values included in the annotations come from the labels
+        labels_state = json.dumps(
+            [
+                [
+                    label_id,
+                    [[spec_id, attr.value] for spec_id, attr in label_attrs["mutable"].items()],
+                    [[spec_id, attr.value] for spec_id, attr in label_attrs["immutable"].items()],
+                ]
+                for label_id, label_attrs in sorted(self.db_attributes.items())
+            ]
+        )
+        labels_digest = hashlib.blake2b(labels_state.encode(), digest_size=16).hexdigest()
+
+        return f"{self.db_job.updated_date.isoformat()}:{labels_digest}"
+
+    def _get_cached_snapshot(self) -> Optional[dict[str, list[dict[str, Any]]]]:
+        if not AnnotationSnapshotCache.is_enabled():
+            return None
+
+        return AnnotationSnapshotCache.get(self.db_job.id, self._get_snapshot_version())
+
     def init_from_db(self):
+        snapshot_version = None
+        if AnnotationSnapshotCache.is_enabled():
+            snapshot_version = self._get_snapshot_version()
+            if snapshot := AnnotationSnapshotCache.get(self.db_job.id, snapshot_version):
+                self.ir_data.tags = snapshot["tags"]
+                self.ir_data.shapes = snapshot["shapes"]
+                self.ir_data.tracks = snapshot["tracks"]
+                self._init_version_from_db()
+                return
+
         self._init_tags_from_db()
         self._init_shapes_from_db()
         self._init_tracks_from_db()
         self._init_version_from_db()
 
+        if snapshot_version:
+            AnnotationSnapshotCache.set(self.db_job.id, snapshot_version, self.ir_data.data)
+
     @property
     def data(self):
         return self.ir_data.data
@@ -987,21 +1091,80 @@ class TaskAnnotation:
             for db_job in self.db_jobs:
                 delete_job_data(db_job.id, db_job=db_job)
 
-    def init_from_db(self):
+    def init_from_db(self, *, use_shape_table: bool = False, parallel: bool = False):
+        """
+        use_shape_table: keep the shapes in a ShapeTable instead of a list of dicts.
+            It's useful for exports, which only need to read the shapes.
+        parallel: read the job annotations in several threads, as configured by
+            CVAT_TASK_ANNOTATION_LOADING_WORKERS. Each thread uses its own DB connection,
+            so the changes not committed in the current transaction are not visible there.
+            It's only suitable for reading the committed annotations, e.g. in exports.
+            The job annotations are merged in the job order in the current thread,
+            because the merge results depend on the order. The merge is done while the next
+            jobs are being read, and it typically takes much less time than the reading.
+        """
         self.reset()
+        if use_shape_table:
+            self.ir_data.use_shape_table()
+
+        db_jobs = [
+            db_job
+            for db_job in self.db_jobs.select_for_update()
+            if db_job.type != models.JobType.GROUND_TRUTH
+            or self.db_task.data.validation_mode == models.ValidationMode.GT_POOL
+        ]
 
-        for db_job in self.db_jobs.select_for_update():
-            if db_job.type == models.JobType.GROUND_TRUTH and (
-                self.db_task.data.validation_mode != models.ValidationMode.GT_POOL
-            ):
-                continue
+        # The labels and the attributes are prefetched with the jobs, and they are read here,
+        # so the model instances from this thread are not used in the other threads
+        job_annotations = [JobAnnotation(db_job.id, db_job=db_job) for db_job in db_jobs]
+        job_start_frames = [db_job.segment.start_frame for db_job in db_jobs]
 
-            annotation = JobAnnotation(db_job.id, db_job=db_job)
+        def _load_job_annotations_in_thread(
+            annotation: JobAnnotation, job_id: int
+        ) -> JobAnnotation:
+            # The job is fetched again with the DB connection of the thread
+            annotation.db_job = models.Job.objects.only("id", "updated_date").get(id=job_id)
+            return _load_job_annotations(annotation)
+
+        def _load_job_annotations(annotation: JobAnnotation) -> JobAnnotation:
             annotation.init_from_db()
-            if annotation.ir_data.version > self.ir_data.version:
-                self.ir_data.version = annotation.ir_data.version
+            if use_shape_table:
+                annotation.ir_data.use_shape_table()
+            return annotation
+
+        max_workers = settings.CVAT_TASK_ANNOTATION_LOADING_WORKERS if parallel else 1
+        with (
+            ThreadPoolExecutor(max_workers=min(max_workers, len(db_jobs)))
+            if 1 < max_workers and 1 < len(db_jobs)
+            else nullcontext()
+        ) as executor:
+            if executor:
+                loaded_job_annotations = executor.map(
+                    _run_with_own_db_connection(_load_job_annotations_in_thread),
+                    job_annotations,
+                    [db_job.id for db_job in db_jobs],
+                )
+            else:
+                loaded_job_annotations = map(_load_job_annotations, job_annotations)
+
+            # The merge results depend on the order of the jobs, so the jobs are merged
+            # in the original order, while the next jobs are being loaded
+            shape_tables = _MergedShapeTables() if use_shape_table else None
+            for start_frame, annotation in zip(job_start_frames, loaded_job_annotations):
+                if annotation.ir_data.version > self.ir_data.version:
+                    self.ir_data.version = annotation.ir_data.version
+
+                if shape_tables is not None:
+                    self.ir_data.shapes = shape_tables.pop_from(start_frame)
+
+                self._merge_data(annotation.ir_data, start_frame=start_frame)
+
+                if shape_tables is not None:
+                    shape_tables.push(self.ir_data.shapes)
+                    self.ir_data.shapes = ShapeTable()
 
-            self._merge_data(annotation.ir_data, start_frame=db_job.segment.start_frame)
+            if shape_tables is not None:
+                self.ir_data.shapes = shape_tables.pop_from(0)
 
     def export(
         self,
@@ -1177,7 +1340,7 @@ def export_task(
     # https://github.com/cvat-ai/cvat/issues/217
     with transaction.atomic():
         task = TaskAnnotation(task_id)
-        task.init_from_db()
+        task.init_from_db(use_shape_table=True, parallel=True)
 
     exporter = make_exporter(format_name)
     with open(dst_file, "wb") as f:
@@ -2,9 +2,18 @@
 #
 # SPDX-License-Identifier: MIT
 
-from unittest import TestCase
-
-from cvat.apps.dataset_manager.annotation import AnnotationIR, TrackManager
+from copy import deepcopy
+from unittest import TestCase, mock
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from cvat.apps.dataset_manager.annotation import (
+    AnnotationIR,
+    AnnotationManager,
+    ShapeTable,
+    TrackManager,
+)
+from cvat.apps.dataset_manager.annotation_snapshots import AnnotationSnapshotCache
 from cvat.apps.engine.models import DimensionType
 
 
@@ -182,6 +191,54 @@ class TrackManagerTest(TestCase):
 
         self._check_interpolation(track)
 
+    def test_can_interpolate_all_frames_between_keyframes(self):
+        track = {
+            "frame": 0,
+            "label_id": 0,
+            "group": None,
+            "attributes": [],
+            "source": "manual",
+            "shapes": [
+                {
+                    "frame": 0,
+                    "points": [0.0, 0.0, 4.0, 4.0],
+                    "rotation": 350,
+                    "type": "rectangle",
+                    "occluded": False,
+                    "outside": False,
+                    "attributes": [{"spec_id": 1, "value": "a"}],
+                },
+                {
+                    "frame": 4,
+                    "points": [4.0, 8.0, 8.0, 12.0],
+                    "rotation": 10,
+                    "type": "rectangle",
+                    "occluded": False,
+                    "outside": False,
+                    "attributes": [],
+                },
+            ],
+        }
+
+        interpolated = TrackManager.get_interpolated_shapes(track, 0, 5, "2d")
+
+        self.assertEqual(
+            [
+                (0, [0.0, 0.0, 4.0, 4.0], 350),
+                (1, [1.0, 2.0, 5.0, 6.0], 355.0),
+                (2, [2.0, 4.0, 6.0, 8.0], 0.0),
+                (3, [3.0, 6.0, 7.0, 10.0], 5.0),
+                (4, [4.0, 8.0, 8.0, 12.0], 10),
+            ],
+            [(shape["frame"], shape["points"], shape["rotation"]) for shape in interpolated],
+        )
+
+        # interpolated shapes share the attributes, which are not shared with the keyframes
+        self.assertIs(interpolated[1]["attributes"], interpolated[3]["attributes"])
+        self.assertIsNot(interpolated[0]["attributes"], interpolated[1]["attributes"])
+        self.assertEqual(interpolated[0]["attributes"], interpolated[1]["attributes"])
+        self.assertEqual(interpolated[0]["attributes"], interpolated[4]["attributes"])
+
     def test_outside_bbox_interpolation(self):
         track = {
             "frame": 0,
@@ -682,3 +739,133 @@ class AnnotationIRTest(TestCase):
         annotation = AnnotationIR(dimension=DimensionType.DIM_2D, data=data)
         sliced_annotation = annotation.slice(0, 1)
         self.assertEqual(sliced_annotation.data["tracks"][0]["shapes"], track_shapes[0:2])
+
+
+class ShapeTableTest(TestCase):
+    def _make_shapes(self, frames, *, id_offset=0):
+        return [
+            {
+                "id": id_offset + i,
+                "frame": frame,
+                "label_id": 1 + i % 2,
+                "group": None if i % 3 else 1,
+                "type": "rectangle" if i % 2 else "polygon",
+                "source": "manual",
+                "occluded": bool(i % 2),
+                "outside": False,
+                "z_order": i % 3,
+                "rotation": 0.0,
+                "points": (
+                    [10.0 * i, 10.0 * i, 10.0 * i + 5.5, 10.0 * i + 5.5]
+                    if i % 2
+                    else [10.0 * i, 10.0 * i, 10.0 * i + 5.5, 10.0 * i, 10.0 * i, 10.0 * i + 5.5]
+                ),
+                "attributes": [{"spec_id": j, "value": str(i)} for j in range(i % 3)],
+            }
+            for i, frame in enumerate(frames)
+        ]
+
+    def test_can_restore_shapes(self):
+        shapes = self._make_shapes([0, 5, 2, 8])
+        del shapes[0]["id"]
+        shapes[1]["elements"] = self._make_shapes([5], id_offset=100)
+        shapes[2]["attributes"] = [{"spec_id": 1, "value": "a", "extra": True}]
+
+        table = ShapeTable(shapes)
+
+        self.assertEqual(len(table), len(shapes))
+        self.assertEqual(table.to_list(), shapes)
+        self.assertEqual(table[-1], shapes[-1])
+        self.assertEqual(table[1:3].to_list(), shapes[1:3])
+
+    def test_can_slice_shapes(self):
+        shapes = self._make_shapes([0, 5, 2, 8, 4])
+        table = ShapeTable(shapes)
+
+        self.assertEqual(table.slice(2, 5).to_list(), [shapes[1], shapes[2], shapes[4]])
+        self.assertEqual(
+            table.filter_frames(included_frames={2, 4, 5, 8}, deleted_frames={8}).to_list(),
+            [shapes[1], shapes[2], shapes[4]],
+        )
+
+    def test_can_concat_tables(self):
+        shapes = self._make_shapes([0, 1, 2])
+        other_shapes = self._make_shapes([3, 4], id_offset=10)
+        other_shapes[0]["type"] = "points"
+
+        table = ShapeTable.concat([ShapeTable(shapes), ShapeTable(), ShapeTable(other_shapes)])
+
+        self.assertEqual(table.to_list(), shapes + other_shapes)
+
+    def test_merge_results_match_shape_lists(self):
+        jobs = [(0, 9), (5, 14)]
+        overlap = 5
+        job_shapes = [
+            self._make_shapes([0, 3, 5, 7, 9, 9]),
+            self._make_shapes([5, 7, 7, 10, 14], id_offset=10),
+        ]
+        job_shapes[1][1]["points"] = job_shapes[0][3]["points"]
+        job_shapes[1][1]["type"] = job_shapes[0][3]["type"]
+        job_shapes[1][1]["label_id"] = job_shapes[0][3]["label_id"]
+
+        expected = AnnotationIR(DimensionType.DIM_2D)
+        actual = AnnotationIR(DimensionType.DIM_2D)
+        actual.use_shape_table()
+        for (start_frame, _), shapes in zip(jobs, job_shapes):
+            for annotation in (expected, actual):
+                job_annotation = AnnotationIR(DimensionType.DIM_2D)
+                job_annotation.shapes = deepcopy(shapes)
+                if annotation is actual:
+                    job_annotation.use_shape_table()
+
+                AnnotationManager(annotation, dimension=DimensionType.DIM_2D).merge(
+                    job_annotation, start_frame, overlap
+                )
+
+        self.assertIsInstance(actual.shapes, ShapeTable)
+        self.assertEqual(len(actual.shapes), len(job_shapes[0]) + len(job_shapes[1]) - 1)
+        self.assertEqual(actual.shapes.to_list(), expected.shapes)
+        self.assertEqual(actual.slice(3, 7).shapes.to_list(), expected.slice(3, 7).shapes)
+
+
+class AnnotationSnapshotCacheTest(TestCase):
+    def setUp(self):
+        cache_patcher = mock.patch.object(
+            AnnotationSnapshotCache, "_cache", return_value=LocMemCache("snapshots", {})
+        )
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+        self.annotations = {
+            "version": 0,
+            "tags": [{"id": 1, "frame": 0, "label_id": 1, "attributes": []}],
+            "shapes": [
+                {
+                    "id": 2,
+                    "frame": 1,
+                    "points": [1.5, 2.0],
+                    "attributes": [{"spec_id": 1, "value": "a"}],
+                }
+            ],
+            "tracks": [],
+        }
+
+    def test_can_get_snapshot(self):
+        AnnotationSnapshotCache.set(1, "v1", self.annotations)
+
+        snapshot = AnnotationSnapshotCache.get(1, "v1")
+
+        self.assertEqual(snapshot, {k: v for k, v in self.annotations.items() if k != "version"})
+
+    def test_cannot_get_snapshot_of_other_version(self):
+        AnnotationSnapshotCache.set(1, "v1", self.annotations)
+
+        self.assertIsNone(AnnotationSnapshotCache.get(1, "v2"))
+        self.assertIsNone(AnnotationSnapshotCache.get(2, "v1"))
+
+    def test_can_delete_snapshots(self):
+        AnnotationSnapshotCache.set(1, "v1", self.annotations)
+
+        AnnotationSnapshotCache.delete_many([1])
+
+        self.assertIsNone(AnnotationSnapshotCache.get(1, "v1"))
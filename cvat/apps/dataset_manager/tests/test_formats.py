@@ -6,7 +6,9 @@
 import os.path as osp
 import tempfile
 import zipfile
+from copy import deepcopy
 from io import BytesIO
+from unittest import mock
 
 import datumaro
 import numpy as np
@@ -19,22 +21,25 @@ import cvat.apps.dataset_manager as dm
 from cvat.apps.dataset_manager.annotation import AnnotationIR
 from cvat.apps.dataset_manager.bindings import (
     CvatTaskOrJobDataExtractor,
+    ProjectData,
     TaskData,
     find_dataset_root,
 )
-from cvat.apps.dataset_manager.task import TaskAnnotation
+from cvat.apps.dataset_manager.project import ProjectAnnotationAndData
+from cvat.apps.dataset_manager.task import JobAnnotation, TaskAnnotation
 from cvat.apps.dataset_manager.tests.utils import (
     ensure_extractors_efficiency,
     ensure_streaming_importers,
 )
 from cvat.apps.dataset_manager.util import make_zip_archive
-from cvat.apps.engine.models import Task
+from cvat.apps.engine.models import Job, Project, Task
 from cvat.apps.engine.tests.utils import (
     ApiTestBase,
     ForceLogin,
     generate_image_file,
     get_paginated_collection,
 )
+from cvat.apps.events.handlers import handle_annotations_change
 
 
 class _DbTestBase(ApiTestBase):
@@ -444,6 +449,146 @@ class TaskExportTest(_DbTestBase):
                     outside_count += 1
         self.assertEqual(0, outside_count)
 
+    def test_can_group_by_frame_in_windows(self):
+        images = self._generate_task_images(5)
+        task = self._generate_task(images)
+        self._generate_annotations(task)
+        task_ann = TaskAnnotation(task["id"])
+        task_ann.init_from_db()
+        task_data = TaskData(task_ann.ir_data, Task.objects.get(pk=task["id"]))
+
+        self.assertEqual(
+            list(task_data.group_by_frame(include_empty=True)),
+            list(task_data.group_by_frame(include_empty=True, window_size=2)),
+        )
+
+    def test_can_interpolate_tracks_in_windows(self):
+        images = self._generate_task_images(5)
+        task = self._generate_task(images)
+        self._generate_annotations(task)
+
+        def get_tracks(window_size):
+            task_ann = TaskAnnotation(task["id"])
+            task_ann.init_from_db()
+            task_data = TaskData(task_ann.ir_data, Task.objects.get(pk=task["id"]))
+
+            def read_tracks(tracks):
+                return [
+                    track._replace(shapes=list(track.shapes), elements=read_tracks(track.elements))
+                    for track in tracks
+                ]
+
+            return read_tracks(task_data.iterate_tracks(window_size=window_size))
+
+        tracks = get_tracks(window_size=None)
+        self.assertTrue(any(track.shapes for track in tracks))
+        self.assertEqual(tracks, get_tracks(window_size=2))
+
+    def test_can_reuse_media_in_repeated_exports(self):
+        images = self._generate_task_images(3)
+        task = self._generate_task(images)
+        self._generate_annotations(task)
+
+        exported_files = []
+
+        def check(file_path):
+            with zipfile.ZipFile(file_path) as archive:
+                exported_files.append({name: archive.read(name) for name in archive.namelist()})
+
+        for _ in range(2):
+            self._test_export(check, task, "CVAT for images 1.1", save_images=True)
+
+        self.assertEqual(exported_files[0], exported_files[1])
+        self.assertEqual(3, len([name for name in exported_files[0] if name.startswith("images/")]))
+
+    def test_can_group_project_frames_in_windows(self):
+        with ForceLogin(self.user, self.client):
+            response = self.client.post(
+                "/api/projects",
+                data={
+                    "name": "my project",
+                    "labels": [
+                        {
+                            "name": "car",
+                            "attributes": [
+                                {
+                                    "name": "model",
+                                    "mutable": False,
+                                    "input_type": "select",
+                                    "default_value": "mazda",
+                                    "values": ["bmw", "mazda", "renault"],
+                                },
+                                {
+                                    "name": "parked",
+                                    "mutable": True,
+                                    "input_type": "checkbox",
+                                    "default_value": "false",
+                                    "values": [],
+                                },
+                            ],
+                        },
+                        {"name": "person"},
+                    ],
+                },
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            project_id = response.data["id"]
+
+        for subset in ["Train", "Validation"]:
+            task = self._create_task(
+                {"name": f"{subset} task", "project_id": project_id, "subset": subset},
+                self._generate_task_images(5),
+            )
+            self._generate_annotations(task)
+
+        project_ann = ProjectAnnotationAndData(project_id)
+        project_ann.init_from_db()
+        project_data = ProjectData(
+            annotation_irs=project_ann.annotation_irs,
+            db_project=Project.objects.get(pk=project_id),
+        )
+
+        self.assertEqual(
+            list(project_data.group_by_frame(include_empty=True)),
+            list(project_data.group_by_frame(include_empty=True, window_size=2)),
+        )
+
+    def test_can_include_archives_with_same_file_names(self):
+        def make_archive(files):
+            archive_file = BytesIO()
+            with zipfile.ZipFile(archive_file, "w") as archive:
+                for name, data in files.items():
+                    archive.writestr(name, data)
+            archive_file.seek(0)
+            return archive_file
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(osp.join(temp_dir, "annotations.xml"), "w") as f:
+                f.write("<annotations />")
+
+            result_file = BytesIO()
+            make_zip_archive(
+                temp_dir,
+                result_file,
+                included_archives=[
+                    (make_archive({"a.jpg": b"a1", "b.jpg": b"b1"}), "images/Train"),
+                    (make_archive({"a.jpg": b"a2"}), "images/Train"),
+                    (make_archive({"a.jpg": b"a3"}), "images/Validation"),
+                ],
+            )
+
+        with zipfile.ZipFile(result_file) as result_archive:
+            self.assertEqual(
+                {
+                    "annotations.xml": b"<annotations />",
+                    "images/Train/a.jpg": b"a2",
+                    "images/Train/b.jpg": b"b1",
+                    "images/Validation/a.jpg": b"a3",
+                },
+                {name: result_archive.read(name) for name in result_archive.namelist()},
+            )
+
     def test_cant_make_rel_frame_id_from_unknown(self):
         images = self._generate_task_images(3)
         images["frame_filter"] = "step=2"
@@ -594,6 +739,55 @@ class TaskExportTest(_DbTestBase):
 
         assert len(dm_dataset.get("image_3").annotations) == 0
 
+    def test_can_count_updated_track_shapes_with_known_previous_tracks(self):
+        images = self._generate_task_images(5)
+        task = self._generate_task(images)
+        self._generate_annotations(task)
+        db_job = Job.objects.get(segment__task_id=task["id"])
+
+        job_ann = JobAnnotation(db_job.id)
+        job_ann.init_from_db()
+        previous_tracks = deepcopy(job_ann.data["tracks"])
+
+        updated_annotations = {"version": 0, "tags": [], "shapes": [], "tracks": []}
+        for track in deepcopy(job_ann.data["tracks"]):
+            track["shapes"][-1]["outside"] = not track["shapes"][-1]["outside"]
+            updated_annotations["tracks"].append(track)
+
+        def get_track_events(**kwargs):
+            with mock.patch("cvat.apps.events.handlers.record_server_event") as record_server_event:
+                handle_annotations_change(db_job, updated_annotations, "update", **kwargs)
+
+            return [
+                call.kwargs["payload"]["tracks"]
+                for call in record_server_event.call_args_list
+                if "tracks" in call.kwargs["payload"]
+            ]
+
+        db_track_events = get_track_events()
+        self.assertTrue(
+            any(
+                track["visible_shapes_count_diff"] for tracks in db_track_events for track in tracks
+            )
+        )
+        self.assertEqual(db_track_events, get_track_events(previous_tracks=previous_tracks))
+
+    def test_can_update_job_without_tracks_without_reading_snapshot(self):
+        images = self._generate_task_images(5)
+        task = self._generate_task(images)
+        self._generate_annotations(task)
+        db_job = Job.objects.get(segment__task_id=task["id"])
+
+        job_ann = JobAnnotation(db_job.id)
+        job_ann.init_from_db()
+        updated_annotations = deepcopy(job_ann.data)
+        updated_annotations["tracks"] = []
+
+        with mock.patch.object(JobAnnotation, "_get_cached_snapshot") as get_cached_snapshot:
+            JobAnnotation(db_job.id).update(updated_annotations)
+
+        get_cached_snapshot.assert_not_called()
+
 
 class FrameMatchingTest(_DbTestBase):
     def _generate_task_images(self, paths):  # pylint: disable=no-self-use
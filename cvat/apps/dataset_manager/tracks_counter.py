@@ -3,7 +3,7 @@
 # SPDX-License-Identifier: MIT
 
 from collections import defaultdict
-from typing import Callable, Dict, TypedDict
+from typing import Callable, Dict, Optional, TypedDict
 
 from cvat.apps.engine.models import Job, LabeledTrack, ShapeType
 from cvat.apps.engine.utils import defaultdict_to_regular
@@ -167,7 +167,13 @@ class TracksCounter:
         self._tracks_per_job = defaultdict_to_regular(tracks_per_job)
         self._init_stop_frames()
 
-    def load_tracks_from_job(self, job_id: int, job_tracks: list):
+    def load_tracks_from_job(
+        self, job_id: int, job_tracks: list, *, stop_frame: Optional[int] = None
+    ):
+        """
+        stop_frame: the stop frame of the job. If not specified, it is read from the DB.
+        """
+
         transformed_tracks = {}
         for track in job_tracks:
             if not track.get("shapes", []) and not track.get("elements", []):
@@ -209,5 +215,8 @@ class TracksCounter:
                     ),
                 }
 
-            self._tracks_per_job = {job_id: transformed_tracks}
+        self._tracks_per_job = {job_id: transformed_tracks}
+        if stop_frame is None:
             self._init_stop_frames()
+        else:
+            self._stop_frames_per_job = {job_id: stop_frame}
@@ -7,15 +7,16 @@ import inspect
 import os
 import os.path as osp
 import re
+import shutil
 import tempfile
 import zipfile
 from collections.abc import Generator, Iterable
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 from copy import deepcopy
 from datetime import timedelta
 from enum import Enum
 from threading import Lock
-from typing import Any, Protocol
+from typing import IO, Any, Protocol
 from uuid import UUID
 
 import attrs
@@ -30,12 +31,75 @@ def current_function_name(depth=1):
     return inspect.getouterframes(inspect.currentframe())[depth].function
 
 
-def make_zip_archive(src_path, dst_path):
-    with zipfile.ZipFile(dst_path, "w") as archive:
+def make_zip_archive(src_path, dst_path, *, included_archives: Iterable[tuple[IO, str]] = ()):
+    """
+    included_archives: (zip file, directory in the resulting archive) pairs.
+        The members of these archives are copied into the resulting archive as is.
+        If several members get the same path, only the last one is kept,
+        as if the archives were extracted into the same directory.
+    """
+    with ExitStack() as es, zipfile.ZipFile(dst_path, "w") as archive:
+        written_paths = set()
         for dirpath, _, filenames in os.walk(src_path):
             for name in filenames:
                 path = osp.join(dirpath, name)
                 archive.write(path, osp.relpath(path, src_path))
+                written_paths.add(osp.relpath(path, src_path))
+
+        src_archives = [
+            (es.enter_context(zipfile.ZipFile(included_archive)), dst_dir)
+            for included_archive, dst_dir in included_archives
+        ]
+
+        copied_members: dict[str, zipfile.ZipInfo] = {}
+        for src_archive, dst_dir in src_archives:
+            for src_info in src_archive.infolist():
+                dst_path = _get_copied_member_path(src_info, dst_dir)
+                if dst_path not in written_paths:
+                    copied_members[dst_path] = src_info
+
+        for src_archive, dst_dir in src_archives:
+            copy_zip_archive_members(
+                src_archive,
+                archive,
+                dst_dir,
+                members=[
+                    src_info
+                    for src_info in src_archive.infolist()
+                    if copied_members.get(_get_copied_member_path(src_info, dst_dir)) is src_info
+                ],
+            )
+
+
+def _get_copied_member_path(src_info: zipfile.ZipInfo, dst_dir: str) -> str:
+    return osp.join(dst_dir, src_info.filename) if dst_dir else src_info.filename
+
+
+def copy_zip_archive_members(
+    src_archive: zipfile.ZipFile,
+    dst_archive: zipfile.ZipFile,
+    dst_dir: str = "",
+    *,
+    members: Iterable[zipfile.ZipInfo] | None = None,
+):
+    """
+    members: the members to copy, all the members by default
+    """
+
+    # Stored (uncompressed) members are copied without any compression work
+    for src_info in src_archive.infolist() if members is None else members:
+        if src_info.is_dir():
+            continue
+
+        dst_info = zipfile.ZipInfo(
+            _get_copied_member_path(src_info, dst_dir), date_time=src_info.date_time
+        )
+        dst_info.compress_type = src_info.compress_type
+        dst_info.external_attr = src_info.external_attr
+        dst_info.file_size = src_info.file_size
+
+        with src_archive.open(src_info) as src, dst_archive.open(dst_info, "w") as dst:
+            shutil.copyfileobj(src, dst, length=1024 * 1024)
 
 
 def faster_deepcopy(v):
@@ -119,6 +183,7 @@ class ExportFileType(str, Enum):
     BACKUP = "backup"
     DATASET = "dataset"
     EVENTS = "events"
+    MEDIA = "media"
 
     @classmethod
     def values(cls) -> list[str]:
@@ -265,6 +330,26 @@ class ExportCacheManager:
 
         return osp.join(cls.ROOT, filename)
 
+    @classmethod
+    def make_media_file_path(
+        cls,
+        *,
+        instance_type: str,
+        instance_id: int,
+        instance_timestamp: float,
+        media_id: str,
+    ) -> str:
+        instance_type = InstanceType(instance_type.lower())
+        filename = cls.FILE_NAME_TEMPLATE_WITH_INSTANCE.format(
+            instance_type=instance_type,
+            instance_id=instance_id,
+            file_type=ExportFileType.MEDIA,
+            instance_timestamp=instance_timestamp,
+            optional_suffix=cls.SPLITTER + media_id,
+            file_ext="zip",
+        )
+        return osp.join(cls.ROOT, filename)
+
     @classmethod
     def make_backup_file_path(
         cls,
@@ -331,8 +416,12 @@ class ExportCacheManager:
             unparsed = fragments.pop("unparsed")[len(cls.INSTANCE_PREFIX) :]
             instance_timestamp = unparsed
 
-            if fragments["file_type"] in (ExportFileType.DATASET, ExportFileType.ANNOTATIONS):
-                # The "format" is a part of file id, but there is actually
+            if fragments["file_type"] in (
+                ExportFileType.DATASET,
+                ExportFileType.ANNOTATIONS,
+                ExportFileType.MEDIA,
+            ):
+                # The "format" (or the media id) is a part of file id, but there is actually
                 # no need to use it after filename parsing, so just drop it.
                 instance_timestamp, _ = unparsed.split(cls.SPLITTER, maxsplit=1)
 
@@ -22,6 +22,7 @@ from cvat.apps.engine.log import ServerLogManager
 from cvat.apps.engine.models import Job, Project, Task
 from cvat.apps.engine.rq import ExportRQMeta
 from cvat.apps.engine.utils import get_rq_lock_by_user
+from cvat.apps.redis_handler.indexes import RequestIndex
 
 from .formats.registry import EXPORT_FORMATS, IMPORT_FORMATS
 from .util import (
@@ -115,6 +116,11 @@ def retry_current_rq_job(time_delta: timedelta) -> rq.job.Job:
             )
             _patch_scheduled_job_status(scheduled_rq_job)
 
+            # the job is recreated with a new creation time, so the index must be updated
+            RequestIndex(django_rq.get_queue(settings.CVAT_QUEUES.EXPORT_DATA.value)).add(
+                scheduled_rq_job
+            )
+
     current_rq_job.retries_left = 1
     setattr(current_rq_job, "retry", _patched_retry)
     return current_rq_job
@@ -0,0 +1,208 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.util.retry import Retry
+
+from cvat.utils.http import make_requests_session
+
+
+class DataUpClient:
+    """
+    A client for the DataUP backend, shared by all the requests in the process.
+
+    Each thread uses its own session, and the connections of all the sessions are kept alive
+    in a shared pool. Failed idempotent requests are retried with exponential backoff.
+    GET responses with an ETag are cached, and a copy of the cached response is returned
+    when the backend reports that it was not modified.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        timeout: tuple[float, float],
+        max_retries: int,
+        backoff_factor: float,
+        pool_size: int,
+        response_cache_size: int,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self._timeout = timeout
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,
+        )
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self._local = threading.local()
+
+        self._response_cache_size = response_cache_size
+        # key -> (ETag, headers, content) of the cached response
+        self._responses: OrderedDict[str, tuple[str, dict[str, str], bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        json: Optional[dict] = None,
+    ) -> requests.Response:
+        if not url.startswith(("http://", "https://")):
+            url = f"{self.base_url}/{url.lstrip('/')}"
+
+        method = method.upper()
+        headers = dict(headers or {})
+
+        cache_key = None
+        cached_item = None
+        if method == "GET" and 0 < self._response_cache_size:
+            cache_key = self._make_response_cache_key(url, params, headers)
+            cached_item = self._get_cached_response(cache_key)
+            if cached_item:
+                headers["If-None-Match"] = cached_item[0]
+
+        response = self._get_session().request(
+            method, url, params=params, headers=headers, json=json, timeout=self._timeout
+        )
+
+        if cache_key:
+            if response.status_code == 304 and cached_item:
+                return self._make_cached_response(response, cached_item)
+
+            if response.status_code == 200 and (etag := response.headers.get("ETag")):
+                self._set_cached_response(
+                    cache_key, (etag, dict(response.headers), response.content)
+                )
+
+        return response
+
+    def _get_session(self) -> requests.Session:
+        # requests.Session is not guaranteed to be thread-safe, so each thread has its own session.
+        # The sessions use the same adapter, so the connections are still pooled together.
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = make_requests_session()
+            session.mount("http://", self._adapter)
+            session.mount("https://", self._adapter)
+            self._local.session = session
+
+        return session
+
+    @staticmethod
+    def _make_response_cache_key(url: str, params: Optional[dict], headers: dict) -> str:
+        # responses depend on the API key and the organization, which are passed in headers
+        key_data = json.dumps([url, params, headers], sort_keys=True, default=str)
+        return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _make_cached_response(
+        not_modified_response: requests.Response, cached_item: tuple[str, dict[str, str], bytes]
+    ) -> requests.Response:
+        # Each caller gets its own response object, so the callers can't affect each other
+        _, headers, content = cached_item
+
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = content
+        response._content_consumed = True
+        response.url = not_modified_response.url
+        response.request = not_modified_response.request
+        response.elapsed = not_modified_response.elapsed
+        return response
+
+    def _get_cached_response(self, key: str) -> Optional[tuple[str, dict[str, str], bytes]]:
+        with self._lock:
+            cached_item = self._responses.get(key)
+            if cached_item:
+                self._responses.move_to_end(key)
+
+            return cached_item
+
+    def _set_cached_response(self, key: str, item: tuple[str, dict[str, str], bytes]) -> None:
+        with self._lock:
+            self._responses.pop(key, None)
+            while self._responses and self._response_cache_size <= len(self._responses):
+                self._responses.popitem(last=False)
+
+            self._responses[key] = item
+
+
+_client: Optional[DataUpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_dataup_client() -> DataUpClient:
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = DataUpClient(
+                    settings.DATAUP_BASE_URL,
+                    timeout=(settings.DATAUP_CONNECT_TIMEOUT, settings.DATAUP_READ_TIMEOUT),
+                    max_retries=settings.DATAUP_MAX_RETRIES,
+                    backoff_factor=settings.DATAUP_RETRY_BACKOFF_FACTOR,
+                    pool_size=settings.DATAUP_CONNECTION_POOL_SIZE,
+                    response_cache_size=settings.DATAUP_RESPONSE_CACHE_MAX_SIZE,
+                )
+
+    return _client
+
+
+_API_KEYS_CACHE_VERSION_KEY = "dataup:api-keys:version"
+
+
+def _get_api_keys_cache_version() -> int:
+    return cache.get_or_set(_API_KEYS_CACHE_VERSION_KEY, 1, timeout=None)
+
+
+def get_cached_api_key(
+    user_id: int, org_id: Optional[int], role: str, resolve: Callable[[], Optional[str]]
+) -> Optional[str]:
+    """
+    Returns the API key resolved for the user in the organization with the role.
+    The keys are cached in the shared cache, so the key selection queries are not repeated
+    for each request. Any change of the API keys invalidates all the cached keys.
+    """
+    if settings.DATAUP_API_KEY_CACHE_TTL <= 0:
+        return resolve()
+
+    key = f"dataup:api-key:{user_id}:{org_id}:{role}"
+    version = _get_api_keys_cache_version()
+
+    api_key = cache.get(key, version=version)
+    if api_key is None:
+        api_key = resolve()
+        if api_key:
+            cache.set(key, api_key, timeout=settings.DATAUP_API_KEY_CACHE_TTL, version=version)
+
+    return api_key
+
+
+def invalidate_api_keys_cache(*args, **kwargs) -> None:
+    try:
+        cache.incr(_API_KEYS_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(_API_KEYS_CACHE_VERSION_KEY, 2, timeout=None)
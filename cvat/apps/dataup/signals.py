@@ -1,6 +1,8 @@
+from cvat.apps.dataup.api_keys.models import DataUpAPIKey
+from cvat.apps.dataup.client import invalidate_api_keys_cache
 from cvat.apps.dataup.models import DataUpUser, DataUpOrganization
 from cvat.apps.organizations.models import Organization
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import User
 
@@ -30,4 +32,13 @@ def save_dataup_user(sender, instance, **kwargs):
 @receiver(post_save, sender=Organization)
 def create_dataup_organization(sender, instance, created, **kwargs):
     if created and not hasattr(instance, 'dataup'):
-        DataUpOrganization.objects.create(organization=instance)
\ No newline at end of file
+        DataUpOrganization.objects.create(organization=instance)
+
+
+@receiver(post_save, sender=DataUpAPIKey)
+@receiver(post_delete, sender=DataUpAPIKey)
+def invalidate_dataup_api_keys(sender, **kwargs):
+    """
+    Signal to drop the cached API keys, as any key change can affect the key selection.
+    """
+    invalidate_api_keys_cache()
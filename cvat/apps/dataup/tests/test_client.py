@@ -0,0 +1,204 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase, mock
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import override_settings
+
+from cvat.apps.dataup import client
+from cvat.apps.dataup.client import DataUpClient
+
+
+class _DataUpServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _DataUpRequestHandler)
+        self.lock = threading.Lock()
+        self.requests: list[tuple[str, str, dict[str, str]]] = []
+        self.failures_left = 0
+        self.etag = '"v1"'
+        self.content = b'{"value": 1}'
+
+
+class _DataUpRequestHandler(BaseHTTPRequestHandler):
+    server: _DataUpServer
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        with self.server.lock:
+            self.server.requests.append((self.command, self.path, dict(self.headers)))
+
+            if 0 < self.server.failures_left:
+                self.server.failures_left -= 1
+                self._send(HTTPStatus.SERVICE_UNAVAILABLE)
+            elif self.headers.get("If-None-Match") == self.server.etag:
+                self._send(HTTPStatus.NOT_MODIFIED)
+            else:
+                self._send(HTTPStatus.OK, self.server.content, etag=self.server.etag)
+
+    def _send(self, status: HTTPStatus, content: bytes = b"", *, etag: str | None = None):
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class TestDataUpClient(TestCase):
+    def setUp(self):
+        self.server = _DataUpServer()
+        server_thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        server_thread.start()
+
+        def _stop_server():
+            self.server.shutdown()
+            self.server.server_close()
+            server_thread.join()
+
+        self.addCleanup(_stop_server)
+
+        self.client = DataUpClient(
+            f"http://127.0.0.1:{self.server.server_port}",
+            timeout=(5, 5),
+            max_retries=2,
+            backoff_factor=0,
+            pool_size=2,
+            response_cache_size=10,
+        )
+
+    def test_can_retry_failed_get_requests(self):
+        self.server.failures_left = 2
+
+        response = self.client.request("GET", "api/v1/items")
+
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_can_return_failed_response_after_retries(self):
+        self.server.failures_left = 3
+
+        response = self.client.request("GET", "api/v1/items")
+
+        self.assertEqual(response.status_code, HTTPStatus.SERVICE_UNAVAILABLE)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_does_not_retry_post_requests(self):
+        self.server.failures_left = 1
+
+        response = self.client.request("POST", "api/v1/items", json={})
+
+        self.assertEqual(response.status_code, HTTPStatus.SERVICE_UNAVAILABLE)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_can_use_cached_response_when_not_modified(self):
+        first_response = self.client.request("GET", "api/v1/items")
+        second_response = self.client.request("GET", "api/v1/items")
+
+        self.assertEqual(self.server.requests[1][2].get("If-None-Match"), '"v1"')
+        self.assertEqual(second_response.status_code, HTTPStatus.OK)
+        self.assertEqual(second_response.json(), {"value": 1})
+        self.assertEqual(second_response.headers["ETag"], '"v1"')
+        self.assertIsNot(second_response, first_response)
+
+    def test_callers_get_separate_cached_responses(self):
+        self.client.request("GET", "api/v1/items")
+        first_response = self.client.request("GET", "api/v1/items")
+        first_response.headers["ETag"] = "changed"
+        first_response.status_code = HTTPStatus.BAD_REQUEST
+
+        second_response = self.client.request("GET", "api/v1/items")
+
+        self.assertIsNot(second_response, first_response)
+        self.assertEqual(second_response.status_code, HTTPStatus.OK)
+        self.assertEqual(second_response.headers["ETag"], '"v1"')
+        self.assertEqual(second_response.content, b'{"value": 1}')
+
+    def test_can_update_cached_response_when_modified(self):
+        self.client.request("GET", "api/v1/items")
+        self.server.etag = '"v2"'
+        self.server.content = b'{"value": 2}'
+
+        self.client.request("GET", "api/v1/items")
+        response = self.client.request("GET", "api/v1/items")
+
+        self.assertEqual(self.server.requests[2][2].get("If-None-Match"), '"v2"')
+        self.assertEqual(response.json(), {"value": 2})
+
+    def test_does_not_share_cached_responses_between_api_keys(self):
+        self.client.request("GET", "api/v1/items", headers={"X-API-Key": "a"})
+        self.client.request("GET", "api/v1/items", headers={"X-API-Key": "b"})
+
+        self.assertNotIn("If-None-Match", self.server.requests[1][2])
+
+
+class TestApiKeyCache(TestCase):
+    def setUp(self):
+        settings_override = override_settings(DATAUP_API_KEY_CACHE_TTL=60)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        # the local memory caches with the same name share the data
+        test_cache = LocMemCache("dataup-tests", {})
+        self.addCleanup(test_cache.clear)
+
+        patcher = mock.patch.object(client, "cache", test_cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_can_cache_api_keys(self):
+        resolve = mock.Mock(return_value="key")
+
+        api_keys = [client.get_cached_api_key(1, 2, "worker", resolve) for _ in range(2)]
+
+        self.assertEqual(api_keys, ["key", "key"])
+        resolve.assert_called_once()
+
+    def test_can_invalidate_cached_api_keys(self):
+        client.get_cached_api_key(1, 2, "worker", mock.Mock(return_value="old key"))
+
+        client.invalidate_api_keys_cache()
+        api_key = client.get_cached_api_key(1, 2, "worker", mock.Mock(return_value="new key"))
+
+        self.assertEqual(api_key, "new key")
+
+    def test_can_invalidate_cached_api_keys_after_version_is_lost(self):
+        client.get_cached_api_key(1, 2, "worker", mock.Mock(return_value="old key"))
+        client.cache.delete(client._API_KEYS_CACHE_VERSION_KEY)
+
+        client.invalidate_api_keys_cache()
+        api_key = client.get_cached_api_key(1, 2, "worker", mock.Mock(return_value="new key"))
+
+        self.assertEqual(api_key, "new key")
+
+    def test_does_not_cache_missing_api_keys(self):
+        client.get_cached_api_key(1, 2, "worker", mock.Mock(return_value=None))
+
+        api_key = client.get_cached_api_key(1, 2, "worker", mock.Mock(return_value="key"))
+
+        self.assertEqual(api_key, "key")
+
+    @override_settings(DATAUP_API_KEY_CACHE_TTL=0)
+    def test_can_disable_api_key_cache(self):
+        resolve = mock.Mock(return_value="key")
+
+        for _ in range(2):
+            client.get_cached_api_key(1, 2, "worker", resolve)
+
+        self.assertEqual(resolve.call_count, 2)
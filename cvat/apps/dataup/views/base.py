@@ -5,6 +5,7 @@ from rest_framework.permissions import IsAuthenticated
 import requests
 from cvat.apps.engine.log import ServerLogManager
 from cvat.apps.dataup.api_keys.models import DataUpAPIKey
+from cvat.apps.dataup.client import get_cached_api_key, get_dataup_client
 
 
 slogger = ServerLogManager(__name__)
@@ -20,7 +21,20 @@ class DataUpBaseViewSet(viewsets.ModelViewSet):
         """
         organization = request.iam_context.get("organization")
         user = request.user
+        role = getattr(request.iam_context.get("membership", {}), "role", "")
 
+        api_key = get_cached_api_key(
+            user.id,
+            getattr(organization, "id", None),
+            role,
+            lambda: self._resolve_api_key(user, organization, role),
+        )
+
+        if not api_key:
+            raise Exception("No API key found for this organization's DataUp service.")
+        return api_key
+
+    def _resolve_api_key(self, user, organization, role):
         # Get DataUp user and organization UUIDs
         try:
             from cvat.apps.dataup.models import DataUpUser
@@ -39,12 +53,10 @@ class DataUpBaseViewSet(viewsets.ModelViewSet):
         api_key = DataUpAPIKey.get_api_key(
             user_uuid=dataup_user.id,
             org_uuid=org_uuid,
-            role=getattr(request.iam_context.get("membership", {}), "role", "")
+            role=role
         )
 
-        if not api_key:
-            raise Exception("No API key found for this organization's DataUp service.")
-        return api_key.key
+        return api_key.key if api_key else None
 
     def get_headers(self):
         """
@@ -125,12 +137,11 @@ class DataUpBaseViewSet(viewsets.ModelViewSet):
         url = f"{settings.DATAUP_BASE_URL}/api/{version}/{endpoint}"
         headers = self.get_headers()
 
-        request_method = getattr(requests, method.lower(), None)
-        if not request_method:
+        if method.upper() not in ("GET", "POST", "PUT", "PATCH", "DELETE"):
             return Response({"error": f"Unsupported HTTP method: {method}"}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            response = request_method(url, json=data, params=params, headers=headers)
+            response = get_dataup_client().request(method, url, json=data, params=params, headers=headers)
             return self.handle_dataup_response(response, success_status)
 
         except requests.exceptions.RequestException as e:
@@ -8,7 +8,8 @@ from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 from django.conf import settings
-import requests
+
+from cvat.apps.dataup.client import get_dataup_client
 
 class HealthViewSet(viewsets.ViewSet):
     # Simple ViewSet without authentication or model requirements
@@ -44,7 +45,7 @@ class HealthViewSet(viewsets.ViewSet):
 
             url = f"{settings.DATAUP_BASE_URL}/healthz/orgs/{organization_uuid}"
             print("Sending health request using url", url)
-            response = requests.get(url)
+            response = get_dataup_client().request("GET", url)
             print(response)
             return Response(
                 response.json(),
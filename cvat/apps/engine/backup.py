@@ -189,7 +189,7 @@ class _BackupBase():
 class _TaskBackupBase(_BackupBase):
     MANIFEST_FILENAME = 'task.json'
     MEDIA_MANIFEST_FILENAME = 'manifest.jsonl'
-    MEDIA_MANIFEST_INDEX_FILENAME = 'index.json'
+    MEDIA_MANIFEST_INDEX_FILENAMES = ('index.bin', 'index.json')
     ANNOTATIONS_FILENAME = 'annotations.json'
     DATA_DIRNAME = 'data'
     TASK_DIRNAME = 'task'
@@ -398,7 +398,7 @@ class TaskExporter(_ExporterBase, _TaskBackupBase):
                 source_dir=data_dir,
                 zip_object=zip_object,
                 target_dir=target_data_dir,
-                exclude_files=[self.MEDIA_MANIFEST_INDEX_FILENAME]
+                exclude_files=self.MEDIA_MANIFEST_INDEX_FILENAMES
             )
         elif self._db_data.storage == StorageChoice.SHARE:
             data_dir = settings.SHARE_ROOT
@@ -802,7 +802,10 @@ class TaskImporter(_ImporterBase, _TaskBackupBase):
 
         self._prepare_data_meta(data)
 
-        excluded_input_files = [os.path.join(self.DATA_DIRNAME, self.MEDIA_MANIFEST_INDEX_FILENAME)]
+        excluded_input_files = [
+            os.path.join(self.DATA_DIRNAME, filename)
+            for filename in self.MEDIA_MANIFEST_INDEX_FILENAMES
+        ]
 
         job_file_mapping = None
         if data.pop('custom_segments', False):
@@ -9,13 +9,16 @@ import io
 import os
 import os.path
 import pickle  # nosec
+import struct
 import tempfile
+import threading
 import time
 import zipfile
 import zlib
+from collections import OrderedDict
 from collections.abc import Collection, Generator, Iterator, Sequence
 from contextlib import ExitStack, closing
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from itertools import groupby, pairwise
 from typing import Any, Callable, Optional, Union, overload
 
@@ -28,9 +31,10 @@ import PIL.ImageOps
 import rq
 from django.conf import settings
 from django.core.cache import caches
+from django.core.cache.backends.redis import RedisSerializer
 from django.db import models as django_models
 from django.utils import timezone as django_tz
-from redis.exceptions import LockError
+from redis.exceptions import LockError, WatchError
 from rest_framework.exceptions import NotFound, ValidationError
 from rq.job import JobStatus as RQJobStatus
 
@@ -54,7 +58,7 @@ from cvat.apps.engine.media_extractors import (
     load_image,
 )
 from cvat.apps.engine.model_utils import is_field_cached
-from cvat.apps.engine.rq import RQMetaWithFailureInfo
+from cvat.apps.engine.rq import RQJobMetaField, RQMetaWithFailureInfo
 from cvat.apps.engine.utils import (
     CvatChunkTimestampMismatchError,
     format_list,
@@ -74,6 +78,59 @@ class CacheTooLargeDataError(Exception):
     pass
 
 
+class MediaCacheSerializer(RedisSerializer):
+    """
+    Stores media cache items as a small binary header, followed by the raw item data.
+
+    Unlike pickled items, such items don't require the data to be copied
+    for serialization and deserialization. Other values, including the media cache items
+    stored in the previous (pickled) format, are handled as in the default serializer.
+    """
+
+    _MAGIC = b"CVATMC\x00\x01"
+
+    # magic, data checksum, timestamp in microseconds (or -1), mime type length
+    _HEADER = struct.Struct("<8sIqH")
+
+    _EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    def dumps(self, obj):
+        if not (isinstance(obj, tuple) and len(obj) == 4 and isinstance(obj[0], io.BytesIO)):
+            return super().dumps(obj)
+
+        data, mime, checksum, timestamp = obj
+        encoded_mime = mime.encode()
+        encoded_timestamp = (
+            (timestamp - self._EPOCH) // timedelta(microseconds=1) if timestamp else -1
+        )
+
+        return b"".join(
+            (
+                self._HEADER.pack(self._MAGIC, checksum, encoded_timestamp, len(encoded_mime)),
+                encoded_mime,
+                data.getvalue(),
+            )
+        )
+
+    def loads(self, data):
+        if not data[: len(self._MAGIC)] == self._MAGIC:
+            return super().loads(data)
+
+        _, checksum, encoded_timestamp, mime_length = self._HEADER.unpack_from(data)
+        mime_offset = self._HEADER.size
+        data_offset = mime_offset + mime_length
+
+        mime = data[mime_offset:data_offset].decode()
+        timestamp = (
+            self._EPOCH + timedelta(microseconds=encoded_timestamp)
+            if encoded_timestamp != -1
+            else None
+        )
+
+        # BytesIO makes the only copy of the data here, later getvalue() calls return it as is
+        return (io.BytesIO(memoryview(data)[data_offset:]), mime, checksum, timestamp)
+
+
 def enqueue_create_chunk_job(
     queue: rq.Queue,
     rq_job_id: str,
@@ -99,12 +156,70 @@ def enqueue_create_chunk_job(
                     result_ttl=rq_job_result_ttl,
                     failure_ttl=rq_job_failure_ttl,
                 )
+            elif (
+                rq_job.meta.get(RQJobMetaField.PREFETCH)
+                and rq_job.get_status(refresh=False) == RQJobStatus.QUEUED
+            ):
+                # The chunk is requested before it was prefetched, so it's prepared first
+                _move_queued_job_to_front(queue, rq_job_id)
     except LockError:
         raise TimeoutError(f"Cannot acquire lock for {rq_job_id}")
 
     return rq_job
 
 
+def enqueue_prefetch_chunk_job(
+    queue: rq.Queue,
+    rq_job_id: str,
+    create_callback: Callback,
+    *,
+    rq_job_result_ttl: int = 60,
+    rq_job_failure_ttl: int = 3600,
+) -> Optional[rq.job.Job]:
+    """
+    Enqueues a low-priority job at the end of the queue. Unlike enqueue_create_chunk_job(),
+    it doesn't wait for the job lock and doesn't reuse existing jobs: None is returned
+    if the job can't be enqueued now. If the chunk is requested explicitly while the job
+    is still queued, the job is moved to the front of the queue.
+    """
+    try:
+        with get_rq_lock_for_job(queue, rq_job_id, blocking_timeout=0):
+            rq_job = queue.fetch_job(rq_job_id)
+            if rq_job and rq_job.get_status(refresh=False) not in {
+                RQJobStatus.FINISHED,
+                RQJobStatus.FAILED,
+                RQJobStatus.CANCELED,
+            }:
+                return None
+
+            return queue.enqueue(
+                create_callback,
+                job_id=rq_job_id,
+                result_ttl=rq_job_result_ttl,
+                failure_ttl=rq_job_failure_ttl,
+                meta={RQJobMetaField.PREFETCH: True},
+            )
+    except LockError:
+        return None
+
+
+def _move_queued_job_to_front(queue: rq.Queue, rq_job_id: str) -> None:
+    with queue.connection.pipeline() as pipe:
+        try:
+            pipe.watch(queue.key)
+            if pipe.lpos(queue.key, rq_job_id) is None:
+                return
+
+            pipe.multi()
+            queue.remove(rq_job_id, pipeline=pipe)
+            queue.push_job_id(rq_job_id, pipeline=pipe, at_front=True)
+            pipe.execute()
+        except WatchError:
+            # The queue was changed, the job could be started already.
+            # It will be processed in the usual order otherwise.
+            pass
+
+
 def wait_for_rq_job(rq_job: rq.job.Job):
     retries = settings.CVAT_CHUNK_CREATE_TIMEOUT // settings.CVAT_CHUNK_CREATE_CHECK_INTERVAL or 1
     while retries > 0:
@@ -170,23 +285,156 @@ class Callback:
         return self._callable(*self._args, **self._kwargs)
 
 
+class LocalMediaCache:
+    """
+    A process-local LRU cache for media cache items.
+
+    The cache is limited by the total size of the stored data and by the item lifetime.
+    It is supposed to be used in front of the shared media cache, so the items
+    are expected to be validated before they are put here.
+    """
+
+    def __init__(self, *, max_size: int, ttl: float):
+        self._max_size = max_size
+        self._ttl = ttl
+
+        self._items: OrderedDict[str, tuple[bytes, str, int, Optional[datetime], float]] = (
+            OrderedDict()
+        )
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str) -> Optional[_CacheItem]:
+        with self._lock:
+            local_item = self._items.get(key)
+            if local_item is None:
+                self.misses += 1
+                return None
+
+            data, mime, checksum, timestamp, expires_at = local_item
+            if expires_at <= time.monotonic():
+                self._pop(key)
+                self.misses += 1
+                return None
+
+            self._items.move_to_end(key)
+            self.hits += 1
+
+        # The item data is shared between the readers, so each reader gets its own buffer.
+        # BytesIO doesn't copy the initial bytes until the buffer is modified.
+        return (io.BytesIO(data), mime, checksum, timestamp)
+
+    def contains(self, key: str) -> bool:
+        "Checks for a valid item without affecting the stats and the eviction order"
+        with self._lock:
+            local_item = self._items.get(key)
+            return local_item is not None and time.monotonic() < local_item[4]
+
+    def set(self, key: str, item: _CacheItem) -> None:
+        data = item[0].getvalue() if isinstance(item[0], io.BytesIO) else bytes(item[0])
+        if self._max_size < len(data):
+            self.delete(key)
+            return
+
+        with self._lock:
+            self._pop(key)
+
+            while self._items and self._max_size < self._size + len(data):
+                _, evicted_item = self._items.popitem(last=False)
+                self._size -= len(evicted_item[0])
+                self.evictions += 1
+
+            self._items[key] = (data, item[1], item[2], item[3], time.monotonic() + self._ttl)
+            self._size += len(data)
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            return self._pop(key)
+
+    def delete_many(self, keys: Sequence[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._size = 0
+
+    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "items": len(self._items),
+                "size": self._size,
+            }
+
+    def _pop(self, key: str) -> bool:
+        local_item = self._items.pop(key, None)
+        if local_item is None:
+            return False
+
+        self._size -= len(local_item[0])
+        return True
+
+
 class MediaCache:
     _QUEUE_NAME = settings.CVAT_QUEUES.CHUNKS.value
     _QUEUE_JOB_PREFIX_TASK = "chunks:prepare-item-"
+    _PREFETCH_USER_JOBS_KEY_PREFIX = "chunks:prefetch-user-jobs-"
     _CACHE_NAME = "media"
     _PREVIEW_TTL = settings.CVAT_PREVIEW_CACHE_TTL
 
+    _local_cache_instance: Optional[LocalMediaCache] = None
+    _local_cache_instance_lock = threading.Lock()
+
     @staticmethod
     def _cache():
         return caches[MediaCache._CACHE_NAME]
 
+    @classmethod
+    def _local_cache(cls) -> Optional[LocalMediaCache]:
+        if settings.CVAT_LOCAL_MEDIA_CACHE_MAX_SIZE <= 0:
+            return None
+
+        if MediaCache._local_cache_instance is None:
+            with MediaCache._local_cache_instance_lock:
+                if MediaCache._local_cache_instance is None:
+                    MediaCache._local_cache_instance = LocalMediaCache(
+                        max_size=settings.CVAT_LOCAL_MEDIA_CACHE_MAX_SIZE,
+                        ttl=settings.CVAT_LOCAL_MEDIA_CACHE_TTL,
+                    )
+
+        return MediaCache._local_cache_instance
+
+    @classmethod
+    def get_local_cache_stats(cls) -> Optional[dict[str, int]]:
+        local_cache = cls._local_cache()
+        if local_cache is None:
+            return None
+
+        return local_cache.get_stats()
+
     @staticmethod
     def _get_checksum(value: bytes) -> int:
         return zlib.crc32(value)
 
     @staticmethod
     def _get_cache_item_size(item: _CacheItem) -> int:
-        return item[0].getbuffer().nbytes
+        return len(item[0].getvalue())
 
     def _get_or_set_cache_item(
         self,
@@ -217,6 +465,75 @@ class MediaCache:
     def _drop_return_value(func: Callable[..., DataWithMime], *args: Any, **kwargs: Any):
         func(*args, **kwargs)
 
+    @classmethod
+    def _make_prefetch_user_jobs_key(cls, user_id: int) -> str:
+        return f"{cls._PREFETCH_USER_JOBS_KEY_PREFIX}{user_id}"
+
+    @classmethod
+    def _run_prefetch_job(
+        cls,
+        user_jobs_key: str,
+        func: Callable[..., DataWithMime],
+        *args: Any,
+        **kwargs: Any,
+    ):
+        try:
+            func(*args, **kwargs)
+        finally:
+            if rq_job := rq.get_current_job():
+                cls._get_queue().connection.zrem(user_jobs_key, rq_job.id)
+
+    def _prefetch_cache_items(
+        self, items: Sequence[tuple[str, Callback]], *, user_id: int
+    ) -> list[str]:
+        queue = self._get_queue()
+        if settings.CVAT_CHUNK_PREFETCH_MAX_QUEUED_JOBS <= queue.count:
+            return []
+
+        connection = queue.connection
+        user_jobs_key = self._make_prefetch_user_jobs_key(user_id)
+
+        # Jobs can be lost without a cleanup, e.g. if a worker is killed
+        now = time.time()
+        connection.zremrangebyscore(user_jobs_key, "-inf", now - settings.CVAT_CHUNK_CREATE_TIMEOUT)
+        user_job_count = connection.zcard(user_jobs_key)
+
+        enqueued_keys = []
+        for key, create_callback in items:
+            if settings.CVAT_CHUNK_PREFETCH_MAX_JOBS_PER_USER <= user_job_count:
+                break
+
+            if self._has_key(key):
+                continue
+
+            # Prefetch jobs use the regular job ids, so a chunk is never prepared twice.
+            # Chunks that are already being prepared are skipped and not counted for the user.
+            rq_job_id = self._make_queue_job_id(key)
+            if not enqueue_prefetch_chunk_job(
+                queue=queue,
+                rq_job_id=rq_job_id,
+                create_callback=Callback(
+                    callable=self._run_prefetch_job,
+                    args=[
+                        user_jobs_key,
+                        self._create_and_set_cache_item,
+                        key,
+                        create_callback,
+                    ],
+                ),
+            ):
+                continue
+
+            connection.zadd(user_jobs_key, {rq_job_id: now})
+            connection.expire(user_jobs_key, settings.CVAT_CHUNK_CREATE_TIMEOUT)
+            user_job_count += 1
+            enqueued_keys.append(key)
+
+        if enqueued_keys:
+            slogger.glob.info(f"Enqueued chunk prefetching: keys {format_list(enqueued_keys)}")
+
+        return enqueued_keys
+
     @classmethod
     def _create_and_set_cache_item(
         cls,
@@ -248,6 +565,9 @@ class MediaCache:
                     )
                 cache.set(key, item, timeout=cache_item_ttl or cache.default_timeout)
 
+        if (local_cache := cls._local_cache()) is not None:
+            local_cache.set(key, item)
+
         return item
 
     def _create_cache_item(
@@ -288,14 +608,24 @@ class MediaCache:
         return item
 
     def _delete_cache_item(self, key: str):
+        if (local_cache := self._local_cache()) is not None:
+            local_cache.delete(key)
+
         self._cache().delete(key)
         slogger.glob.info(f"Removed the cache key {key}")
 
     def _bulk_delete_cache_items(self, keys: Sequence[str]):
+        if (local_cache := self._local_cache()) is not None:
+            local_cache.delete_many(keys)
+
         self._cache().delete_many(keys)
         slogger.glob.info(f"Removed the cache keys {format_list(keys)}")
 
     def _get_cache_item(self, key: str) -> Optional[_CacheItem]:
+        local_cache = self._local_cache()
+        if local_cache is not None and (item := local_cache.get(key)):
+            return item
+
         try:
             item = self._cache().get(key)
         except pickle.UnpicklingError:
@@ -305,17 +635,29 @@ class MediaCache:
         if not item:
             return None
 
-        item_data = item[0].getbuffer() if isinstance(item[0], io.BytesIO) else item[0]
+        item_data = item[0].getvalue() if isinstance(item[0], io.BytesIO) else item[0]
         item_checksum = item[2] if len(item) == 4 else None
         if item_checksum != self._get_checksum(item_data):
             slogger.glob.info(f"Cache item {key} checksum mismatch")
             return None
 
+        if local_cache is not None:
+            local_cache.set(key, item)
+
         return item
 
     def _validate_cache_item_timestamp(
-        self, item: _CacheItem, expected_timestamp: datetime
+        self, item: _CacheItem, expected_timestamp: datetime, *, key: Optional[str] = None
     ) -> _CacheItem:
+        if (
+            item[3] < expected_timestamp
+            and key
+            and (local_cache := self._local_cache()) is not None
+        ):
+            # The local copy can be outdated if the item was updated by another process
+            if local_cache.delete(key):
+                item = self._get_cache_item(key) or item
+
         if item[3] < expected_timestamp:
             raise CvatChunkTimestampMismatchError(
                 f"Cache timestamp mismatch. Item_ts: {item[3]}, expected_ts: {expected_timestamp}"
@@ -325,6 +667,10 @@ class MediaCache:
 
     @classmethod
     def _has_key(cls, key: str) -> bool:
+        local_cache = cls._local_cache()
+        if local_cache is not None and local_cache.contains(key):
+            return True
+
         return cls._cache().has_key(key)
 
     @staticmethod
@@ -390,8 +736,9 @@ class MediaCache:
         self, db_segment: models.Segment, chunk_number: int, *, quality: FrameQuality
     ) -> DataWithMime:
 
+        key = self._make_chunk_key(db_segment, chunk_number, quality=quality)
         item = self._get_or_set_cache_item(
-            self._make_chunk_key(db_segment, chunk_number, quality=quality),
+            key,
             Callback(
                 callable=self.prepare_segment_chunk,
                 args=[db_segment, chunk_number],
@@ -401,7 +748,7 @@ class MediaCache:
         db_segment.refresh_from_db(fields=["chunks_updated_date"])
 
         return self._to_data_with_mime(
-            self._validate_cache_item_timestamp(item, db_segment.chunks_updated_date)
+            self._validate_cache_item_timestamp(item, db_segment.chunks_updated_date, key=key)
         )
 
     def get_task_chunk(
@@ -423,10 +770,8 @@ class MediaCache:
         quality: FrameQuality,
     ) -> DataWithMime:
 
-        item = self._get_or_set_cache_item(
-            self._make_chunk_key(db_task, chunk_number, quality=quality),
-            set_callback,
-        )
+        key = self._make_chunk_key(db_task, chunk_number, quality=quality)
+        item = self._get_or_set_cache_item(key, set_callback)
 
         if is_field_cached(db_task, "segment_set"):
             # Refresh segments to report actual dates if they were fetched previously
@@ -434,7 +779,7 @@ class MediaCache:
             db_task.refresh_from_db(fields=["segment_set"])
 
         return self._to_data_with_mime(
-            self._validate_cache_item_timestamp(item, db_task.get_chunks_updated_date())
+            self._validate_cache_item_timestamp(item, db_task.get_chunks_updated_date(), key=key)
         )
 
     def get_segment_task_chunk(
@@ -456,16 +801,50 @@ class MediaCache:
         set_callback: Callback,
     ) -> DataWithMime:
 
-        item = self._get_or_set_cache_item(
-            self._make_segment_task_chunk_key(db_segment, chunk_number, quality=quality),
-            set_callback,
-        )
+        key = self._make_segment_task_chunk_key(db_segment, chunk_number, quality=quality)
+        item = self._get_or_set_cache_item(key, set_callback)
         db_segment.refresh_from_db(fields=["chunks_updated_date"])
 
         return self._to_data_with_mime(
-            self._validate_cache_item_timestamp(item, db_segment.chunks_updated_date),
+            self._validate_cache_item_timestamp(item, db_segment.chunks_updated_date, key=key),
         )
 
+    def prefetch_segment_chunks(
+        self,
+        db_segment: models.Segment,
+        chunk_numbers: Sequence[int],
+        *,
+        quality: FrameQuality,
+        user_id: int,
+    ) -> list[int]:
+        """
+        Enqueues background preparation of the segment chunks, which are not cached yet.
+        Doesn't wait for the chunks to be prepared.
+
+        Returns the numbers of the chunks enqueued for preparation.
+        """
+
+        chunk_keys = {
+            self._make_chunk_key(db_segment, chunk_number, quality=quality): chunk_number
+            for chunk_number in chunk_numbers
+        }
+        enqueued_keys = self._prefetch_cache_items(
+            [
+                (
+                    key,
+                    Callback(
+                        callable=self.prepare_segment_chunk,
+                        args=[db_segment, chunk_number],
+                        kwargs={"quality": quality},
+                    ),
+                )
+                for key, chunk_number in chunk_keys.items()
+            ],
+            user_id=user_id,
+        )
+
+        return [chunk_keys[key] for key in enqueued_keys]
+
     def get_or_set_selective_job_chunk(
         self, db_job: models.Job, chunk_number: int, *, quality: FrameQuality
     ) -> DataWithMime:
@@ -26,6 +26,69 @@ Let's check the data size and raise an understandable exception instead of the r
 Sets the maximum size in bytes of a data chunk item stored on redis_ondisk
 """
 
+CVAT_LOCAL_MEDIA_CACHE_MAX_SIZE = int(os.getenv("CVAT_LOCAL_MEDIA_CACHE_MAX_SIZE", 0))
+"""
+Sets the maximum total size in bytes of the process-local media cache,
+which is used in front of redis_ondisk to serve frequently requested chunks and previews
+without a network round trip. 0 disables the process-local cache.
+The cache stats of the process are reported in the server health check results.
+"""
+
+CVAT_LOCAL_MEDIA_CACHE_TTL = int(os.getenv("CVAT_LOCAL_MEDIA_CACHE_TTL", 60))
+"""
+Sets the lifetime in seconds of items in the process-local media cache
+"""
+
+CVAT_FRAME_CONVERSION_WORKERS = int(os.getenv("CVAT_FRAME_CONVERSION_WORKERS", 1))
+"""
+Sets the number of threads used to convert frames (e.g. to encode video frames as images)
+when many frames are read at once, for instance, when a dataset with images is exported.
+1 disables the parallel conversion.
+"""
+
+CVAT_QUALITY_CHECK_WORKERS = int(os.getenv("CVAT_QUALITY_CHECK_WORKERS", 1))
+"""
+Sets the number of processes used to compare frames of a job with the Ground Truth
+in quality checks. 1 disables the parallel comparison.
+"""
+
+CVAT_QUALITY_CHECK_SPATIAL_INDEX_MIN_SIZE = int(
+    os.getenv("CVAT_QUALITY_CHECK_SPATIAL_INDEX_MIN_SIZE", 100)
+)
+"""
+Sets the number of shapes on a frame, starting from which the shapes are matched using
+a spatial index, instead of comparing all the shape pairs. 0 disables the spatial index.
+"""
+
+CVAT_CONSENSUS_MERGING_WORKERS = int(os.getenv("CVAT_CONSENSUS_MERGING_WORKERS", 1))
+"""
+Sets the number of processes used to merge consensus replica annotations.
+The jobs are merged in batches of this number of jobs, and the frames of the jobs in a batch
+are split between the processes. 1 disables the parallel merging.
+"""
+
+CVAT_MANIFEST_CREATION_WORKERS = int(os.getenv("CVAT_MANIFEST_CREATION_WORKERS", 1))
+"""
+Sets the number of processes used to read image properties
+when a manifest is created for task images
+"""
+
+CVAT_TASK_ANNOTATION_LOADING_WORKERS = int(os.getenv("CVAT_TASK_ANNOTATION_LOADING_WORKERS", 1))
+"""
+Sets the number of threads used to read job annotations when task annotations are exported.
+Each thread uses a separate DB connection. 1 disables the parallel reading.
+The loaded job annotations are merged in the main thread, while the next jobs are being read.
+"""
+
+CVAT_EXPORT_FRAME_WINDOW_SIZE = int(os.getenv("CVAT_EXPORT_FRAME_WINDOW_SIZE", 1000))
+"""
+Sets the number of frames, for which the annotations are prepared at once in streaming exports,
+such as CVAT for images, and for which the track shapes are interpolated at once
+in CVAT for video. Larger windows need more memory, but can be processed faster.
+This only limits the prepared annotations, the source annotations are loaded fully.
+0 disables the windows, so the annotations are prepared for all the frames at once.
+"""
+
 CVAT_CHUNK_CREATE_TIMEOUT = 50
 """
 Sets the chunk preparation timeout in seconds after which the backend will respond with 429 code.
@@ -35,6 +98,30 @@ CVAT_CHUNK_CREATE_CHECK_INTERVAL = 0.2
 """
 Sets the frequency of checking the readiness of the chunk
 """
+
+CVAT_CHUNK_PREFETCH_SIZE = int(os.getenv("CVAT_CHUNK_PREFETCH_SIZE", 0))
+"""
+Sets the number of job chunks to be prepared in the background after a job chunk is requested.
+The chunks are selected in the direction of the previous requests of the user.
+0 disables chunk prefetching.
+"""
+
+CVAT_CHUNK_PREFETCH_MAX_JOBS_PER_USER = int(os.getenv("CVAT_CHUNK_PREFETCH_MAX_JOBS_PER_USER", 4))
+"""
+Sets the maximum number of simultaneous chunk prefetching jobs per user
+"""
+
+CVAT_CHUNK_PREFETCH_MAX_QUEUED_JOBS = int(os.getenv("CVAT_CHUNK_PREFETCH_MAX_QUEUED_JOBS", 20))
+"""
+Sets the chunk queue length, after which new chunk prefetching jobs are not enqueued
+"""
+
+CVAT_ANNOTATION_SNAPSHOT_CACHE_TTL = int(os.getenv("CVAT_ANNOTATION_SNAPSHOT_CACHE_TTL", 3600))
+"""
+Sets the lifetime in seconds of the job annotation snapshots in redis_ondisk.
+The snapshots allow reading unchanged job annotations without querying and serializing them.
+0 disables the snapshots.
+"""
 default_export_cache_ttl = 60 * 60 * 24
 default_export_cache_lock_ttl = 30
 default_export_cache_lock_acquisition_timeout = 50
@@ -99,10 +186,22 @@ else:
         os.getenv("CVAT_EXPORT_LOCKED_RETRY_INTERVAL", default_export_locked_retry_interval)
     )
 
+EXPORT_MEDIA_CACHE_ENABLED = to_bool(os.getenv("CVAT_EXPORT_MEDIA_CACHE_ENABLED", True))
+"""
+Keep the exported media files of tasks and jobs in the export cache, so repeated exports
+with images don't need to decode and encode the frames again, if only the annotations changed.
+"""
+
 MAX_CONSENSUS_REPLICAS = int(os.getenv("CVAT_MAX_CONSENSUS_REPLICAS", 11))
 if MAX_CONSENSUS_REPLICAS < 1:
     raise ImproperlyConfigured(f"MAX_CONSENSUS_REPLICAS must be >= 1, got {MAX_CONSENSUS_REPLICAS}")
 
 DEFAULT_DB_BULK_CREATE_BATCH_SIZE = int(os.getenv("CVAT_DEFAULT_DB_BULK_CREATE_BATCH_SIZE", 5000))
 
+DEFAULT_DB_BULK_COPY_MIN_SIZE = int(os.getenv("CVAT_DEFAULT_DB_BULK_COPY_MIN_SIZE", 10000))
+"""
+Sets the minimum number of objects to be inserted with the COPY command instead of INSERT
+in bulk_copy(). Only used with PostgreSQL. 0 disables COPY.
+"""
+
 DEFAULT_DB_ANNO_CHUNK_SIZE = int(os.getenv("CVAT_DEFAULT_DB_ANNO_CHUNK_SIZE", 2000))
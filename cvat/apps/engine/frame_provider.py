@@ -10,8 +10,9 @@ import itertools
 import math
 from abc import ABCMeta, abstractmethod
 from bisect import bisect
-from collections import OrderedDict
-from collections.abc import Iterator, Sequence
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum, auto
 from io import BytesIO
@@ -21,6 +22,7 @@ import av
 import cv2
 import numpy as np
 from django.conf import settings
+from django.core.cache import cache as django_cache
 from django.db.models import prefetch_related_objects
 from PIL import Image
 from rest_framework.exceptions import ValidationError
@@ -165,6 +167,49 @@ class IFrameProvider(metaclass=ABCMeta):
         else:
             raise RuntimeError("unsupported output type")
 
+    def _make_frame(
+        self,
+        frame: Any,
+        frame_name: str,
+        reader_class: type[IMediaReader],
+        out_type: FrameOutputType,
+    ) -> DataWithMeta[AnyFrame]:
+        frame = self._convert_frame(frame, reader_class, out_type)
+        if issubclass(reader_class, VideoReader):
+            return DataWithMeta[AnyFrame](frame, mime=self.VIDEO_FRAME_MIME)
+
+        return DataWithMeta[AnyFrame](frame, mime=mimetypes.guess_type(frame_name)[0])
+
+    def _make_frames(
+        self,
+        raw_frames: Iterable[tuple[Any, str, type[IMediaReader]]],
+        out_type: FrameOutputType,
+    ) -> Iterator[DataWithMeta[AnyFrame]]:
+        """
+        Converts the raw frames to the requested output type, keeping the frame order.
+
+        Video frames are decoded sequentially by the chunk readers,
+        but their conversion (e.g. PNG encoding) can be done in parallel. The conversion
+        functions release the GIL, so threads are enough here.
+        """
+
+        workers = settings.CVAT_FRAME_CONVERSION_WORKERS
+        if workers <= 1:
+            for raw_frame in raw_frames:
+                yield self._make_frame(*raw_frame, out_type)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # limit the number of converted frames kept in memory
+            pending = deque()
+            for raw_frame in raw_frames:
+                pending.append(executor.submit(self._make_frame, *raw_frame, out_type))
+                if 2 * workers <= len(pending):
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+
     @abstractmethod
     def validate_frame_number(self, frame_number: int) -> int: ...
 
@@ -383,6 +428,20 @@ class TaskFrameProvider(IFrameProvider):
         quality: FrameQuality = FrameQuality.ORIGINAL,
         out_type: FrameOutputType = FrameOutputType.BUFFER,
     ) -> Iterator[DataWithMeta[AnyFrame]]:
+        yield from self._make_frames(
+            self._iterate_raw_frames(
+                start_frame=start_frame, stop_frame=stop_frame, quality=quality
+            ),
+            out_type,
+        )
+
+    def _iterate_raw_frames(
+        self,
+        *,
+        start_frame: Optional[int] = None,
+        stop_frame: Optional[int] = None,
+        quality: FrameQuality = FrameQuality.ORIGINAL,
+    ) -> Iterator[tuple[Any, str, type[IMediaReader]]]:
         frame_range = itertools.count(start_frame)
         if stop_frame:
             frame_range = itertools.takewhile(lambda x: x <= stop_frame, frame_range)
@@ -404,7 +463,7 @@ class TaskFrameProvider(IFrameProvider):
                 db_segment_frame_set = set(db_segment.frame_set)
                 db_segment_frame_provider = SegmentFrameProvider(db_segment)
 
-            yield db_segment_frame_provider.get_frame(idx, quality=quality, out_type=out_type)
+            yield db_segment_frame_provider._get_raw_frame(idx, quality=quality)
 
     def _get_segment(self, validated_frame_number: int) -> models.Segment:
         if not self._db_task.data or not self._db_task.data.size:
@@ -583,6 +642,44 @@ class SegmentFrameProvider(IFrameProvider):
         chunk_data, mime = self._loaders[quality].read_chunk(chunk_number)
         return DataWithMeta[BytesIO](chunk_data, mime=mime)
 
+    _PREFETCH_LAST_CHUNK_TTL = 60 * 10
+
+    def prefetch_chunks(
+        self, chunk_number: int, *, quality: FrameQuality, user_id: int
+    ) -> list[int]:
+        """
+        Enqueues background preparation of the chunks, which are likely to be requested next.
+        The chunks following the requested one are selected, or the preceding ones,
+        if the user's previous request was for a chunk with a bigger number.
+
+        Returns the numbers of the chunks enqueued for preparation.
+        """
+
+        prefetch_size = settings.CVAT_CHUNK_PREFETCH_SIZE
+        if prefetch_size <= 0 or not isinstance(self._loaders[quality], _BufferChunkLoader):
+            # Static chunks don't need to be prepared
+            return []
+
+        last_chunk_key = f"chunks:prefetch-last-chunk-{user_id}-{self._db_segment.id}-{quality}"
+        last_chunk_number = django_cache.get(last_chunk_key)
+        django_cache.set(last_chunk_key, chunk_number, timeout=self._PREFETCH_LAST_CHUNK_TTL)
+
+        step = -1 if last_chunk_number is not None and chunk_number < last_chunk_number else 1
+        chunk_count = math.ceil(
+            self._db_segment.frame_count / self._db_segment.task.data.chunk_size
+        )
+        chunk_numbers = [
+            n
+            for n in range(chunk_number + step, chunk_number + step * (prefetch_size + 1), step)
+            if 0 <= n < chunk_count
+        ]
+        if not chunk_numbers:
+            return []
+
+        return MediaCache().prefetch_segment_chunks(
+            self._db_segment, chunk_numbers, quality=quality, user_id=user_id
+        )
+
     def _get_raw_frame(
         self,
         frame_number: int,
@@ -602,15 +699,7 @@ class SegmentFrameProvider(IFrameProvider):
         quality: FrameQuality = FrameQuality.ORIGINAL,
         out_type: FrameOutputType = FrameOutputType.BUFFER,
     ) -> DataWithMeta[AnyFrame]:
-        return_type = DataWithMeta[AnyFrame]
-
-        frame, frame_name, reader_class = self._get_raw_frame(frame_number, quality=quality)
-
-        frame = self._convert_frame(frame, reader_class, out_type)
-        if issubclass(reader_class, VideoReader):
-            return return_type(frame, mime=self.VIDEO_FRAME_MIME)
-
-        return return_type(frame, mime=mimetypes.guess_type(frame_name)[0])
+        return self._make_frame(*self._get_raw_frame(frame_number, quality=quality), out_type)
 
     def get_frame_context_images_chunk(
         self,
@@ -644,9 +733,13 @@ class SegmentFrameProvider(IFrameProvider):
             frame_range = itertools.takewhile(lambda x: x <= stop_frame, frame_range)
 
         segment_frame_set = set(self._db_segment.frame_set)
-        for idx in frame_range:
-            if self._get_abs_frame_number(self._db_segment.task.data, idx) in segment_frame_set:
-                yield self.get_frame(idx, quality=quality, out_type=out_type)
+        raw_frames = (
+            self._get_raw_frame(idx, quality=quality)
+            for idx in frame_range
+            if self._get_abs_frame_number(self._db_segment.task.data, idx) in segment_frame_set
+        )
+
+        yield from self._make_frames(raw_frames, out_type)
 
 
 class JobFrameProvider(SegmentFrameProvider):
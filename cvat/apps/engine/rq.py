@@ -61,6 +61,9 @@ class RQJobMetaField:
     LAMBDA = "lambda"
     FUNCTION_ID = "function_id"
 
+    # chunk fields
+    PREFETCH = "prefetch"
+
 
 class WithMeta(Protocol):
     meta: dict[str, Any]
@@ -6,6 +6,8 @@
 import concurrent.futures
 import fnmatch
 import itertools
+import math
+import multiprocessing
 import os
 import re
 import shutil
@@ -32,12 +34,14 @@ from cvat.apps.engine.log import ServerLogManager
 from cvat.apps.engine.media_extractors import (
     MEDIA_TYPES,
     CachingMediaIterator,
+    IChunkWriter,
     ImageListReader,
     IMediaReader,
     Mpeg4ChunkWriter,
     Mpeg4CompressedChunkWriter,
     RandomAccessIterator,
     ValidateDimension,
+    VideoReaderWithManifest,
     ZipChunkWriter,
     ZipCompressedChunkWriter,
     get_mime,
@@ -541,6 +545,7 @@ def _create_task_manifest_from_cloud_data(
         sources=content_generator,
         DIM_3D=dimension == models.DimensionType.DIM_3D,
         stop=stop_frame,
+        workers=settings.CVAT_MANIFEST_CREATION_WORKERS,
     )
     manifest.create()
 
@@ -1097,6 +1102,7 @@ def create_thread(
                     },
                     data_dir=upload_dir,
                     DIM_3D=(db_task.dimension == models.DimensionType.DIM_3D),
+                    workers=settings.CVAT_MANIFEST_CREATION_WORKERS,
                 )
                 manifest.create()
             else:
@@ -1514,6 +1520,116 @@ def create_thread(
     # Prepare the preview image and save it in the cache
     TaskFrameProvider(db_task=db_task).get_preview()
 
+@attrs.frozen
+class _StaticChunkParams:
+    frame_ids: tuple[int, ...]
+    compressed_chunk_path: str
+    original_chunk_path: str
+
+
+def _save_static_video_chunks(
+    chunks: Sequence[_StaticChunkParams],
+    *,
+    source_path: str,
+    manifest_path: str,
+    compressed_chunk_writer: IChunkWriter,
+    original_chunk_writer: IChunkWriter,
+) -> int:
+    # The chunk frames are expected to be ascending, so the video is decoded only once,
+    # starting from the nearest key frame before the first chunk frame
+    reader = VideoReaderWithManifest(manifest_path=manifest_path, source_path=source_path)
+    frames = reader.iterate_frames(
+        frame_filter=itertools.chain.from_iterable(chunk.frame_ids for chunk in chunks)
+    )
+
+    with closing(frames):
+        for chunk in chunks:
+            chunk_data = [
+                (frame, source_path, None)
+                for frame in itertools.islice(frames, len(chunk.frame_ids))
+            ]
+            assert len(chunk_data) == len(chunk.frame_ids), "Unexpected end of the video"
+
+            compressed_chunk_writer.save_as_chunk(
+                images=chunk_data, chunk_path=chunk.compressed_chunk_path
+            )
+            original_chunk_writer.save_as_chunk(
+                images=chunk_data, chunk_path=chunk.original_chunk_path
+            )
+
+    return len(chunks)
+
+
+_STATIC_VIDEO_CHUNK_JOBS_PER_WORKER = 4
+
+
+def _create_static_video_chunks_in_parallel(
+    db_task: models.Task,
+    *,
+    compressed_chunk_writer: IChunkWriter,
+    original_chunk_writer: IChunkWriter,
+    update_progress: Callable[[float], None],
+    max_workers: int,
+):
+    db_data = db_task.data
+
+    # Split the chunk sequence into ranges with ascending frames,
+    # segment overlaps make the frame sequence non-monotonic
+    chunk_ranges: list[list[_StaticChunkParams]] = [[]]
+    for db_segment in db_task.segment_set.order_by('start_frame').all():
+        for chunk_idx, chunk_frame_ids in enumerate(
+            take_by(sorted(db_segment.frame_set), db_data.chunk_size)
+        ):
+            chunk = _StaticChunkParams(
+                frame_ids=tuple(chunk_frame_ids),
+                compressed_chunk_path=db_data.get_compressed_segment_chunk_path(
+                    chunk_idx, segment_id=db_segment.id
+                ),
+                original_chunk_path=db_data.get_original_segment_chunk_path(
+                    chunk_idx, segment_id=db_segment.id
+                ),
+            )
+
+            last_range = chunk_ranges[-1]
+            if last_range and chunk.frame_ids[0] <= last_range[-1].frame_ids[-1]:
+                chunk_ranges.append([])
+
+            chunk_ranges[-1].append(chunk)
+
+    chunk_count = sum(map(len, chunk_ranges))
+    if not chunk_count:
+        return
+
+    # Each worker job seeks to the nearest key frame before its first frame,
+    # so the jobs shouldn't be too small to avoid decoding the same frames repeatedly
+    max_chunks_per_job = max(1, math.ceil(
+        chunk_count / (max_workers * _STATIC_VIDEO_CHUNK_JOBS_PER_WORKER)
+    ))
+
+    worker_job_params = dict(
+        source_path=os.path.join(db_data.get_raw_data_dirname(), db_data.video.path),
+        manifest_path=db_data.get_manifest_path(),
+        compressed_chunk_writer=compressed_chunk_writer,
+        original_chunk_writer=original_chunk_writer,
+    )
+
+    # The worker jobs don't use the DB, so the fork context is safe to use here.
+    # It also allows the worker jobs to be defined in Django-dependent modules.
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("fork")
+    ) as executor:
+        futures = [
+            executor.submit(_save_static_video_chunks, job_chunks, **worker_job_params)
+            for chunk_range in chunk_ranges
+            for job_chunks in take_by(chunk_range, max_chunks_per_job)
+        ]
+
+        saved_chunk_count = 0
+        for future in concurrent.futures.as_completed(futures):
+            saved_chunk_count += future.result()
+            update_progress(saved_chunk_count / chunk_count)
+
+
 def _create_static_chunks(db_task: models.Task, *, media_extractor: IMediaReader, upload_dir: str):
     @attrs.define
     class _ChunkProgressUpdater:
@@ -1599,6 +1715,20 @@ def _create_static_chunks(db_task: models.Task, *, media_extractor: IMediaReader
     )
     original_chunk_writer = original_chunk_writer_class(original_quality, **chunk_writer_kwargs)
 
+    if (
+        isinstance(media_extractor, MEDIA_TYPES['video']['extractor']) and
+        settings.CVAT_CONCURRENT_CHUNK_PROCESSING > 1 and
+        os.path.isfile(db_data.get_manifest_path())
+    ):
+        _create_static_video_chunks_in_parallel(
+            db_task,
+            compressed_chunk_writer=compressed_chunk_writer,
+            original_chunk_writer=original_chunk_writer,
+            update_progress=_ChunkProgressUpdater().update_progress,
+            max_workers=settings.CVAT_CONCURRENT_CHUNK_PROCESSING,
+        )
+        return
+
     db_segments = db_task.segment_set.order_by('start_frame').all()
 
     frame_map = {} # frame number -> extractor frame number
@@ -1636,8 +1766,8 @@ def _create_static_chunks(db_task: models.Task, *, media_extractor: IMediaReader
         progress_updater = _ChunkProgressUpdater()
 
         # TODO: remove 2 * or the configuration option
-        # TODO: maybe make real multithreading support, currently the code is limited by 1
-        # video segment chunk, even if more threads are available
+        # Video chunks are only processed in parallel if there is a manifest,
+        # otherwise the code is limited by 1 video segment chunk
         max_concurrency = 2 * settings.CVAT_CONCURRENT_CHUNK_PROCESSING if not isinstance(
             media_extractor, MEDIA_TYPES['video']['extractor']
         ) else 2
@@ -0,0 +1,255 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+import io
+import pickle
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+import fakeredis
+from django.test import override_settings
+from django_rq.queues import DjangoRQ
+
+from cvat.apps.engine.cache import (
+    Callback,
+    LocalMediaCache,
+    MediaCache,
+    MediaCacheSerializer,
+    enqueue_create_chunk_job,
+    enqueue_prefetch_chunk_job,
+)
+
+
+def _make_item(data: bytes):
+    return (io.BytesIO(data), "application/zip", 0, datetime.now(timezone.utc))
+
+
+def _make_chunk():
+    return _make_item(b"abc")
+
+
+class TestLocalMediaCache(unittest.TestCase):
+    def test_can_get_item(self):
+        cache = LocalMediaCache(max_size=100, ttl=60)
+        item = _make_item(b"abc")
+
+        cache.set("key", item)
+        cached_item = cache.get("key")
+
+        self.assertEqual(cached_item[0].getvalue(), b"abc")
+        self.assertEqual(cached_item[1:], item[1:])
+        self.assertEqual(cache.get_stats()["hits"], 1)
+
+    def test_readers_get_separate_buffers(self):
+        cache = LocalMediaCache(max_size=100, ttl=60)
+        cache.set("key", _make_item(b"abc"))
+
+        cache.get("key")[0].write(b"x")
+
+        self.assertEqual(cache.get("key")[0].getvalue(), b"abc")
+
+    def test_can_evict_least_recently_used_items(self):
+        cache = LocalMediaCache(max_size=10, ttl=60)
+        cache.set("a", _make_item(b"1234"))
+        cache.set("b", _make_item(b"1234"))
+        cache.get("a")
+
+        cache.set("c", _make_item(b"1234"))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(cache.size, 8)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_can_check_items_without_changing_stats_and_order(self):
+        cache = LocalMediaCache(max_size=10, ttl=60)
+        cache.set("a", _make_item(b"1234"))
+        cache.set("b", _make_item(b"1234"))
+
+        self.assertTrue(cache.contains("a"))
+        self.assertFalse(cache.contains("c"))
+        cache.set("c", _make_item(b"1234"))
+
+        self.assertFalse(cache.contains("a"))
+        self.assertTrue(cache.contains("b"))
+        self.assertEqual(cache.get_stats()["hits"], 0)
+        self.assertEqual(cache.get_stats()["misses"], 0)
+
+    def test_does_not_keep_too_large_items(self):
+        cache = LocalMediaCache(max_size=2, ttl=60)
+
+        cache.set("key", _make_item(b"abc"))
+
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.size, 0)
+
+    def test_can_expire_items(self):
+        cache = LocalMediaCache(max_size=100, ttl=10)
+
+        with mock.patch("cvat.apps.engine.cache.time.monotonic", return_value=0):
+            cache.set("key", _make_item(b"abc"))
+
+        with mock.patch("cvat.apps.engine.cache.time.monotonic", return_value=10):
+            self.assertIsNone(cache.get("key"))
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.get_stats()["misses"], 1)
+
+    def test_can_delete_items(self):
+        cache = LocalMediaCache(max_size=100, ttl=60)
+        cache.set("a", _make_item(b"1"))
+        cache.set("b", _make_item(b"2"))
+        cache.set("c", _make_item(b"3"))
+
+        self.assertTrue(cache.delete("a"))
+        self.assertFalse(cache.delete("a"))
+        cache.delete_many(["b", "c"])
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.size, 0)
+
+
+class TestMediaCacheWithLocalCache(unittest.TestCase):
+    def setUp(self):
+        settings_override = override_settings(
+            CVAT_LOCAL_MEDIA_CACHE_MAX_SIZE=100, CVAT_LOCAL_MEDIA_CACHE_TTL=60
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.shared_cache = mock.Mock()
+        self.shared_cache.get.return_value = (
+            io.BytesIO(b"abc"),
+            "application/zip",
+            MediaCache._get_checksum(b"abc"),
+            datetime.now(timezone.utc),
+        )
+
+        patcher = mock.patch.object(MediaCache, "_cache", return_value=self.shared_cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch.object(MediaCache, "_local_cache_instance", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_can_keep_items_in_local_cache(self):
+        media_cache = MediaCache()
+
+        media_cache._get_cache_item("key")
+        cached_item = media_cache._get_cache_item("key")
+
+        self.assertEqual(cached_item[0].getvalue(), b"abc")
+        self.assertEqual(self.shared_cache.get.call_count, 1)
+        self.assertEqual(MediaCache.get_local_cache_stats()["hits"], 1)
+
+    def test_can_check_keys_without_changing_local_cache_stats(self):
+        media_cache = MediaCache()
+        media_cache._get_cache_item("key")
+
+        self.assertTrue(MediaCache._has_key("key"))
+        self.assertEqual(MediaCache.get_local_cache_stats()["hits"], 0)
+        self.shared_cache.has_key.assert_not_called()
+
+
+class TestMediaCacheSerializer(unittest.TestCase):
+    def setUp(self):
+        self.serializer = MediaCacheSerializer()
+
+    def test_can_serialize_cache_item(self):
+        item = (
+            io.BytesIO(b"abc"),
+            "video/mp4",
+            42,
+            datetime(2025, 1, 2, 3, 4, 5, 678901, timezone.utc),
+        )
+
+        serialized = self.serializer.dumps(item)
+        deserialized = self.serializer.loads(serialized)
+
+        self.assertTrue(serialized.endswith(b"abc"))
+        self.assertEqual(deserialized[0].getvalue(), b"abc")
+        self.assertEqual(deserialized[1:], item[1:])
+
+    def test_can_serialize_cache_item_without_timestamp(self):
+        item = (io.BytesIO(b""), "", 0, None)
+
+        deserialized = self.serializer.loads(self.serializer.dumps(item))
+
+        self.assertEqual(deserialized[0].getvalue(), b"")
+        self.assertEqual(deserialized[1:], item[1:])
+
+    def test_can_read_pickled_cache_item(self):
+        item = (io.BytesIO(b"abc"), "application/zip", 42, datetime.now(timezone.utc))
+
+        deserialized = self.serializer.loads(pickle.dumps(item))
+
+        self.assertEqual(deserialized[0].getvalue(), b"abc")
+        self.assertEqual(deserialized[1:], item[1:])
+
+    def test_can_serialize_other_values(self):
+        for value in ["abc", {"a": [1, 2]}]:
+            with self.subTest(value=value):
+                self.assertEqual(self.serializer.loads(self.serializer.dumps(value)), value)
+
+
+class TestChunkPrefetching(unittest.TestCase):
+    def setUp(self):
+        self.queue = DjangoRQ("chunks", connection=fakeredis.FakeRedis())
+
+    def test_can_enqueue_prefetch_job_at_the_end(self):
+        enqueue_create_chunk_job(self.queue, "regular", Callback(callable=_make_chunk))
+
+        rq_job = enqueue_prefetch_chunk_job(self.queue, "prefetch", Callback(callable=_make_chunk))
+
+        self.assertEqual(rq_job.id, "prefetch")
+        self.assertEqual(self.queue.job_ids, ["regular", "prefetch"])
+
+    def test_cannot_enqueue_prefetch_job_for_active_job(self):
+        enqueue_create_chunk_job(self.queue, "regular", Callback(callable=_make_chunk))
+        enqueue_prefetch_chunk_job(self.queue, "prefetch", Callback(callable=_make_chunk))
+
+        for rq_job_id in ["regular", "prefetch"]:
+            with self.subTest(rq_job_id=rq_job_id):
+                self.assertIsNone(
+                    enqueue_prefetch_chunk_job(
+                        self.queue, rq_job_id, Callback(callable=_make_chunk)
+                    )
+                )
+
+        self.assertEqual(self.queue.job_ids, ["regular", "prefetch"])
+
+    def test_can_move_prefetch_job_to_the_front_when_requested(self):
+        enqueue_create_chunk_job(self.queue, "regular", Callback(callable=_make_chunk))
+        enqueue_prefetch_chunk_job(self.queue, "prefetch", Callback(callable=_make_chunk))
+
+        rq_job = enqueue_create_chunk_job(self.queue, "prefetch", Callback(callable=_make_chunk))
+
+        self.assertEqual(rq_job.id, "prefetch")
+        self.assertEqual(self.queue.job_ids, ["prefetch", "regular"])
+
+    @override_settings(
+        CVAT_CHUNK_PREFETCH_MAX_QUEUED_JOBS=10, CVAT_CHUNK_PREFETCH_MAX_JOBS_PER_USER=1
+    )
+    def test_does_not_count_reused_jobs_for_user(self):
+        media_cache = MediaCache()
+        enqueue_create_chunk_job(
+            self.queue, media_cache._make_queue_job_id("a"), Callback(callable=_make_chunk)
+        )
+
+        with (
+            mock.patch.object(MediaCache, "_get_queue", return_value=self.queue),
+            mock.patch.object(MediaCache, "_has_key", return_value=False),
+        ):
+            enqueued_keys = media_cache._prefetch_cache_items(
+                [(key, Callback(callable=_make_chunk)) for key in ["a", "b", "c"]], user_id=1
+            )
+
+        self.assertEqual(enqueued_keys, ["b"])
+        self.assertEqual(
+            self.queue.connection.zrange(media_cache._make_prefetch_user_jobs_key(1), 0, -1),
+            [media_cache._make_queue_job_id("b").encode()],
+        )
@@ -0,0 +1,80 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+import random
+import time
+import unittest
+from io import BytesIO
+from unittest import mock
+
+import av
+import cv2
+import numpy as np
+from django.test import override_settings
+
+from cvat.apps.engine.frame_provider import FrameOutputType, SegmentFrameProvider
+from cvat.apps.engine.media_extractors import ImageListReader, VideoReader
+
+
+class TestFrameConversion(unittest.TestCase):
+    _FRAME_COUNT = 20
+
+    def _make_raw_frames(self):
+        rng = np.random.default_rng(42)
+        raw_frames = []
+        for i in range(self._FRAME_COUNT):
+            image = rng.integers(0, 256, size=(8, 12, 3), dtype=np.uint8)
+            if i % 2:
+                raw_frames.append(
+                    (av.VideoFrame.from_ndarray(image, format="bgr24"), f"{i}.png", VideoReader)
+                )
+            else:
+                raw_frames.append(
+                    (
+                        BytesIO(cv2.imencode(".png", image)[1].tobytes()),
+                        f"{i}.png",
+                        ImageListReader,
+                    )
+                )
+
+        return raw_frames
+
+    def _make_frames(self, out_type: FrameOutputType) -> list:
+        # The provider state is not used in the frame conversion
+        frame_provider = SegmentFrameProvider.__new__(SegmentFrameProvider)
+        original_convert_frame = frame_provider._convert_frame
+
+        def convert_frame(*args, **kwargs):
+            # make the conversions finish out of order
+            time.sleep(random.uniform(0, 0.01))
+            return original_convert_frame(*args, **kwargs)
+
+        with mock.patch.object(frame_provider, "_convert_frame", side_effect=convert_frame):
+            frames = list(frame_provider._make_frames(iter(self._make_raw_frames()), out_type))
+
+        for frame in frames:
+            if isinstance(frame.data, BytesIO):
+                frame.data = frame.data.getvalue()
+            else:
+                frame.data = np.asarray(frame.data)
+
+        return frames
+
+    def test_can_convert_frames_in_parallel_as_sequentially(self):
+        for out_type in FrameOutputType:
+            with self.subTest(out_type=out_type.name):
+                with override_settings(CVAT_FRAME_CONVERSION_WORKERS=1):
+                    expected = self._make_frames(out_type)
+
+                with override_settings(CVAT_FRAME_CONVERSION_WORKERS=3):
+                    actual = self._make_frames(out_type)
+
+                self.assertEqual(len(expected), self._FRAME_COUNT)
+                self.assertEqual(len(actual), len(expected))
+                for expected_frame, actual_frame in zip(expected, actual):
+                    self.assertEqual(actual_frame.mime, expected_frame.mime)
+                    if isinstance(expected_frame.data, bytes):
+                        self.assertEqual(actual_frame.data, expected_frame.data)
+                    else:
+                        np.testing.assert_array_equal(actual_frame.data, expected_frame.data)
@@ -656,7 +656,8 @@ class _DataGetter(metaclass=ABCMeta):
     "The number of significant bytes from the chunk header, used for checksum computation"
 
     def _get_chunk_checksum(self, chunk_data: DataWithMeta) -> str:
-        data = chunk_data.data.getbuffer()
+        # getvalue() doesn't copy the data, unlike getbuffer() on a buffer that is already shared
+        data = chunk_data.data.getvalue()
         size_checksum = zlib.crc32(str(len(data)).encode())
         return str(zlib.crc32(data[: self._CHUNK_HEADER_BYTES_LENGTH], size_checksum))
 
@@ -837,6 +838,7 @@ class _JobDataGetter(_DataGetter):
         data_num: Optional[Union[str, int]] = None,
         data_index: Optional[Union[str, int]] = None,
         response_type: str = "binary",
+        user_id: Optional[int] = None,
     ) -> None:
         possible_data_type_values = ("chunk", "frame", "preview", "context_image")
         possible_quality_values = ("compressed", "original")
@@ -869,6 +871,7 @@ class _JobDataGetter(_DataGetter):
         )
 
         self._db_job = db_job
+        self._user_id = user_id
 
     def _get_frame_provider(self) -> JobFrameProvider:
         return JobFrameProvider(self._db_job)
@@ -883,6 +886,11 @@ class _JobDataGetter(_DataGetter):
                     data = frame_provider.get_chunk(
                         self.index, quality=self.quality, is_task_chunk=False
                     )
+
+                    if self._user_id is not None:
+                        frame_provider.prefetch_chunks(
+                            self.index, quality=self.quality, user_id=self._user_id
+                        )
                 else:
                     data = frame_provider.get_chunk(
                         self.number, quality=self.quality, is_task_chunk=True
@@ -2366,6 +2374,7 @@ class JobViewSet(viewsets.GenericViewSet, mixins.ListModelMixin, mixins.CreateMo
             data_index=data_index,
             data_num=data_num,
             response_type=response_type,
+            user_id=request.user.id,
         )
         return data_getter()
 
@@ -422,17 +422,36 @@ def handle_delete(scope, instance, store_in_deletion_cache=False, **kwargs):
     )
 
 
-def handle_annotations_change(instance: Job, annotations, action, **kwargs):
+def handle_annotations_change(
+    instance: Job, annotations, action, *, previous_tracks: Optional[list] = None, **kwargs
+):
+    """
+    previous_tracks: the current state of the job tracks, if it's known to the caller.
+        It's used to count the changes in visible shapes of the updated tracks.
+        If not specified, the updated tracks are read from the DB.
+    """
+
     def filter_data(data):
         return {
             "id": data["id"],
         }
 
+    stop_frame = instance.segment.stop_frame
+
     in_mem_counter = TracksCounter()
-    in_mem_counter.load_tracks_from_job(instance.id, annotations.get("tracks", []))
+    in_mem_counter.load_tracks_from_job(
+        instance.id, annotations.get("tracks", []), stop_frame=stop_frame
+    )
 
     in_db_counter = TracksCounter()
-    if action == "update" and annotations.get("tracks", []):
+    if action == "update" and annotations.get("tracks", []) and previous_tracks is not None:
+        updated_track_ids = set(track["id"] for track in annotations["tracks"])
+        in_db_counter.load_tracks_from_job(
+            instance.id,
+            [track for track in previous_tracks if track["id"] in updated_track_ids],
+            stop_frame=stop_frame,
+        )
+    elif action == "update" and annotations.get("tracks", []):
         in_db_counter.load_tracks_from_db(
             parent_labeledtrack_qs_filter=lambda x: x.filter(
                 pk__in=(track["id"] for track in annotations["tracks"])
@@ -10,8 +10,8 @@ from rest_framework.exceptions import PermissionDenied
 
 from cvat.apps.engine.permissions import DownloadExportedExtension
 from cvat.apps.engine.types import ExtendedRequest
+from cvat.apps.iam.opa import query_opa
 from cvat.apps.iam.permissions import OpenPolicyAgentPermission, StrEnum
-from cvat.utils.http import make_requests_session
 
 
 class EventsPermission(OpenPolicyAgentPermission, DownloadExportedExtension):
@@ -41,9 +41,7 @@ class EventsPermission(OpenPolicyAgentPermission, DownloadExportedExtension):
 
     def filter(self, query_params: dict[str, Any]):
         url = self.url.replace("/allow", "/filter")
-
-        with make_requests_session() as session:
-            r = session.post(url, json=self.payload).json()["result"]
+        r = query_opa(url, self.payload)
 
         filter_params = query_params.copy()
         for query in r:
@@ -10,6 +10,8 @@ class HealthConfig(AppConfig):
     name = "cvat.apps.health"
 
     def ready(self):
-        from .backends import OPAHealthCheck
+        from .backends import LocalMediaCacheStatsCheck, OpaDecisionCacheStatsCheck, OPAHealthCheck
 
         plugin_dir.register(OPAHealthCheck)
+        plugin_dir.register(LocalMediaCacheStatsCheck)
+        plugin_dir.register(OpaDecisionCacheStatsCheck)
@@ -2,11 +2,15 @@
 #
 # SPDX-License-Identifier: MIT
 
+from typing import Optional
+
 import requests
 from django.conf import settings
 from health_check.backends import BaseHealthCheckBackend
 from health_check.exceptions import HealthCheckException
 
+from cvat.apps.engine.cache import MediaCache
+from cvat.apps.iam.opa import get_decision_cache
 from cvat.utils.http import make_requests_session
 
 
@@ -24,3 +28,48 @@ class OPAHealthCheck(BaseHealthCheckBackend):
 
     def identifier(self):
         return self.__class__.__name__
+
+
+class _LocalCacheStatsCheck(BaseHealthCheckBackend):
+    """
+    Reports the stats of a process-local cache in the status.
+    The stats only include the requests to the process that handles the health check.
+    """
+
+    critical_service = False
+
+    def get_stats(self) -> Optional[dict[str, int | float]]:
+        raise NotImplementedError
+
+    def check_status(self):
+        pass
+
+    def pretty_status(self):
+        if self.errors:
+            return super().pretty_status()
+
+        stats = self.get_stats()
+        if stats is None:
+            return "disabled"
+
+        return ", ".join(
+            f"{name}: {value:.3f}" if isinstance(value, float) else f"{name}: {value}"
+            for name, value in stats.items()
+        )
+
+    def identifier(self):
+        return self.__class__.__name__
+
+
+class LocalMediaCacheStatsCheck(_LocalCacheStatsCheck):
+    def get_stats(self):
+        return MediaCache.get_local_cache_stats()
+
+
+class OpaDecisionCacheStatsCheck(_LocalCacheStatsCheck):
+    def get_stats(self):
+        decision_cache = get_decision_cache()
+        if decision_cache is None:
+            return None
+
+        return decision_cache.get_stats()
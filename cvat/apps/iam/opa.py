@@ -0,0 +1,157 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import requests
+from django.conf import settings
+
+from cvat.utils.http import make_requests_session
+
+
+class OpaDecisionCache:
+    """
+    A process-local LRU cache for OPA decisions.
+
+    OPA decisions depend only on the rules and the request payload, which includes
+    everything known about the user, the organization and the resource. So, the payload
+    is used as the key, and the items are only kept for a short time, to avoid using
+    outdated decisions after the rules are updated.
+    """
+
+    def __init__(self, *, max_size: int, ttl: float):
+        self._max_size = max_size
+        self._ttl = ttl
+
+        # key -> (result, OPA latency, expiration time)
+        self._items: OrderedDict[str, tuple[Any, float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.saved_time = 0.0
+        self.opa_time = 0.0
+
+    @staticmethod
+    def make_key(url: str, payload: dict) -> str:
+        canonical_payload = json.dumps(
+            [url, payload], sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.blake2b(canonical_payload.encode(), digest_size=16).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return False, None
+
+            result, latency, expires_at = item
+            if expires_at <= time.monotonic():
+                del self._items[key]
+                self.misses += 1
+                return False, None
+
+            self._items.move_to_end(key)
+            self.hits += 1
+            self.saved_time += latency
+
+        return True, result
+
+    def set(self, key: str, result: Any, *, latency: float) -> None:
+        with self._lock:
+            self.opa_time += latency
+
+            self._items.pop(key, None)
+            while self._items and self._max_size <= len(self._items):
+                self._items.popitem(last=False)
+
+            self._items[key] = (result, latency, time.monotonic() + self._ttl)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def get_stats(self) -> dict[str, int | float]:
+        with self._lock:
+            requests_count = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests_count if requests_count else 0.0,
+                "items": len(self._items),
+                "opa_time": self.opa_time,
+                "saved_time": self.saved_time,
+            }
+
+
+_decision_cache: OpaDecisionCache | None = None
+_decision_cache_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_decision_cache() -> OpaDecisionCache | None:
+    global _decision_cache
+
+    if settings.IAM_OPA_DECISION_CACHE_TTL <= 0 or settings.IAM_OPA_DECISION_CACHE_MAX_SIZE <= 0:
+        return None
+
+    if _decision_cache is None:
+        with _decision_cache_lock:
+            if _decision_cache is None:
+                _decision_cache = OpaDecisionCache(
+                    max_size=settings.IAM_OPA_DECISION_CACHE_MAX_SIZE,
+                    ttl=settings.IAM_OPA_DECISION_CACHE_TTL,
+                )
+
+    return _decision_cache
+
+
+def clear_decision_cache(*args, **kwargs) -> None:
+    if (decision_cache := get_decision_cache()) is not None:
+        decision_cache.clear()
+
+
+def _get_session() -> requests.Session:
+    # requests.Session is not guaranteed to be thread-safe, so each thread has its own session.
+    # Keeping the session allows reusing connections to OPA between the permission checks.
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = make_requests_session()
+        _local.session = session
+
+    return session
+
+
+def query_opa(url: str, payload: dict) -> Any:
+    """
+    Returns the result of the OPA query.
+    The results are cached for a short time, so equal queries don't go to OPA repeatedly.
+    """
+
+    decision_cache = get_decision_cache()
+    if decision_cache is not None:
+        key = decision_cache.make_key(url, payload)
+        found, result = decision_cache.get(key)
+        if found:
+            return result
+
+    started_at = time.perf_counter()
+    result = _get_session().post(url, json=payload).json()["result"]
+    latency = time.perf_counter() - started_at
+
+    if decision_cache is not None:
+        decision_cache.set(key, result, latency=latency)
+
+    return result
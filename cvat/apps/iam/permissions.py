@@ -22,8 +22,8 @@ from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import BasePermission
 
 from cvat.apps.organizations.models import Membership, Organization
-from cvat.utils.http import make_requests_session
 
+from .opa import query_opa
 from .utils import add_opa_rules_path
 
 if TYPE_CHECKING:
@@ -220,9 +220,7 @@ class OpenPolicyAgentPermission(metaclass=ABCMeta):
             setattr(self, name, val)
 
     def check_access(self) -> PermissionResult:
-        with make_requests_session() as session:
-            response = session.post(self.url, json=self.payload)
-            output = response.json()["result"]
+        output = query_opa(self.url, self.payload)
 
         allow = False
         reasons = []
@@ -238,9 +236,7 @@ class OpenPolicyAgentPermission(metaclass=ABCMeta):
 
     def filter(self, queryset):
         url = self.url.replace("/allow", "/filter")
-
-        with make_requests_session() as session:
-            r = session.post(url, json=self.payload).json()["result"]
+        r = query_opa(url, self.payload)
 
         q_objects = []
         ops_dict = {
@@ -4,7 +4,11 @@
 
 from django.conf import settings
 from django.contrib.auth.models import Group, User
-from django.db.models.signals import post_migrate, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
+
+from cvat.apps.organizations.models import Membership, Organization
+
+from .opa import clear_decision_cache
 
 
 def register_groups(sender, **kwargs):
@@ -62,6 +66,15 @@ elif settings.IAM_TYPE == "LDAP":
 
 def register_signals(app_config):
     post_migrate.connect(register_groups, app_config)
+
+    # Cached OPA decisions are keyed by the full request payload, which includes roles and
+    # ownership, so they can't be reused after such changes. Clearing the cache just releases
+    # the decisions that can't be used anymore in the current process.
+    for sender in (Membership, Organization):
+        post_save.connect(clear_decision_cache, sender=sender)
+        post_delete.connect(clear_decision_cache, sender=sender)
+    m2m_changed.connect(clear_decision_cache, sender=User.groups.through)
+
     if settings.IAM_TYPE == "BASIC":
         # Add default groups and add admin rights to super users.
         post_save.connect(create_user, sender=User)
@@ -0,0 +1,73 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+import unittest
+from unittest import mock
+
+from cvat.apps.iam.opa import OpaDecisionCache
+
+
+class TestOpaDecisionCache(unittest.TestCase):
+    def test_can_get_decision(self):
+        cache = OpaDecisionCache(max_size=10, ttl=60)
+
+        cache.set("key", {"allow": True}, latency=0.5)
+
+        self.assertEqual(cache.get("key"), (True, {"allow": True}))
+        self.assertEqual(cache.get("other"), (False, None))
+        self.assertEqual(
+            cache.get_stats(),
+            {
+                "hits": 1,
+                "misses": 1,
+                "hit_rate": 0.5,
+                "items": 1,
+                "opa_time": 0.5,
+                "saved_time": 0.5,
+            },
+        )
+
+    def test_can_cache_falsy_decisions(self):
+        cache = OpaDecisionCache(max_size=10, ttl=60)
+
+        cache.set("key", False, latency=0)
+
+        self.assertEqual(cache.get("key"), (True, False))
+
+    def test_key_does_not_depend_on_payload_order(self):
+        self.assertEqual(
+            OpaDecisionCache.make_key("url", {"a": 1, "b": {"c": 2, "d": 3}}),
+            OpaDecisionCache.make_key("url", {"b": {"d": 3, "c": 2}, "a": 1}),
+        )
+        self.assertNotEqual(
+            OpaDecisionCache.make_key("url", {"a": 1}),
+            OpaDecisionCache.make_key("url", {"a": 2}),
+        )
+        self.assertNotEqual(
+            OpaDecisionCache.make_key("url/allow", {"a": 1}),
+            OpaDecisionCache.make_key("url/filter", {"a": 1}),
+        )
+
+    def test_can_evict_least_recently_used_decisions(self):
+        cache = OpaDecisionCache(max_size=2, ttl=60)
+        cache.set("a", True, latency=0)
+        cache.set("b", True, latency=0)
+        cache.get("a")
+
+        cache.set("c", True, latency=0)
+
+        self.assertTrue(cache.get("a")[0])
+        self.assertFalse(cache.get("b")[0])
+        self.assertTrue(cache.get("c")[0])
+
+    def test_can_expire_decisions(self):
+        cache = OpaDecisionCache(max_size=10, ttl=10)
+
+        with mock.patch("cvat.apps.iam.opa.time.monotonic", return_value=0):
+            cache.set("key", True, latency=0)
+
+        with mock.patch("cvat.apps.iam.opa.time.monotonic", return_value=10):
+            self.assertEqual(cache.get("key"), (False, None))
+
+        self.assertEqual(len(cache), 0)
@@ -6,6 +6,7 @@
 import json
 import os
 from collections import Counter, OrderedDict
+from copy import deepcopy
 from itertools import groupby
 from typing import Optional
 from unittest import mock, skip
@@ -1253,6 +1254,9 @@ class TestComplexFrameSetupCases(_LambdaTestCaseBase):
                 },
             ]
 
+            if "images" in payload:
+                data = [deepcopy(data) for _ in payload["images"]]
+
         return data
 
     def setUp(self):
@@ -1346,6 +1350,42 @@ class TestComplexFrameSetupCases(_LambdaTestCaseBase):
             },
         )
 
+    def test_can_run_offline_detector_function_with_batches(self):
+        function_annotations = functions["positive"][self.detector_function_id]["metadata"][
+            "annotations"
+        ]
+
+        data = self.common_request_data.copy()
+        with (
+            mock.patch.dict(function_annotations, {"max_batch_size": "3"}),
+            mock.patch(
+                "cvat.apps.lambda_manager.views.LambdaGateway.invoke",
+                side_effect=self._invoke_function,
+            ) as mock_invoke,
+        ):
+            self._run_offline_function(self.detector_function_id, data, self.user)
+
+        requested_frame_range = self.task_rel_frame_range
+        self.assertEqual(
+            [
+                len(requested_frame_range[i : i + 3])
+                for i in range(0, len(requested_frame_range), 3)
+            ],
+            [len(call.args[1]["images"]) for call in mock_invoke.call_args_list],
+        )
+
+        response = self._get_request(f'/api/tasks/{self.task["id"]}/annotations', self.admin)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        annotations = response.json()
+
+        self.assertEqual(
+            {frame: 1 for frame in requested_frame_range},
+            {
+                frame: len(list(group))
+                for frame, group in groupby(annotations["shapes"], key=lambda a: a["frame"])
+            },
+        )
+
     def test_can_run_offline_reid_function_on_whole_task(self):
         # Add starting shapes to be tracked on following frames
         requested_frame_range = self.task_rel_frame_range
@@ -1642,6 +1682,30 @@ class TestComplexFrameSetupCases(_LambdaTestCaseBase):
         annotations = response.json()
         self.assertEqual(1, len(annotations["shapes"]))
 
+    def test_can_run_online_detector_function_with_batches(self):
+        function_annotations = functions["positive"][self.detector_function_id]["metadata"][
+            "annotations"
+        ]
+
+        data = self.common_request_data.copy()
+        data["frame"] = self.task_rel_frame_range[4]
+
+        with (
+            mock.patch.dict(function_annotations, {"max_batch_size": "3"}),
+            mock.patch(
+                "cvat.apps.lambda_manager.views.LambdaGateway.invoke",
+                side_effect=self._invoke_function,
+            ) as mock_invoke,
+        ):
+            response = self._run_online_function(self.detector_function_id, data, self.user)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(1, len(mock_invoke.call_args.args[1]["images"]))
+        self.assertNotIn("image", mock_invoke.call_args.args[1])
+
+        annotations = response.json()
+        self.assertEqual(1, len(annotations["shapes"]))
+
     def test_can_run_online_function_on_invalid_task_frame(self):
         data = self.common_request_data.copy()
         requested_frame = self.task_rel_frame_range[-1] + 1
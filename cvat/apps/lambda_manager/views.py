@@ -9,6 +9,11 @@ import base64
 import json
 import os
 import textwrap
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from copy import deepcopy
 from datetime import timedelta
 from functools import wraps
@@ -245,6 +250,21 @@ class LambdaFunction:
         self.animated_gif = meta_anno.get("animated_gif", "")
         self.version = int(meta_anno.get("version", "1"))
         self.help_message = meta_anno.get("help_message", "")
+        # the maximum number of frames the function accepts in one request
+        self.max_batch_size = int(meta_anno.get("max_batch_size", "1"))
+        if self.max_batch_size < 1:
+            raise InvalidFunctionMetadataError(
+                f"{self.id!r} lambda function has invalid max batch size"
+            )
+        # the number of requests the function can process simultaneously
+        self.max_concurrent_requests = max(
+            1,
+            sum(
+                int(trigger.get("numWorkers") or trigger.get("maxWorkers") or 1)
+                for trigger in (data["spec"].get("triggers") or {}).values()
+                if trigger.get("kind") == "http"
+            ),
+        )
         self.gateway = gateway
 
         if "supported_shape_types" in meta_anno:
@@ -325,8 +345,234 @@ class LambdaFunction:
         threshold = data.get("threshold")
         if threshold:
             payload.update({"threshold": threshold})
-        mapping = data.get("mapping", {})
+        mapping = self._prepare_mapping(db_task, data.get("mapping"))
+
+        # Check job frame boundaries
+        if db_job:
+            task_data = db_task.data
+            data_start_frame = task_data.start_frame
+            step = task_data.get_frame_step()
+
+            for key, desc in self.FRAME_PARAMETERS:
+                if key not in data:
+                    continue
+
+                abs_frame_id = data_start_frame + data[key] * step
+                if not db_job.segment.contains_frame(abs_frame_id):
+                    raise ValidationError(
+                        f"The {desc} is outside the job range", code=status.HTTP_400_BAD_REQUEST
+                    )
+
+        if self.kind == FunctionKind.DETECTOR:
+            payload.update(
+                self._make_detector_images_payload(
+                    [self._get_image(db_task, mandatory_arg("frame"))]
+                )
+            )
+        elif self.kind == FunctionKind.INTERACTOR:
+            payload.update(
+                {
+                    "image": self._get_image(db_task, mandatory_arg("frame")),
+                    "pos_points": mandatory_arg("pos_points"),
+                    "neg_points": mandatory_arg("neg_points"),
+                    "obj_bbox": data.get("obj_bbox", None),
+                }
+            )
+        elif self.kind == FunctionKind.REID:
+            payload.update(
+                {
+                    "image0": self._get_image(db_task, mandatory_arg("frame0")),
+                    "image1": self._get_image(db_task, mandatory_arg("frame1")),
+                    "boxes0": mandatory_arg("boxes0"),
+                    "boxes1": mandatory_arg("boxes1"),
+                }
+            )
+            max_distance = data.get("max_distance")
+            if max_distance:
+                payload.update({"max_distance": max_distance})
+        elif self.kind == FunctionKind.TRACKER:
+            signer = TimestampSigner(salt=f"cvat-tracker-state:{self.id}")
+
+            def prepare_shape(shape):
+                if shape is None:
+                    return None
+
+                supported_shape_types = self.supported_shape_types or [ShapeType.RECTANGLE]
+                if shape["type"] not in supported_shape_types:
+                    raise ValidationError(
+                        f"This function does not support shapes of type {shape['type']!r}"
+                    )
+
+                if self.supported_shape_types is None:
+                    # If the function does not declare supported shape types,
+                    # it uses the legacy behavior where "shapes" only contains point arrays
+                    # and the "rectangle" type is implied.
+                    return shape["points"]
+
+                return shape
+
+            try:
+                if "states" not in data:
+                    # initializing tracking
+                    shapes = mandatory_arg("shapes")
+                    states = []
+                elif "shapes" not in data:
+                    # continuing tracking
+                    states = mandatory_arg("states")
+
+                    # Previously, the UI used to pass the previous-frame shapes when continuing
+                    # tracking. It doesn't do that anymore, but to support old tracking functions
+                    # that rely on the length of the "shapes" array, we'll pad it out with nulls.
+                    # If a function relies on the _contents_ of the "shapes" array, it will not
+                    # work anymore.
+                    shapes = [None] * len(states)
+                else:
+                    # We should not normally get here, but it's possible if e.g. someone is still
+                    # running an old UI version.
+                    states = data["states"]
+                    shapes = data["shapes"]
+
+                payload.update(
+                    {
+                        "image": self._get_image(db_task, mandatory_arg("frame")),
+                        "shapes": list(map(prepare_shape, shapes)),
+                        "states": [
+                            (
+                                None
+                                if state is None
+                                else json.loads(
+                                    signer.unsign(state, max_age=self.TRACKER_STATE_MAX_AGE)
+                                )
+                            )
+                            for state in states
+                        ],
+                    }
+                )
+            except BadSignature as ex:
+                raise ValidationError("Invalid or expired tracker state") from ex
+        else:
+            raise ValidationError(
+                "`{}` lambda function has incorrect type: {}".format(self.id, self.kind),
+                code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        if is_interactive and request:
+            interactive_function_call_signal.send(sender=self, request=request)
+
+        response = self.gateway.invoke(self, payload)
+
+        if self.kind == FunctionKind.DETECTOR:
+            response = converter.convert(
+                conv_mask_to_poly=data.get("conv_mask_to_poly", False),
+                frame=mandatory_arg("frame"),
+                annotations=self._filter_detector_response(
+                    self._split_detector_response(response, 1)[0], mapping
+                ),
+            )
+        elif self.kind == FunctionKind.TRACKER:
+            if "shapes" in response and not self.supported_shape_types:
+                response["shapes"] = [
+                    None if points is None else {"type": ShapeType.RECTANGLE, "points": points}
+                    for points in response["shapes"]
+                ]
+            response["states"] = [
+                # We could've used .sign_object, but that unconditionally applies
+                # an extra layer of Base64 encoding, bloating each state by 33%.
+                # So we just encode the state manually instead.
+                signer.sign(json.dumps(state, separators=(",", ":")))
+                for state in response["states"]
+            ]
+
+        return response
+
+    def iterate_detections(
+        self,
+        db_task: Task,
+        frames: Iterable[int],
+        *,
+        mapping: Optional[dict],
+        threshold: Optional[float],
+        conv_mask_to_poly: bool,
+        converter: DetectionResultConverter,
+    ) -> Iterator[tuple[int, dict]]:
+        """
+        Runs the detector on the frames and yields the results in the order of frames.
+
+        Frames for the next requests are decoded while the previous requests are
+        being processed by the function. If the function declares batch support,
+        several frames are sent in a single request.
+        """
+        assert self.kind == FunctionKind.DETECTOR
+
+        mapping = self._prepare_mapping(db_task, mapping)
+        frame_provider = TaskFrameProvider(db_task)
+        max_requests = min(settings.NUCLIO["MAX_CONCURRENT_REQUESTS"], self.max_concurrent_requests)
+        max_requests = max(1, max_requests)
+
+        def make_payload(batch: list[int]) -> dict:
+            images = [
+                self._get_image(db_task, frame, frame_provider=frame_provider) for frame in batch
+            ]
+
+            payload = self._make_detector_images_payload(images)
+            if threshold:
+                payload["threshold"] = threshold
+
+            return payload
+
+        def get_results(batch: list[int], request: Future) -> Iterator[tuple[int, dict]]:
+            response = self._split_detector_response(request.result(), len(batch))
+
+            for frame, frame_response in zip(batch, response):
+                yield frame, converter.convert(
+                    conv_mask_to_poly=conv_mask_to_poly,
+                    frame=frame,
+                    annotations=self._filter_detector_response(frame_response, mapping),
+                )
+
+        # Only the function calls are done in the worker threads,
+        # the DB is only accessed from the calling thread
+        with ThreadPoolExecutor(max_workers=max_requests) as executor:
+            requests_in_progress = deque()
+
+            try:
+                for batch in take_by(frames, self.max_batch_size):
+                    requests_in_progress.append(
+                        (batch, executor.submit(self.gateway.invoke, self, make_payload(batch)))
+                    )
 
+                    # Keep one more request prepared, so that it can be sent
+                    # as soon as any of the running requests is finished
+                    if len(requests_in_progress) > max_requests:
+                        yield from get_results(*requests_in_progress.popleft())
+
+                while requests_in_progress:
+                    yield from get_results(*requests_in_progress.popleft())
+            finally:
+                for _, request in requests_in_progress:
+                    request.cancel()
+
+    def _make_detector_images_payload(self, images: list[str]) -> dict:
+        # Functions with batch support always get a list of images,
+        # even if a single frame is requested
+        if self.max_batch_size > 1:
+            return {"images": images}
+
+        return {"image": images[0]}
+
+    def _split_detector_response(self, response: Any, image_count: int) -> list:
+        if self.max_batch_size > 1:
+            if not isinstance(response, list) or len(response) != image_count:
+                raise ValidationError(
+                    "`{}` lambda function returned an unexpected number of results".format(self.id),
+                    code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                )
+
+            return response
+
+        return [response]
+
+    def _prepare_mapping(self, db_task: Task, mapping: Optional[dict]) -> dict:
         model_labels = self.labels
         task_labels = db_task.get_labels(prefetch=True)
 
@@ -449,116 +695,9 @@ class LambdaFunction:
 
         mapping = update_mapping(mapping, self.labels, task_labels)
 
-        # Check job frame boundaries
-        if db_job:
-            task_data = db_task.data
-            data_start_frame = task_data.start_frame
-            step = task_data.get_frame_step()
-
-            for key, desc in self.FRAME_PARAMETERS:
-                if key not in data:
-                    continue
-
-                abs_frame_id = data_start_frame + data[key] * step
-                if not db_job.segment.contains_frame(abs_frame_id):
-                    raise ValidationError(
-                        f"The {desc} is outside the job range", code=status.HTTP_400_BAD_REQUEST
-                    )
-
-        if self.kind == FunctionKind.DETECTOR:
-            payload.update({"image": self._get_image(db_task, mandatory_arg("frame"))})
-        elif self.kind == FunctionKind.INTERACTOR:
-            payload.update(
-                {
-                    "image": self._get_image(db_task, mandatory_arg("frame")),
-                    "pos_points": mandatory_arg("pos_points"),
-                    "neg_points": mandatory_arg("neg_points"),
-                    "obj_bbox": data.get("obj_bbox", None),
-                }
-            )
-        elif self.kind == FunctionKind.REID:
-            payload.update(
-                {
-                    "image0": self._get_image(db_task, mandatory_arg("frame0")),
-                    "image1": self._get_image(db_task, mandatory_arg("frame1")),
-                    "boxes0": mandatory_arg("boxes0"),
-                    "boxes1": mandatory_arg("boxes1"),
-                }
-            )
-            max_distance = data.get("max_distance")
-            if max_distance:
-                payload.update({"max_distance": max_distance})
-        elif self.kind == FunctionKind.TRACKER:
-            signer = TimestampSigner(salt=f"cvat-tracker-state:{self.id}")
-
-            def prepare_shape(shape):
-                if shape is None:
-                    return None
-
-                supported_shape_types = self.supported_shape_types or [ShapeType.RECTANGLE]
-                if shape["type"] not in supported_shape_types:
-                    raise ValidationError(
-                        f"This function does not support shapes of type {shape['type']!r}"
-                    )
-
-                if self.supported_shape_types is None:
-                    # If the function does not declare supported shape types,
-                    # it uses the legacy behavior where "shapes" only contains point arrays
-                    # and the "rectangle" type is implied.
-                    return shape["points"]
-
-                return shape
-
-            try:
-                if "states" not in data:
-                    # initializing tracking
-                    shapes = mandatory_arg("shapes")
-                    states = []
-                elif "shapes" not in data:
-                    # continuing tracking
-                    states = mandatory_arg("states")
-
-                    # Previously, the UI used to pass the previous-frame shapes when continuing
-                    # tracking. It doesn't do that anymore, but to support old tracking functions
-                    # that rely on the length of the "shapes" array, we'll pad it out with nulls.
-                    # If a function relies on the _contents_ of the "shapes" array, it will not
-                    # work anymore.
-                    shapes = [None] * len(states)
-                else:
-                    # We should not normally get here, but it's possible if e.g. someone is still
-                    # running an old UI version.
-                    states = data["states"]
-                    shapes = data["shapes"]
-
-                payload.update(
-                    {
-                        "image": self._get_image(db_task, mandatory_arg("frame")),
-                        "shapes": list(map(prepare_shape, shapes)),
-                        "states": [
-                            (
-                                None
-                                if state is None
-                                else json.loads(
-                                    signer.unsign(state, max_age=self.TRACKER_STATE_MAX_AGE)
-                                )
-                            )
-                            for state in states
-                        ],
-                    }
-                )
-            except BadSignature as ex:
-                raise ValidationError("Invalid or expired tracker state") from ex
-        else:
-            raise ValidationError(
-                "`{}` lambda function has incorrect type: {}".format(self.id, self.kind),
-                code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
-
-        if is_interactive and request:
-            interactive_function_call_signal.send(sender=self, request=request)
-
-        response = self.gateway.invoke(self, payload)
+        return mapping
 
+    def _filter_detector_response(self, response: list, mapping: dict) -> list:
         def check_attr_value(value, db_attr):
             if db_attr is None:
                 return False
@@ -593,58 +732,37 @@ class LambdaFunction:
                     attributes.append({"name": db_attr["name"], "value": attr["value"]})
             return attributes
 
-        if self.kind == FunctionKind.DETECTOR:
-            response_filtered = []
-
-            for item in response:
-                item_label = item["label"]
-                if item_label not in mapping:
-                    continue
-                db_label = mapping[item_label]["db_label"]
-                item["label"] = db_label.name
-                item["attributes"] = transform_attributes(
-                    item.get("attributes", {}),
-                    mapping[item_label]["attributes"],
-                    db_label.attributespec_set.values(),
-                )
-
-                if "elements" in item:
-                    sublabels = mapping[item_label]["sublabels"]
-                    item["elements"] = [x for x in item["elements"] if x["label"] in sublabels]
-                    for element in item["elements"]:
-                        element_label = element["label"]
-                        db_label = sublabels[element_label]["db_label"]
-                        element["label"] = db_label.name
-                        element["attributes"] = transform_attributes(
-                            element.get("attributes", {}),
-                            sublabels[element_label]["attributes"],
-                            db_label.attributespec_set.values(),
-                        )
-                response_filtered.append(item)
-
-            response = converter.convert(
-                conv_mask_to_poly=data.get("conv_mask_to_poly", False),
-                frame=mandatory_arg("frame"),
-                annotations=response_filtered,
+        response_filtered = []
+        for item in response:
+            item_label = item["label"]
+            if item_label not in mapping:
+                continue
+            db_label = mapping[item_label]["db_label"]
+            item["label"] = db_label.name
+            item["attributes"] = transform_attributes(
+                item.get("attributes", {}),
+                mapping[item_label]["attributes"],
+                db_label.attributespec_set.values(),
             )
-        elif self.kind == FunctionKind.TRACKER:
-            if "shapes" in response and not self.supported_shape_types:
-                response["shapes"] = [
-                    None if points is None else {"type": ShapeType.RECTANGLE, "points": points}
-                    for points in response["shapes"]
-                ]
-            response["states"] = [
-                # We could've used .sign_object, but that unconditionally applies
-                # an extra layer of Base64 encoding, bloating each state by 33%.
-                # So we just encode the state manually instead.
-                signer.sign(json.dumps(state, separators=(",", ":")))
-                for state in response["states"]
-            ]
 
-        return response
+            if "elements" in item:
+                sublabels = mapping[item_label]["sublabels"]
+                item["elements"] = [x for x in item["elements"] if x["label"] in sublabels]
+                for element in item["elements"]:
+                    element_label = element["label"]
+                    db_label = sublabels[element_label]["db_label"]
+                    element["label"] = db_label.name
+                    element["attributes"] = transform_attributes(
+                        element.get("attributes", {}),
+                        sublabels[element_label]["attributes"],
+                        db_label.attributespec_set.values(),
+                    )
+            response_filtered.append(item)
 
-    def _get_image(self, db_task, frame):
-        frame_provider = TaskFrameProvider(db_task)
+        return response_filtered
+
+    def _get_image(self, db_task, frame, *, frame_provider: Optional[TaskFrameProvider] = None):
+        frame_provider = frame_provider or TaskFrameProvider(db_task)
         image = frame_provider.get_frame(frame)
 
         return base64.b64encode(image.data.getvalue()).decode("utf-8")
@@ -878,6 +996,11 @@ class DetectionResultConverter:
 
 
 class DetectionResultCollector:
+    # Results are saved in portions. It is an optimization to make fewer calls
+    # to the DB, while the results appear gradually and are not kept in memory.
+    MAX_BUFFERED_FRAMES = 100
+    FLUSH_INTERVAL = timedelta(seconds=30)
+
     def __init__(self, task: Task, job: Optional[Job]) -> None:
         self._task = task
         self._job = job
@@ -887,17 +1010,22 @@ class DetectionResultCollector:
     def add(self, data: dict) -> None:
         self._data["tags"] += data["tags"]
         self._data["shapes"] += data["shapes"]
+        self._buffered_frames += 1
 
         assert not data["tracks"]
 
-    def submit(self):
-        if self._is_empty():
-            return
+        if (
+            self._buffered_frames >= self.MAX_BUFFERED_FRAMES
+            or time.monotonic() - self._last_submit_time >= self.FLUSH_INTERVAL.total_seconds()
+        ):
+            self.submit()
 
-        if self._job:
-            dm.task.patch_job_data(self._job.id, self._data, PatchAction.CREATE)
-        else:
-            dm.task.patch_task_data(self._task.id, self._data, PatchAction.CREATE)
+    def submit(self):
+        if not self._is_empty():
+            if self._job:
+                dm.task.patch_job_data(self._job.id, self._data, PatchAction.CREATE)
+            else:
+                dm.task.patch_task_data(self._task.id, self._data, PatchAction.CREATE)
 
         self._reset()
 
@@ -909,6 +1037,8 @@ class DetectionResultCollector:
         s.is_valid(raise_exception=True)
 
         self._data = s.validated_data
+        self._buffered_frames = 0
+        self._last_submit_time = time.monotonic()
 
 
 class LambdaJob:
@@ -991,35 +1121,27 @@ class LambdaJob:
 
         converter = DetectionResultConverter(db_task)
 
-        frame_set = cls._get_frame_set(db_task, db_job)
-
-        for frame in frame_set:
-            if frame in db_task.data.deleted_frames:
-                continue
+        deleted_frames = set(db_task.data.deleted_frames)
+        frame_set = [
+            frame for frame in cls._get_frame_set(db_task, db_job) if frame not in deleted_frames
+        ]
 
-            annotations = function.invoke(
+        with closing(
+            function.iterate_detections(
                 db_task,
-                db_job=db_job,
-                data={
-                    "frame": frame,
-                    "mapping": mapping,
-                    "threshold": threshold,
-                    "conv_mask_to_poly": conv_mask_to_poly,
-                },
+                frame_set,
+                mapping=mapping,
+                threshold=threshold,
+                conv_mask_to_poly=conv_mask_to_poly,
                 converter=converter,
             )
+        ) as detections:
+            for frame, annotations in detections:
+                progress = (frame + 1) / db_task.data.size
+                if not cls._update_progress(progress):
+                    break
 
-            progress = (frame + 1) / db_task.data.size
-            if not cls._update_progress(progress):
-                break
-
-            collector.add(annotations)
-
-            # Accumulate data during 100 frames before submitting results.
-            # It is optimization to make fewer calls to our server. Also
-            # it isn't possible to keep all results in memory.
-            if frame and frame % 100 == 0:
-                collector.submit()
+                collector.add(annotations)
 
         collector.submit()
 
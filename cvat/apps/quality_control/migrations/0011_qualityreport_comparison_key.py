@@ -0,0 +1,18 @@
+# Generated by Django 4.2.20 on 2025-06-02 10:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("quality_control", "0010_qualityreport_quality_report_job_or_task_or_project"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="qualityreport",
+            name="comparison_key",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+    ]
@@ -115,6 +115,9 @@ class QualityReport(models.Model):
 
     data = models.JSONField()
 
+    # a digest of the comparison inputs, used to find job reports that can be reused
+    comparison_key = models.CharField(max_length=64, null=True, blank=True)
+
     conflicts: models.manager.RelatedManager[AnnotationConflict]
 
     class Meta:
@@ -4,8 +4,12 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import hashlib
 import itertools
+import json
 import math
+import multiprocessing
 from abc import ABCMeta
 from collections import Counter
 from collections.abc import Hashable, Sequence
@@ -967,6 +971,26 @@ ShapeSimilarityFunction = Callable[
     [_ShapeT1, _ShapeT2], float
 ]  # (shape1, shape2) -> [0; 1], returns 0 for mismatches, 1 for matches
 LabelEqualityFunction = Callable[[_ShapeT1, _ShapeT2], bool]
+BboxCoords = tuple[float, float, float, float]  # (x, y, w, h)
+
+
+class ShapeDistances(dict):
+    """
+    Similarities of the compared shapes: (id(a), id(b)) -> similarity.
+
+    When shapes are matched using a spatial index, the shapes with disjoint bboxes
+    are not compared. Such comparisons are recorded in pruned_comparisons, as the ids of
+    the compared shapes from both sides. Their pairs missing in the dict have 0 similarity.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pruned_comparisons: list[tuple[frozenset[int], frozenset[int]]] = []
+
+
+BboxFunctions = tuple[
+    Callable[[_ShapeT1], BboxCoords], Callable[[_ShapeT2], BboxCoords]
+]  # (a shape bbox function, b shape bbox function)
 SegmentMatchingResult = tuple[
     list[tuple[_ShapeT1, _ShapeT2]],  # matches
     list[tuple[_ShapeT1, _ShapeT2]],  # mismatches
@@ -982,13 +1006,27 @@ def match_segments(
     distance: ShapeSimilarityFunction[_ShapeT1, _ShapeT2],
     dist_thresh: float = 1.0,
     label_matcher: LabelEqualityFunction[_ShapeT1, _ShapeT2] = lambda a, b: a.label == b.label,
+    get_bboxes: BboxFunctions[_ShapeT1, _ShapeT2] | None = None,
 ) -> SegmentMatchingResult[_ShapeT1, _ShapeT2]:
     # Comparing to the dm version, this one changes the algorithm to match shapes first
     # label comparison is only used to distinguish between matches and mismatches
 
+    # If get_bboxes is passed, the distance is expected to be 0 or less for shapes with
+    # disjoint bboxes. Only the shapes with overlapping bboxes are compared then.
+
     assert callable(distance), distance
     assert callable(label_matcher), label_matcher
 
+    if get_bboxes is not None:
+        return _match_segments_with_bboxes(
+            a_segms,
+            b_segms,
+            distance=distance,
+            dist_thresh=dist_thresh,
+            label_matcher=label_matcher,
+            get_bboxes=get_bboxes,
+        )
+
     max_anns = max(len(a_segms), len(b_segms))
     distances = np.array(
         [
@@ -1038,6 +1076,170 @@ def match_segments(
     return matches, mispred, a_unmatched, b_unmatched
 
 
+def _match_segments_with_bboxes(
+    a_segms: Sequence[_ShapeT1],
+    b_segms: Sequence[_ShapeT2],
+    *,
+    distance: ShapeSimilarityFunction[_ShapeT1, _ShapeT2],
+    dist_thresh: float,
+    label_matcher: LabelEqualityFunction[_ShapeT1, _ShapeT2],
+    get_bboxes: BboxFunctions[_ShapeT1, _ShapeT2],
+) -> SegmentMatchingResult[_ShapeT1, _ShapeT2]:
+    # Only the shapes with overlapping bboxes are compared, and only the pairs passing
+    # the threshold can be matched. All the other pairs would have the cost 1 in the full
+    # cost matrix, so the assignment can be solved separately for each connected group
+    # of such pairs, which gives the same total cost.
+    get_a_bbox, get_b_bbox = get_bboxes
+    a_indices, b_indices = _find_overlapping_bboxes(
+        [get_a_bbox(a) for a in a_segms], [get_b_bbox(b) for b in b_segms]
+    )
+    a_indices = np.array(a_indices, dtype=int)
+    b_indices = np.array(b_indices, dtype=int)
+    costs = np.array(
+        [
+            1 - distance(a_segms[a_idx], b_segms[b_idx])
+            for a_idx, b_idx in zip(a_indices, b_indices)
+        ],
+        dtype=float,
+    )
+    candidates = np.isfinite(costs) & (costs <= 1 - dist_thresh) & (costs < 1)
+
+    matches = []
+    mispred = []
+    a_matched = set()
+    b_matched = set()
+    for a_idx, b_idx in _solve_sparse_assignment(
+        a_indices[candidates], b_indices[candidates], costs[candidates]
+    ):
+        a_ann = a_segms[a_idx]
+        b_ann = b_segms[b_idx]
+        if label_matcher(a_ann, b_ann):
+            matches.append((a_ann, b_ann))
+        else:
+            mispred.append((a_ann, b_ann))
+
+        a_matched.add(a_idx)
+        b_matched.add(b_idx)
+
+    a_unmatched = [a for a_idx, a in enumerate(a_segms) if a_idx not in a_matched]
+    b_unmatched = [b for b_idx, b in enumerate(b_segms) if b_idx not in b_matched]
+
+    return matches, mispred, a_unmatched, b_unmatched
+
+
+def _solve_sparse_assignment(
+    a_indices: np.ndarray, b_indices: np.ndarray, costs: np.ndarray
+) -> list[tuple[int, int]]:
+    """
+    Solves the assignment problem for the listed pairs, the other pairs can't be assigned.
+    The problem is solved separately for each connected group of the pairs. The groups,
+    their rows and columns are ordered by the indices, so the ties are always resolved
+    in the same way for the same input.
+
+    Returns the assigned pairs, ordered by the a index.
+    """
+
+    if not len(costs):
+        return []
+
+    # Union-find over the a and the b indices, the b indices are shifted to be distinct
+    b_offset = int(a_indices.max()) + 1
+    parents: dict[int, int] = {}
+
+    def find(node: int) -> int:
+        root = parents.setdefault(node, node)
+        while root != parents[root]:
+            root = parents[root]
+
+        while node != root:
+            parents[node], node = root, parents[node]
+
+        return root
+
+    for a_idx, b_idx in zip(a_indices.tolist(), b_indices.tolist()):
+        a_root = find(a_idx)
+        b_root = find(b_offset + b_idx)
+        if a_root != b_root:
+            parents[max(a_root, b_root)] = min(a_root, b_root)
+
+    groups: dict[int, list[int]] = {}
+    for pair_idx, a_idx in enumerate(a_indices.tolist()):
+        groups.setdefault(find(a_idx), []).append(pair_idx)
+
+    assigned_pairs = []
+    for group_root in sorted(groups):
+        group_pairs = groups[group_root]
+        group_a_indices, group_rows = np.unique(a_indices[group_pairs], return_inverse=True)
+        group_b_indices, group_cols = np.unique(b_indices[group_pairs], return_inverse=True)
+
+        group_costs = np.ones((len(group_a_indices), len(group_b_indices)))
+        group_costs[group_rows, group_cols] = costs[group_pairs]
+
+        for row, col in zip(*linear_sum_assignment(group_costs)):
+            if group_costs[row, col] < 1:
+                assigned_pairs.append((int(group_a_indices[row]), int(group_b_indices[col])))
+
+    assigned_pairs.sort()
+    return assigned_pairs
+
+
+def _find_overlapping_bboxes(
+    a_bboxes: Sequence[BboxCoords], b_bboxes: Sequence[BboxCoords]
+) -> tuple[list[int], list[int]]:
+    """
+    Finds pairs of overlapping bboxes using a uniform grid index.
+    Returns indices of the bboxes in the pairs.
+    """
+
+    a_boxes = np.array(a_bboxes, dtype=float).reshape((-1, 4))
+    b_boxes = np.array(b_bboxes, dtype=float).reshape((-1, 4))
+    if not len(a_boxes) or not len(b_boxes):
+        return [], []
+
+    all_boxes = np.concatenate([a_boxes, b_boxes])
+    origin = all_boxes[:, :2].min(axis=0)
+    extent = (all_boxes[:, :2] + all_boxes[:, 2:]).max(axis=0) - origin
+
+    # A typical box covers few cells, and the number of cells for big boxes is limited
+    cell_size = max(float(np.median(all_boxes[:, 2:])), float(extent.max()) / 256, 1.0)
+
+    a_boxes[:, 2:] += a_boxes[:, :2]
+    b_boxes[:, 2:] += b_boxes[:, :2]
+    a_cells = np.floor((a_boxes - np.tile(origin, 2)) / cell_size).astype(int)
+    b_cells = np.floor((b_boxes - np.tile(origin, 2)) / cell_size).astype(int)
+
+    grid: dict[tuple[int, int], list[int]] = {}
+    for b_idx, (x0, y0, x1, y1) in enumerate(b_cells.tolist()):
+        for cell in itertools.product(range(x0, x1 + 1), range(y0, y1 + 1)):
+            grid.setdefault(cell, []).append(b_idx)
+
+    a_indices = []
+    b_indices = []
+    for a_idx, (x0, y0, x1, y1) in enumerate(a_cells.tolist()):
+        candidates = set()
+        for cell in itertools.product(range(x0, x1 + 1), range(y0, y1 + 1)):
+            candidates.update(grid.get(cell, ()))
+
+        if not candidates:
+            continue
+
+        candidates = np.fromiter(candidates, dtype=int, count=len(candidates))
+        candidates.sort()
+        a_box = a_boxes[a_idx]
+        candidate_boxes = b_boxes[candidates]
+        candidates = candidates[
+            (a_box[0] < candidate_boxes[:, 2])
+            & (candidate_boxes[:, 0] < a_box[2])
+            & (a_box[1] < candidate_boxes[:, 3])
+            & (candidate_boxes[:, 1] < a_box[3])
+        ]
+
+        a_indices.extend([a_idx] * len(candidates))
+        b_indices.extend(candidates.tolist())
+
+    return a_indices, b_indices
+
+
 def oks(a, b, sigma=0.1, bbox=None, scale=None, visibility_a=None, visibility_b=None):
     """
     Object Keypoint Similarity metric.
@@ -1128,6 +1330,64 @@ def segment_iou(a: dm.Annotation, b: dm.Annotation, *, img_h: int, img_w: int) -
     return float(mask_utils.iou(b, a, [0]))
 
 
+_CachedSegment = tuple[dict, tuple[float, float, float, float]]  # (RLE, (x0, y0, x1, y1))
+
+
+class SegmentCache:
+    """
+    Keeps the RLEs and the bounding boxes of the segments compared in a single matching,
+    so each segment is encoded once, instead of once per compared pair.
+    Pairs with disjoint bounding boxes are not passed to the RLE IoU computation.
+
+    Keys are only valid while the cache is in use, e.g. annotation ids
+    can be used as keys, while the annotations are alive.
+    """
+
+    def __init__(self, *, img_h: int, img_w: int):
+        self.img_h = img_h
+        self.img_w = img_w
+        self._segments: dict[Hashable, _CachedSegment] = {}
+
+    def get(self, key: Hashable, encode: Callable[[], dict]) -> _CachedSegment:
+        segment = self._segments.get(key)
+        if segment is None:
+            from pycocotools import mask as mask_utils
+
+            rle = encode()
+            x, y, w, h = mask_utils.toBbox(rle).tolist()
+            segment = (rle, (x, y, x + w, y + h))
+            self._segments[key] = segment
+
+        return segment
+
+    def get_annotation_segment(
+        self,
+        ann: dm.Annotation,
+        *,
+        convert: Callable[[dm.Annotation], dm.Annotation] | None = None,
+    ) -> _CachedSegment:
+        def _encode() -> dict:
+            from pycocotools import mask as mask_utils
+
+            segment = convert(ann) if convert else ann
+            return mask_utils.merge(to_rle(segment, img_h=self.img_h, img_w=self.img_w))
+
+        return self.get(id(ann), _encode)
+
+    @staticmethod
+    def iou(a: _CachedSegment, b: _CachedSegment) -> float:
+        a_rle, (a_x0, a_y0, a_x1, a_y1) = a
+        b_rle, (b_x0, b_y0, b_x1, b_y1) = b
+        if a_x1 <= b_x0 or b_x1 <= a_x0 or a_y1 <= b_y0 or b_y1 <= a_y0:
+            # mask_utils.iou() also returns 0 for the segments with disjoint bboxes
+            return 0.0
+
+        from pycocotools import mask as mask_utils
+
+        # Note that mask_utils.iou expects (dt, gt). Check this if the 3rd param is True
+        return float(mask_utils.iou([b_rle], [a_rle], [0])[0])
+
+
 @define(kw_only=True)
 class LineMatcher(datumaro.components.annotations.matcher.LineMatcher):
     EPSILON = 1e-7
@@ -1350,6 +1610,19 @@ class DistanceComparator(datumaro.components.comparator.DistanceComparator):
 
         return dm.Polygon(points)
 
+    @classmethod
+    def _get_rotated_shape_bbox(cls, ann: dm.Bbox | dm.Ellipse) -> BboxCoords:
+        # Shapes with equal rotations can be compared without rotation,
+        # so the bbox must include both the rotated and the original shape.
+        bboxes = [ann.get_bbox(), cls.to_polygon(ann).get_bbox()]
+        x0 = min(x for x, _, _, _ in bboxes)
+        y0 = min(y for _, y, _, _ in bboxes)
+        x1 = max(x + w for x, _, w, _ in bboxes)
+        y1 = max(y + h for _, y, _, h in bboxes)
+
+        # The shapes can be compared as rasterized polygons, which can be a bit bigger
+        return (x0 - 1, y0 - 1, x1 - x0 + 2, y1 - y0 + 2)
+
     @staticmethod
     def _get_ann_type(t: dm.AnnotationType, item: dm.DatasetItem) -> Sequence[dm.Annotation]:
         return [
@@ -1403,22 +1676,39 @@ class DistanceComparator(datumaro.components.comparator.DistanceComparator):
         a_objs: Sequence[_ShapeT1] | None = None,
         b_objs: Sequence[_ShapeT2] | None = None,
         dist_thresh: float | None = None,
+        get_bboxes: BboxFunctions[_ShapeT1, _ShapeT2] | None = None,
     ):
         if a_objs is None:
             a_objs = self._get_ann_type(t, item_a)
         if b_objs is None:
             b_objs = self._get_ann_type(t, item_b)
 
+        spatial_index_min_size = settings.CVAT_QUALITY_CHECK_SPATIAL_INDEX_MIN_SIZE
+        if get_bboxes is not None and (
+            spatial_index_min_size <= 0 or max(len(a_objs), len(b_objs)) < spatial_index_min_size
+        ):
+            get_bboxes = None
+
         if self.return_distances:
             distance, distances = self._make_memoizing_distance(distance)
 
+            if get_bboxes is not None:
+                distances.pruned_comparisons.append(
+                    (
+                        frozenset(map(self._get_distance_key_part, a_objs)),
+                        frozenset(map(self._get_distance_key_part, b_objs)),
+                    )
+                )
+
         if not a_objs and not b_objs:
-            distances = {}
+            distances = ShapeDistances()
             returned_values = [], [], [], []
         else:
             extra_args = {}
             if label_matcher:
                 extra_args["label_matcher"] = label_matcher
+            if get_bboxes:
+                extra_args["get_bboxes"] = get_bboxes
 
             returned_values = match_segments(
                 a_objs,
@@ -1434,30 +1724,38 @@ class DistanceComparator(datumaro.components.comparator.DistanceComparator):
         return returned_values
 
     def match_boxes(self, item_a: dm.DatasetItem, item_b: dm.DatasetItem):
-        def _bbox_iou(a: dm.Bbox, b: dm.Bbox, *, img_w: int, img_h: int) -> float:
+        def _bbox_iou(a: dm.Bbox, b: dm.Bbox, *, segment_cache: SegmentCache) -> float:
             if a.attributes.get("rotation", 0) == b.attributes.get("rotation", 0):
                 return datumaro.util.annotation_util.bbox_iou(a, b)
             else:
-                return segment_iou(self.to_polygon(a), self.to_polygon(b), img_h=img_h, img_w=img_w)
+                return segment_cache.iou(
+                    segment_cache.get_annotation_segment(a, convert=self.to_polygon),
+                    segment_cache.get_annotation_segment(b, convert=self.to_polygon),
+                )
 
         img_h, img_w = item_a.media_as(dm.Image).size
         return self.match_segments(
             dm.AnnotationType.bbox,
             item_a,
             item_b,
-            distance=partial(_bbox_iou, img_h=img_h, img_w=img_w),
+            distance=partial(_bbox_iou, segment_cache=SegmentCache(img_h=img_h, img_w=img_w)),
+            get_bboxes=(self._get_rotated_shape_bbox, self._get_rotated_shape_bbox),
         )
 
     def match_ellipses(self, item_a: dm.DatasetItem, item_b: dm.DatasetItem):
-        def _ellipse_iou(a: dm.Ellipse, b: dm.Ellipse, *, img_w: int, img_h: int) -> float:
-            return segment_iou(self.to_polygon(a), self.to_polygon(b), img_h=img_h, img_w=img_w)
+        def _ellipse_iou(a: dm.Ellipse, b: dm.Ellipse, *, segment_cache: SegmentCache) -> float:
+            return segment_cache.iou(
+                segment_cache.get_annotation_segment(a, convert=self.to_polygon),
+                segment_cache.get_annotation_segment(b, convert=self.to_polygon),
+            )
 
         img_h, img_w = item_a.media_as(dm.Image).size
         return self.match_segments(
             dm.AnnotationType.ellipse,
             item_a,
             item_b,
-            distance=partial(_ellipse_iou, img_h=img_h, img_w=img_w),
+            distance=partial(_ellipse_iou, segment_cache=SegmentCache(img_h=img_h, img_w=img_w)),
+            get_bboxes=(self._get_rotated_shape_bbox, self._get_rotated_shape_bbox),
         )
 
     def match_segmentations(self, item_a: dm.DatasetItem, item_b: dm.DatasetItem):
@@ -1540,38 +1838,42 @@ class DistanceComparator(datumaro.components.comparator.DistanceComparator):
             a_compiled_mask = None
             b_compiled_mask = None
 
-        segment_cache = {}
+        segment_cache = SegmentCache(img_h=img_h, img_w=img_w)
 
         def _get_segment(obj_id: int, *, compiled_mask: dm.CompiledMask | None = None, instances):
-            key = (id(instances), obj_id)
-            rle = segment_cache.get(key)
-
-            if rle is None:
+            def _encode() -> dict:
                 from pycocotools import mask as mask_utils
 
                 if compiled_mask is not None:
                     mask = compiled_mask.extract(obj_id + 1)
 
-                    rle = mask_utils.encode(mask)
+                    return mask_utils.encode(mask)
                 else:
                     # Create merged RLE for the instance shapes
                     object_anns = instances[obj_id]
                     object_rle_groups = [
                         to_rle(ann, img_h=img_h, img_w=img_w) for ann in object_anns
                     ]
-                    rle = mask_utils.merge(list(itertools.chain.from_iterable(object_rle_groups)))
+                    return mask_utils.merge(list(itertools.chain.from_iterable(object_rle_groups)))
 
-                segment_cache[key] = rle
-
-            return rle
+            return segment_cache.get((id(instances), obj_id), _encode)
 
         def _segment_comparator(a_inst_id: int, b_inst_id: int) -> float:
             a_segm = _get_segment(a_inst_id, compiled_mask=a_compiled_mask, instances=a_instances)
             b_segm = _get_segment(b_inst_id, compiled_mask=b_compiled_mask, instances=b_instances)
+            return segment_cache.iou(a_segm, b_segm)
 
-            from pycocotools import mask as mask_utils
+        def _get_a_segment_bbox(a_inst_id: int) -> BboxCoords:
+            _, (x0, y0, x1, y1) = _get_segment(
+                a_inst_id, compiled_mask=a_compiled_mask, instances=a_instances
+            )
+            return (x0, y0, x1 - x0, y1 - y0)
 
-            return float(mask_utils.iou([b_segm], [a_segm], [0])[0])
+        def _get_b_segment_bbox(b_inst_id: int) -> BboxCoords:
+            _, (x0, y0, x1, y1) = _get_segment(
+                b_inst_id, compiled_mask=b_compiled_mask, instances=b_instances
+            )
+            return (x0, y0, x1 - x0, y1 - y0)
 
         def _label_matcher(a_inst_id: int, b_inst_id: int) -> bool:
             # labels are the same in the instance annotations
@@ -1588,6 +1890,7 @@ class DistanceComparator(datumaro.components.comparator.DistanceComparator):
             b_objs=range(len(b_instances)),
             distance=_segment_comparator,
             label_matcher=_label_matcher,
+            get_bboxes=(_get_a_segment_bbox, _get_b_segment_bbox),
         )
 
         # restore results for original annotations
@@ -1617,6 +1920,14 @@ class DistanceComparator(datumaro.components.comparator.DistanceComparator):
                 for ia_a, ia_b in itertools.product(a_instances[i_a], b_instances[i_b]):
                     distances[(id(ia_a), id(ia_b))] = dist
 
+            distances.pruned_comparisons = [
+                (
+                    frozenset(id(ia_a) for i_a in a_ids for ia_a in a_instances[i_a]),
+                    frozenset(id(ia_b) for i_b in b_ids for ia_b in b_instances[i_b]),
+                )
+                for a_ids, b_ids in distances.pruned_comparisons
+            ]
+
         returned_values = (matched, mismatched, a_extra, b_extra)
 
         if self.return_distances:
@@ -1642,7 +1953,7 @@ class DistanceComparator(datumaro.components.comparator.DistanceComparator):
             results = [[], [], [], []]
 
             if self.return_distances:
-                results.append({})
+                results.append(ShapeDistances())
 
             return tuple(results)
 
@@ -1758,7 +2069,7 @@ class DistanceComparator(datumaro.components.comparator.DistanceComparator):
             results = [[], [], [], []]
 
             if self.return_distances:
-                results.append({})
+                results.append(ShapeDistances())
 
             return tuple(results)
 
@@ -1849,16 +2160,18 @@ class DistanceComparator(datumaro.components.comparator.DistanceComparator):
 
         return returned_values
 
+    @staticmethod
+    def _get_distance_key_part(shape) -> int:
+        # instances can be compared by their indices
+        return shape if isinstance(shape, int) else id(shape)
+
     @classmethod
     def _make_memoizing_distance(cls, distance_function: Callable[[Any, Any], float]):
-        distances = {}
+        distances = ShapeDistances()
         notfound = object()
 
         def memoizing_distance(a, b):
-            if isinstance(a, int) and isinstance(b, int):
-                key = (a, b)
-            else:
-                key = (id(a), id(b))
+            key = (cls._get_distance_key_part(a), cls._get_distance_key_part(b))
 
             dist = distances.get(key, notfound)
 
@@ -2066,6 +2379,21 @@ class _Comparator:
         return pairwise_distances.get((id(gt_ann), id(ds_ann)))
 
 
+_frame_worker_context: (
+    tuple[DatasetComparator, list[tuple[dm.DatasetItem, dm.DatasetItem]]] | None
+) = None
+
+
+def _process_frames_in_worker(
+    frame_indices: Sequence[int],
+) -> list[tuple[int, ComparisonReportFrameSummary]]:
+    comparator, frame_pairs = _frame_worker_context
+    return [
+        (frame_idx, comparator._process_frame_in_worker(*frame_pairs[frame_idx]))
+        for frame_idx in frame_indices
+    ]
+
+
 class DatasetComparator:
     DEFAULT_SETTINGS = ComparisonParameters()
 
@@ -2087,6 +2415,9 @@ class DatasetComparator:
 
         self._frame_results: dict[int, ComparisonReportFrameSummary] = {}
 
+        # Used instead of annotation ids, when the frames are compared in worker processes
+        self._frame_ann_refs: dict[int, tuple[bool, int]] | None = None
+
         self.comparator = _Comparator(self._gt_dataset.categories(), settings=settings)
 
     def _dm_item_to_frame_id(self, item: dm.DatasetItem, dataset: dm.Dataset) -> int:
@@ -2100,6 +2431,9 @@ class DatasetComparator:
         return source_data_provider.dm_item_id_to_frame_id(item)
 
     def _dm_ann_to_ann_id(self, ann: dm.Annotation, dataset: dm.Dataset):
+        if self._frame_ann_refs is not None:
+            return self._frame_ann_refs[id(ann)]
+
         if dataset is self._ds_dataset:
             source_data_provider = self._ds_data_provider
         elif dataset is self._gt_dataset:
@@ -2116,12 +2450,77 @@ class DatasetComparator:
         ds_job_dataset = self._ds_dataset
         gt_job_dataset = self._gt_dataset
 
+        frame_pairs: list[tuple[dm.DatasetItem, dm.DatasetItem]] = []
         for gt_item in gt_job_dataset:
             ds_item = ds_job_dataset.get(id=gt_item.id, subset=gt_item.subset)
             if not ds_item:
                 continue  # we need to compare only intersecting frames
 
-            self._process_frame(ds_item, gt_item)
+            frame_pairs.append((ds_item, gt_item))
+
+        max_workers = min(settings.CVAT_QUALITY_CHECK_WORKERS, len(frame_pairs))
+        if max_workers <= 1:
+            for ds_item, gt_item in frame_pairs:
+                self._process_frame(ds_item, gt_item)
+        else:
+            self._process_frames_in_parallel(frame_pairs, max_workers=max_workers)
+
+    _FRAME_JOBS_PER_WORKER = 4
+
+    def _process_frames_in_parallel(
+        self, frame_pairs: list[tuple[dm.DatasetItem, dm.DatasetItem]], *, max_workers: int
+    ):
+        global _frame_worker_context
+
+        frames_per_job = math.ceil(len(frame_pairs) / (max_workers * self._FRAME_JOBS_PER_WORKER))
+
+        # The workers get the datasets and the comparator by forking, so only
+        # the frame indices are sent to them. The worker jobs don't use the DB,
+        # so the fork context is safe to use here.
+        _frame_worker_context = (self, frame_pairs)
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("fork")
+            ) as executor:
+                for job_results in executor.map(
+                    _process_frames_in_worker,
+                    take_by(range(len(frame_pairs)), frames_per_job),
+                ):
+                    for frame_idx, frame_result in job_results:
+                        ds_item, gt_item = frame_pairs[frame_idx]
+
+                        for conflict in frame_result.conflicts:
+                            conflict.annotation_ids = [
+                                (
+                                    self._dm_ann_to_ann_id(
+                                        gt_item.annotations[ann_idx], self._gt_dataset
+                                    )
+                                    if is_gt_ann
+                                    else self._dm_ann_to_ann_id(
+                                        ds_item.annotations[ann_idx], self._ds_dataset
+                                    )
+                                )
+                                for is_gt_ann, ann_idx in conflict.annotation_ids
+                            ]
+
+                        frame_id = self._dm_item_to_frame_id(ds_item, self._ds_dataset)
+                        self._frame_results[frame_id] = frame_result
+        finally:
+            _frame_worker_context = None
+
+    def _process_frame_in_worker(
+        self, ds_item: dm.DatasetItem, gt_item: dm.DatasetItem
+    ) -> ComparisonReportFrameSummary:
+        # The annotations are referenced by their positions in the items in the results,
+        # because the annotation ids can only be obtained in the parent process
+        self._frame_ann_refs = {
+            id(ann): (is_gt_ann, ann_idx)
+            for is_gt_ann, item in [(False, ds_item), (True, gt_item)]
+            for ann_idx, ann in enumerate(item.annotations)
+        }
+
+        self._process_frame(ds_item, gt_item)
+        return self._frame_results.pop(self._dm_item_to_frame_id(ds_item, self._ds_dataset))
 
     def _process_frame(
         self, ds_item: dm.DatasetItem, gt_item: dm.DatasetItem
@@ -2712,11 +3111,6 @@ class TaskQualityCalculator:
             else:
                 filtered_job_ids = set(all_job_ids)
 
-            # TODO: Probably, can be optimized to this:
-            # - task updated (the gt job, frame set or labels changed) -> everything is computed
-            # - job updated -> job report is computed
-            #   old reports can be reused in this case
-
             # Try to use a shared queryset to minimize DB requests
             job_queryset = Job.objects.select_related("segment").filter(segment__task=task)
 
@@ -2747,6 +3141,19 @@ class TaskQualityCalculator:
                     in active_validation_frames
                 )
 
+            # Job reports are only recomputed if the job, the GT job or the comparison inputs
+            # have changed since the previous report. Otherwise, the previous report is reused.
+            job_comparison_keys = self._get_job_comparison_keys(
+                task,
+                jobs,
+                quality_params=quality_params,
+                gt_job_data_provider=gt_job_data_provider,
+                active_validation_frames=active_validation_frames,
+            )
+            job_comparison_reports: dict[int, ComparisonReport] = self._get_reusable_job_reports(
+                jobs, gt_job=gt_job, comparison_keys=job_comparison_keys
+            )
+
             job_data_providers = {
                 job.id: JobDataProvider(
                     job.id,
@@ -2754,11 +3161,11 @@ class TaskQualityCalculator:
                     included_frames=active_validation_frames,
                 )
                 for job in jobs
+                if job.id not in job_comparison_reports
             }
 
-        job_comparison_reports: dict[int, ComparisonReport] = {}
         for job in jobs:
-            if job.id not in filtered_job_ids:
+            if job.id not in filtered_job_ids or job.id in job_comparison_reports:
                 continue
 
             job_data_provider = job_data_providers[job.id]
@@ -2790,6 +3197,7 @@ class TaskQualityCalculator:
                     assignee_last_updated=job.assignee_updated_date,
                     data=job_comparison_report.to_json(),
                     conflicts=[c.to_dict() for c in job_comparison_report.conflicts],
+                    comparison_key=job_comparison_keys[job.id],
                 )
 
                 job_quality_reports[job.id] = job_report
@@ -2809,6 +3217,97 @@ class TaskQualityCalculator:
 
         return task_report
 
+    def _get_job_comparison_keys(
+        self,
+        task: Task,
+        jobs: list[Job],
+        *,
+        quality_params: ComparisonParameters,
+        gt_job_data_provider: JobDataProvider,
+        active_validation_frames: set[int],
+    ) -> dict[int, str]:
+        """
+        Returns digests of the job comparison inputs, except the job and GT job annotations,
+        which are tracked by the job updated dates.
+        """
+
+        db_labels = gt_job_data_provider.job_annotation.db_labels
+        common_inputs = [
+            quality_params.to_dict(),
+            [
+                [
+                    db_label.id,
+                    db_label.name,
+                    db_label.type,
+                    db_label.parent_id,
+                    [
+                        [
+                            db_attr.id,
+                            db_attr.name,
+                            db_attr.input_type,
+                            db_attr.mutable,
+                            db_attr.values,
+                            db_attr.default_value,
+                        ]
+                        for db_attr in db_label.attributespec_set.all()
+                    ],
+                ]
+                for _, db_label in sorted(db_labels.items())
+            ],
+        ]
+
+        deleted_frames = set(task.data.deleted_frames)
+        task_frame_provider = TaskFrameProvider(task)
+
+        comparison_keys = {}
+        for job in jobs:
+            job_frames = set(
+                task_frame_provider.get_rel_frame_number(abs_frame)
+                for abs_frame in job.segment.frame_set
+            )
+
+            job_inputs = [
+                common_inputs,
+                sorted(job_frames & active_validation_frames),
+                sorted(job_frames & deleted_frames),
+            ]
+            comparison_keys[job.id] = hashlib.blake2b(
+                json.dumps(job_inputs, default=str).encode(), digest_size=16
+            ).hexdigest()
+
+        return comparison_keys
+
+    def _get_reusable_job_reports(
+        self, jobs: list[Job], *, gt_job: Job, comparison_keys: dict[int, str]
+    ) -> dict[int, ComparisonReport]:
+        job_updated_dates = {job.id: job.updated_date for job in jobs}
+
+        reusable_report_ids = {}
+        for job_ids_chunk in take_by(job_updated_dates, chunk_size=_DEFAULT_FETCH_CHUNK_SIZE):
+            for report_id, job_id, target_last_updated, comparison_key in (
+                models.QualityReport.objects.filter(
+                    job_id__in=job_ids_chunk, gt_last_updated=gt_job.updated_date
+                )
+                .order_by("created_date")
+                .values_list("id", "job_id", "target_last_updated", "comparison_key")
+            ):
+                if (
+                    target_last_updated == job_updated_dates[job_id]
+                    and comparison_key == comparison_keys[job_id]
+                ):
+                    # the latest report is used
+                    reusable_report_ids[job_id] = report_id
+
+        return {
+            job_id: ComparisonReport.from_json(data)
+            for report_ids_chunk in take_by(
+                reusable_report_ids.values(), chunk_size=_DEFAULT_FETCH_CHUNK_SIZE
+            )
+            for job_id, data in models.QualityReport.objects.filter(
+                id__in=report_ids_chunk
+            ).values_list("job_id", "data")
+        }
+
     def _compute_task_report(
         self,
         job_reports: dict[int, ComparisonReport],
@@ -2914,6 +3413,7 @@ class TaskQualityCalculator:
                 assignee_id=job_report["assignee_id"],
                 assignee_last_updated=job_report["assignee_last_updated"],
                 data=job_report["data"],
+                comparison_key=job_report["comparison_key"],
             )
             db_job_reports.append(db_job_report)
 
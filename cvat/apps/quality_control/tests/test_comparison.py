@@ -0,0 +1,82 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+import random
+from unittest import TestCase
+
+import datumaro as dm
+from django.test import override_settings
+
+from cvat.apps.engine.models import ShapeType
+from cvat.apps.quality_control.models import AnnotationType
+from cvat.apps.quality_control.quality_reports import AnnotationId, DatasetComparator
+
+
+class _DataProvider:
+    def __init__(self, dataset: dm.Dataset, *, job_id: int):
+        self.dm_dataset = dataset
+        self.job_data = list(dataset)
+        self.job_id = job_id
+
+    def dm_item_id_to_frame_id(self, item: dm.DatasetItem) -> int:
+        return int(item.id)
+
+    def dm_ann_to_ann_id(self, ann: dm.Annotation) -> AnnotationId:
+        if isinstance(ann, dm.Label):
+            ann_type, shape_type = AnnotationType.TAG, None
+        else:
+            ann_type, shape_type = AnnotationType.SHAPE, ShapeType.RECTANGLE
+
+        return AnnotationId(obj_id=ann.id, job_id=self.job_id, type=ann_type, shape_type=shape_type)
+
+
+class TestParallelComparison(TestCase):
+    def _make_dataset(self, rng: random.Random, *, frame_count: int) -> dm.Dataset:
+        return dm.Dataset.from_iterable(
+            [
+                dm.DatasetItem(
+                    id=str(frame),
+                    media=dm.Image.from_file(path=f"{frame}.jpg", size=(100, 100)),
+                    annotations=[
+                        dm.Bbox(
+                            rng.randint(0, 80),
+                            rng.randint(0, 80),
+                            rng.randint(5, 20),
+                            rng.randint(5, 20),
+                            label=rng.randint(0, 1),
+                            id=i,
+                        )
+                        for i in range(rng.randint(0, 6))
+                    ]
+                    + [
+                        dm.Label(label=rng.randint(0, 1), id=100 + i)
+                        for i in range(rng.randint(0, 2))
+                    ],
+                )
+                for frame in range(frame_count)
+            ],
+            categories=["a", "b"],
+        )
+
+    def _generate_report(self, ds_dataset: dm.Dataset, gt_dataset: dm.Dataset) -> str:
+        return (
+            DatasetComparator(
+                _DataProvider(ds_dataset, job_id=1), _DataProvider(gt_dataset, job_id=2)
+            )
+            .generate_report()
+            .to_json()
+        )
+
+    def test_can_compare_frames_in_parallel_as_serially(self):
+        rng = random.Random(42)
+        ds_dataset = self._make_dataset(rng, frame_count=20)
+        gt_dataset = self._make_dataset(rng, frame_count=20)
+
+        with override_settings(CVAT_QUALITY_CHECK_WORKERS=1):
+            expected = self._generate_report(ds_dataset, gt_dataset)
+
+        with override_settings(CVAT_QUALITY_CHECK_WORKERS=2):
+            actual = self._generate_report(ds_dataset, gt_dataset)
+
+        self.assertEqual(expected, actual)
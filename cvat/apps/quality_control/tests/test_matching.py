@@ -0,0 +1,165 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+import random
+from unittest import TestCase
+
+import datumaro as dm
+from datumaro.util.annotation_util import bbox_iou
+from django.test import override_settings
+
+from cvat.apps.consensus.intersect_merge import CachedSimilarityFunction
+from cvat.apps.quality_control.quality_reports import DistanceComparator, match_segments
+
+
+def _get_bbox(ann: dm.Bbox):
+    return ann.get_bbox()
+
+
+def _get_matched_ids(results):
+    matches, mismatches, a_unmatched, b_unmatched = results[:4]
+    return (
+        [(a.id, b.id) for a, b in matches],
+        [(a.id, b.id) for a, b in mismatches],
+        [a.id for a in a_unmatched],
+        [b.id for b in b_unmatched],
+    )
+
+
+class TestSpatialIndexMatching(TestCase):
+    def _make_random_boxes(self, rng: random.Random, count: int, *, id_offset: int = 0):
+        return [
+            dm.Bbox(
+                rng.randint(0, 200),
+                rng.randint(0, 200),
+                rng.randint(1, 30),
+                rng.randint(1, 30),
+                label=rng.randint(0, 2),
+                id=id_offset + i,
+            )
+            for i in range(count)
+        ]
+
+    def test_can_match_boxes_as_with_all_pairs(self):
+        rng = random.Random(42)
+
+        def get_total_similarity(results):
+            matches, mismatches = results[:2]
+            return sum(bbox_iou(a, b) for a, b in matches + mismatches)
+
+        for _ in range(300):
+            a_boxes = self._make_random_boxes(rng, rng.randint(0, 30))
+            b_boxes = self._make_random_boxes(rng, rng.randint(0, 30), id_offset=1000)
+            dist_thresh = rng.choice([0, 0.3, 0.5])
+
+            expected = match_segments(a_boxes, b_boxes, distance=bbox_iou, dist_thresh=dist_thresh)
+            actual = match_segments(
+                a_boxes,
+                b_boxes,
+                distance=bbox_iou,
+                dist_thresh=dist_thresh,
+                get_bboxes=(_get_bbox, _get_bbox),
+            )
+
+            # Equal pairs can be chosen differently, but the assignment must be as good
+            self.assertAlmostEqual(get_total_similarity(expected), get_total_similarity(actual))
+            self.assertEqual(
+                [len(r) for r in _get_matched_ids(expected)],
+                [len(r) for r in _get_matched_ids(actual)],
+            )
+
+    def test_can_resolve_ties_in_the_same_way(self):
+        a_boxes = [dm.Bbox(0, 0, 10, 10, label=0, id=i) for i in range(2)] + [
+            dm.Bbox(100, 100, 10, 10, label=0, id=2)
+        ]
+        b_boxes = [dm.Bbox(0, 0, 10, 10, label=0, id=10 + i) for i in range(3)]
+
+        results = match_segments(
+            a_boxes,
+            list(reversed(b_boxes)),
+            distance=bbox_iou,
+            dist_thresh=0.5,
+            get_bboxes=(_get_bbox, _get_bbox),
+        )
+
+        # the first boxes are matched with the first boxes
+        self.assertEqual(([(0, 12), (1, 11)], [], [2], [10]), _get_matched_ids(results))
+
+
+class TestSpatialIndexComparator(TestCase):
+    def _make_comparator(self) -> DistanceComparator:
+        return DistanceComparator(
+            categories={dm.AnnotationType.label: dm.LabelCategories.from_iterable(["a", "b"])},
+            return_distances=True,
+        )
+
+    def _make_item(self, annotations) -> dm.DatasetItem:
+        return dm.DatasetItem(
+            id="1",
+            media=dm.Image.from_file(path="1.jpg", size=(300, 300)),
+            annotations=annotations,
+        )
+
+    def _match_boxes(self, *, spatial_index_min_size: int):
+        # Boxes with equal rotations are compared without rotation,
+        # rotated boxes don't overlap
+        a_item = self._make_item(
+            [
+                dm.Bbox(100, 20 + 20 * i, 100, 2, label=0, id=i, attributes={"rotation": 90})
+                for i in range(3)
+            ]
+        )
+        b_item = self._make_item(
+            [
+                dm.Bbox(110, 20 + 20 * i, 100, 2, label=0, id=10 + i, attributes={"rotation": 90})
+                for i in range(3)
+            ]
+        )
+
+        with override_settings(CVAT_QUALITY_CHECK_SPATIAL_INDEX_MIN_SIZE=spatial_index_min_size):
+            return self._make_comparator().match_boxes(a_item, b_item)
+
+    def test_can_match_rotated_boxes_as_with_all_pairs(self):
+        expected = self._match_boxes(spatial_index_min_size=0)
+        actual = self._match_boxes(spatial_index_min_size=1)
+
+        self.assertEqual(3, len(expected[0]))
+        self.assertEqual(_get_matched_ids(expected), _get_matched_ids(actual))
+        self.assertEqual([], expected[4].pruned_comparisons)
+        self.assertEqual(1, len(actual[4].pruned_comparisons))
+
+    def test_pruned_pairs_have_zero_similarity(self):
+        a = dm.Bbox(0, 0, 1, 1)
+        b = dm.Bbox(10, 10, 1, 1)
+        c = dm.Bbox(20, 20, 1, 1)
+
+        distance = CachedSimilarityFunction()
+        distance.add_pruned_comparisons([(frozenset([id(a)]), frozenset([id(b)]))])
+
+        self.assertEqual(0, distance(a, b))
+        self.assertEqual(0, distance(b, a))
+        with self.assertRaises(KeyError):
+            distance(a, c)
+
+    def test_can_find_pruned_pairs_in_different_comparisons(self):
+        a, b, c, d = (dm.Bbox(10 * i, 10 * i, 1, 1) for i in range(4))
+
+        distance = CachedSimilarityFunction()
+        distance.add_pruned_comparisons(
+            [
+                (frozenset([id(a), id(b)]), frozenset([id(c)])),
+                (frozenset([id(d)]), frozenset([id(a)])),
+            ]
+        )
+
+        self.assertEqual(0, distance(b, c))
+        self.assertEqual(0, distance(a, d))
+        with self.assertRaises(KeyError):
+            distance(a, b)  # the same side of a comparison
+        with self.assertRaises(KeyError):
+            distance(c, d)  # different comparisons
+
+        distance.clear_cache()
+        with self.assertRaises(KeyError):
+            distance(b, c)
@@ -0,0 +1,161 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+from unittest import mock
+
+from django.contrib.auth.models import Group, User
+from rest_framework import status
+
+from cvat.apps.engine.models import Job, JobType, StageChoice, StateChoice
+from cvat.apps.engine.tests.utils import ApiTestBase, ForceLogin, generate_image_file
+from cvat.apps.quality_control import models, quality_reports
+from cvat.apps.quality_control.quality_reports import DatasetComparator, TaskQualityCalculator
+
+
+class TestTaskQualityReportReuse(ApiTestBase):
+    @classmethod
+    def setUpTestData(cls):
+        group, _ = Group.objects.get_or_create(name="adm")
+
+        cls.admin = User.objects.create_superuser(username="admin", password="admin", email="")
+        cls.admin.groups.add(group)
+
+    def setUp(self):
+        super().setUp()
+
+        task = self._create_task(frame_count=6, segment_size=3)
+        self.task_id = task["id"]
+        self.label_id = task["labels"][0]["id"]
+
+        with ForceLogin(self.admin, self.client):
+            response = self.client.post(
+                "/api/jobs",
+                data={
+                    "type": "ground_truth",
+                    "task_id": self.task_id,
+                    "frame_selection_method": "manual",
+                    "frames": [0, 1, 3, 4],
+                },
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.gt_job_id = response.json()["id"]
+
+        Job.objects.filter(id=self.gt_job_id).update(
+            stage=StageChoice.ACCEPTANCE, state=StateChoice.COMPLETED
+        )
+
+        self.job_ids = sorted(
+            Job.objects.filter(segment__task_id=self.task_id)
+            .exclude(type=JobType.GROUND_TRUTH)
+            .values_list("id", flat=True)
+        )
+        self.assertEqual(len(self.job_ids), 2)
+
+        self._put_job_annotations(self.gt_job_id, frames=[0, 1, 3, 4])
+        for job_id, frames in zip(self.job_ids, [[0, 1], [3]]):
+            self._put_job_annotations(job_id, frames=frames)
+
+    def _create_task(self, *, frame_count: int, segment_size: int) -> dict:
+        with ForceLogin(self.admin, self.client):
+            response = self.client.post(
+                "/api/tasks",
+                data={"name": "task", "labels": [{"name": "car"}], "segment_size": segment_size},
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            task_id = response.json()["id"]
+
+            image_data = {
+                f"client_files[{i}]": generate_image_file(f"image_{i}.jpg")
+                for i in range(frame_count)
+            }
+            image_data["image_quality"] = 75
+            response = self.client.post(f"/api/tasks/{task_id}/data", data=image_data)
+            self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+
+            response = self.client.get(f"/api/labels?task_id={task_id}")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return {"id": task_id, "labels": response.json()["results"]}
+
+    def _put_job_annotations(self, job_id: int, *, frames: list[int], offset: int = 0):
+        with ForceLogin(self.admin, self.client):
+            response = self.client.put(
+                f"/api/jobs/{job_id}/annotations",
+                data={
+                    "version": 0,
+                    "tags": [],
+                    "shapes": [
+                        {
+                            "frame": frame,
+                            "label_id": self.label_id,
+                            "group": None,
+                            "source": "manual",
+                            "attributes": [],
+                            "points": [10 + offset, 10, 50 + offset, 50],
+                            "type": "rectangle",
+                            "occluded": False,
+                        }
+                        for frame in frames
+                    ],
+                    "tracks": [],
+                },
+                format="json",
+            )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def _compute_report(self) -> tuple[models.QualityReport, list[int]]:
+        """Returns the task report and the ids of the compared jobs"""
+
+        with mock.patch.object(
+            quality_reports, "DatasetComparator", wraps=DatasetComparator
+        ) as comparator_class:
+            report = TaskQualityCalculator().compute_report(self.task_id)
+
+        self.assertIsNotNone(report)
+        return report, sorted(call.args[0].job_id for call in comparator_class.call_args_list)
+
+    def _get_job_reports(self, task_report: models.QualityReport) -> dict[int, str]:
+        return {job_report.job_id: job_report.data for job_report in task_report.children.all()}
+
+    def test_can_reuse_unchanged_job_reports(self):
+        old_report, compared_job_ids = self._compute_report()
+        self.assertEqual(compared_job_ids, self.job_ids)
+
+        new_report, compared_job_ids = self._compute_report()
+        self.assertEqual(compared_job_ids, [])
+        self.assertEqual(self._get_job_reports(new_report), self._get_job_reports(old_report))
+        self.assertEqual(new_report.data, old_report.data)
+
+    def test_can_recompute_changed_job_report(self):
+        old_report, _ = self._compute_report()
+
+        self._put_job_annotations(self.job_ids[1], frames=[3, 4], offset=20)
+
+        new_report, compared_job_ids = self._compute_report()
+        self.assertEqual(compared_job_ids, [self.job_ids[1]])
+
+        old_job_reports = self._get_job_reports(old_report)
+        new_job_reports = self._get_job_reports(new_report)
+        self.assertEqual(new_job_reports[self.job_ids[0]], old_job_reports[self.job_ids[0]])
+        self.assertNotEqual(new_job_reports[self.job_ids[1]], old_job_reports[self.job_ids[1]])
+
+    def test_can_recompute_job_reports_if_gt_job_changed(self):
+        self._compute_report()
+
+        self._put_job_annotations(self.gt_job_id, frames=[0, 3], offset=20)
+
+        _, compared_job_ids = self._compute_report()
+        self.assertEqual(compared_job_ids, self.job_ids)
+
+    def test_can_recompute_job_reports_if_parameters_changed(self):
+        self._compute_report()
+
+        quality_settings, _ = models.QualitySettings.objects.get_or_create(task_id=self.task_id)
+        quality_settings.iou_threshold = 0.9
+        quality_settings.save()
+
+        _, compared_job_ids = self._compute_report()
+        self.assertEqual(compared_job_ids, self.job_ids)
@@ -35,6 +35,7 @@ from cvat.apps.engine.permissions import get_cloud_storage_for_import_or_export
 from cvat.apps.engine.rq import BaseRQMeta, ExportRQMeta, define_dependent_job
 from cvat.apps.engine.types import ExtendedRequest
 from cvat.apps.engine.utils import get_rq_lock_by_user, get_rq_lock_for_job, sendfile
+from cvat.apps.redis_handler.indexes import RequestIndex
 from cvat.apps.redis_handler.serializers import RqIdSerializer
 
 slogger = ServerLogManager(__name__)
@@ -162,7 +163,7 @@ class AbstractRequestManager(metaclass=ABCMeta):
 
     def setup_new_job(self, queue: DjangoRQ, request_id: str, /, **kwargs):
         with get_rq_lock_by_user(queue, self.user_id):
-            queue.enqueue_call(
+            rq_job = queue.enqueue_call(
                 func=self.callback,
                 args=self.callback_args,
                 kwargs=self.callback_kwargs,
@@ -173,6 +174,7 @@ class AbstractRequestManager(metaclass=ABCMeta):
                 failure_ttl=self.job_failed_ttl,
                 **kwargs,
             )
+            RequestIndex(queue).add(rq_job)
 
     def finalize_request(self) -> None:
         """Hook to run some actions (e.g. collect events) after processing a request"""
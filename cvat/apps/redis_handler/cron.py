@@ -11,6 +11,8 @@ from rq.job import Job
 
 from cvat.apps.engine.log import ServerLogManager
 from cvat.apps.engine.utils import get_rq_lock_for_job
+from cvat.apps.redis_handler.apps import SELECTOR_TO_QUEUE
+from cvat.apps.redis_handler.indexes import RequestIndex
 
 slogger = ServerLogManager(__name__)
 
@@ -71,3 +73,8 @@ def cleanup_deferred_job_registry():
 
                     # parent job has been deleted by timeout
                     _process_job(enqueue=True)
+
+
+def cleanup_request_indexes():
+    for queue_name in set(SELECTOR_TO_QUEUE.values()):
+        RequestIndex(django_rq.get_queue(queue_name)).cleanup()
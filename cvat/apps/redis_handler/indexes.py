@@ -0,0 +1,109 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from django_rq.queues import DjangoRQ
+from redis import WatchError
+from redis.client import Pipeline
+from rq.job import Job as RQJob
+from rq.utils import as_text, utcparse
+
+
+class RequestIndex:
+    """
+    Sorted sets with ids of the requests created by users in a queue.
+    Each user has an index with all their requests and an index for each organization
+    where the requests were created. The ids are scored by the RQ job creation time.
+
+    RQ jobs can expire or be removed without updating the indexes, so the ids are
+    checked when the index is read, and the outdated ones are removed.
+    """
+
+    KEY_PREFIX = "cvat:requests"
+
+    def __init__(self, queue: DjangoRQ) -> None:
+        self._queue = queue
+
+    def _make_key(self, user_id: int | str, org_slug: str | None = None) -> str:
+        key = f"{self.KEY_PREFIX}:{self._queue.name}:user:{user_id}"
+        if org_slug:
+            key += f":org:{org_slug}"
+
+        return key
+
+    @staticmethod
+    def _to_timestamp(created_at: datetime) -> float:
+        # RQ keeps naive datetime objects in UTC
+        return created_at.replace(tzinfo=timezone.utc).timestamp()
+
+    def add(self, rq_job: RQJob, *, pipeline: Pipeline | None = None) -> None:
+        # to prevent circular import
+        from cvat.apps.engine.rq import BaseRQMeta
+
+        rq_job_meta = BaseRQMeta.for_job(rq_job)
+        if not (user := rq_job_meta.user):
+            return
+
+        mapping = {rq_job.id: self._to_timestamp(rq_job.created_at)}
+
+        pipe = pipeline or self._queue.connection.pipeline()
+        pipe.zadd(self._make_key(user.id), mapping)
+        if rq_job_meta.org_slug:
+            pipe.zadd(self._make_key(user.id, rq_job_meta.org_slug), mapping)
+
+        if pipeline is None:
+            pipe.execute()
+
+    def get_job_ids(self, user_id: int, *, org_slug: str | None = None) -> list[tuple[float, str]]:
+        """
+        Returns (creation timestamp, RQ job id) pairs for the existing user requests,
+        starting from the most recent ones.
+        """
+        return self._read(self._make_key(user_id, org_slug))
+
+    def cleanup(self) -> None:
+        """Removes ids of the outdated RQ jobs from all the indexes in the queue"""
+        for key in self._queue.connection.scan_iter(match=self._make_key("*")):
+            self._read(as_text(key))
+
+    def _read(self, key: str) -> list[tuple[float, str]]:
+        connection = self._queue.connection
+
+        with connection.pipeline() as pipe:
+            # the outdated ids must not be removed if the index was updated concurrently
+            pipe.watch(key)
+
+            entries = [
+                (score, as_text(job_id))
+                for job_id, score in pipe.zrevrange(key, 0, -1, withscores=True)
+            ]
+            if not entries:
+                return []
+
+            with connection.pipeline(transaction=False) as reader:
+                for _, job_id in entries:
+                    reader.hget(self._queue.job_class.key_for(job_id), "created_at")
+                creation_dates = reader.execute()
+
+            actual_entries = []
+            outdated_job_ids = []
+            for (score, job_id), created_at in zip(entries, creation_dates):
+                # the job was removed or the same id was reused for another job
+                if created_at is None or self._to_timestamp(utcparse(as_text(created_at))) != score:
+                    outdated_job_ids.append(job_id)
+                else:
+                    actual_entries.append((score, job_id))
+
+            if outdated_job_ids:
+                try:
+                    pipe.multi()
+                    pipe.zrem(key, *outdated_job_ids)
+                    pipe.execute()
+                except WatchError:
+                    pass
+
+        return actual_entries
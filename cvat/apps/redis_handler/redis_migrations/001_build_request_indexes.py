@@ -0,0 +1,36 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+import django_rq
+
+from cvat.apps.engine.utils import take_by
+from cvat.apps.redis_handler.apps import SELECTOR_TO_QUEUE
+from cvat.apps.redis_handler.indexes import RequestIndex
+from cvat.apps.redis_handler.redis_migrations import BaseMigration
+
+
+class Migration(BaseMigration):
+    def run(self):
+        for queue_name in set(SELECTOR_TO_QUEUE.values()):
+            queue: django_rq.queues.DjangoRQ = django_rq.get_queue(
+                queue_name, connection=self.connection
+            )
+            index = RequestIndex(queue)
+
+            job_ids = set(
+                queue.get_job_ids()
+                + queue.started_job_registry.get_job_ids()
+                + queue.finished_job_registry.get_job_ids()
+                + queue.failed_job_registry.get_job_ids()
+                + queue.deferred_job_registry.get_job_ids()
+            )
+            for subset_with_ids in take_by(job_ids, 1000):
+                with self.connection.pipeline() as pipe:
+                    for job in queue.job_class.fetch_many(
+                        subset_with_ids, connection=self.connection
+                    ):
+                        if job:
+                            index.add(job, pipeline=pipe)
+
+                    pipe.execute()
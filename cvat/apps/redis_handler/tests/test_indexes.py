@@ -0,0 +1,84 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+from datetime import timedelta
+from unittest import TestCase, mock
+
+import fakeredis
+from django_rq.queues import DjangoRQ
+
+from cvat.apps.dataset_manager.views import retry_current_rq_job
+from cvat.apps.redis_handler.indexes import RequestIndex
+
+
+class TestRequestIndex(TestCase):
+    def setUp(self):
+        self.queue = DjangoRQ("export", connection=fakeredis.FakeRedis(), is_async=False)
+        self.index = RequestIndex(self.queue)
+
+    def _enqueue(self, job_id: str, *, user_id: int, org_slug: str | None = None):
+        rq_job = self.queue.create_job(
+            print,
+            job_id=job_id,
+            meta={"user": {"id": user_id}, "org_slug": org_slug},
+        )
+        rq_job.save()
+        self.index.add(rq_job)
+        return rq_job
+
+    def test_can_get_user_requests(self):
+        self._enqueue("a", user_id=1)
+        self._enqueue("b", user_id=1, org_slug="org")
+        self._enqueue("c", user_id=2)
+
+        self.assertEqual(["b", "a"], [job_id for _, job_id in self.index.get_job_ids(1)])
+        self.assertEqual(["b"], [job_id for _, job_id in self.index.get_job_ids(1, org_slug="org")])
+        self.assertEqual(["c"], [job_id for _, job_id in self.index.get_job_ids(2)])
+
+    def test_can_skip_removed_requests(self):
+        self._enqueue("a", user_id=1)
+        self._enqueue("b", user_id=1).delete()
+
+        self.assertEqual(["a"], [job_id for _, job_id in self.index.get_job_ids(1)])
+        self.assertEqual(1, self.queue.connection.zcard(self.index._make_key(1)))
+
+    def test_can_skip_requests_with_reused_ids(self):
+        self._enqueue("a", user_id=1).delete()
+        self._enqueue("a", user_id=2)
+
+        self.assertEqual([], self.index.get_job_ids(1))
+        self.assertEqual(["a"], [job_id for _, job_id in self.index.get_job_ids(2)])
+
+    def test_can_cleanup_indexes(self):
+        self._enqueue("a", user_id=1, org_slug="org").delete()
+
+        self.index.cleanup()
+
+        self.assertEqual([], self.queue.connection.keys(f"{RequestIndex.KEY_PREFIX}:*"))
+
+    def test_can_keep_retried_requests(self):
+        rq_job = self._enqueue("a", user_id=1)
+
+        def _enqueue_in(time_delta, func, *args, job_id, meta, **kwargs):
+            retried_rq_job = self.queue.create_job(func, args=args, job_id=job_id, meta=meta)
+            retried_rq_job.save()
+            return retried_rq_job
+
+        with (
+            mock.patch("cvat.apps.dataset_manager.views.rq.get_current_job", return_value=rq_job),
+            mock.patch(
+                "cvat.apps.dataset_manager.views.django_rq.get_queue", return_value=self.queue
+            ),
+            mock.patch("cvat.apps.dataset_manager.views.django_rq.get_scheduler") as get_scheduler,
+            mock.patch("cvat.apps.dataset_manager.views.get_rq_lock_by_user"),
+        ):
+            get_scheduler.return_value.enqueue_in.side_effect = _enqueue_in
+            retry_current_rq_job(timedelta(seconds=1)).retry(None, None)
+
+        retried_rq_job = self.queue.fetch_job("a")
+        self.assertNotEqual(rq_job.created_at, retried_rq_job.created_at)
+        self.assertEqual(
+            [(RequestIndex._to_timestamp(retried_rq_job.created_at), "a")],
+            self.index.get_job_ids(1),
+        )
@@ -26,6 +26,7 @@ from cvat.apps.engine.log import ServerLogManager
 from cvat.apps.engine.rq import is_rq_job_owner
 from cvat.apps.engine.types import ExtendedRequest
 from cvat.apps.redis_handler.apps import SELECTOR_TO_QUEUE
+from cvat.apps.redis_handler.indexes import RequestIndex
 from cvat.apps.redis_handler.rq import CustomRQJob, RequestId
 from cvat.apps.redis_handler.serializers import RequestSerializer, RequestStatus
 
@@ -109,47 +110,113 @@ class RequestViewSet(viewsets.GenericViewSet):
     def queues(self) -> Iterable[DjangoRQ]:
         return (django_rq.get_queue(queue_name) for queue_name in set(SELECTOR_TO_QUEUE.values()))
 
-    def _get_rq_jobs_from_queue(self, queue: DjangoRQ, user_id: int) -> list[RQJob]:
-        job_ids = set(
-            queue.get_job_ids()
-            + queue.started_job_registry.get_job_ids()
-            + queue.finished_job_registry.get_job_ids()
-            + queue.failed_job_registry.get_job_ids()
-            + queue.deferred_job_registry.get_job_ids()
-        )
-        jobs = []
+    IndexedRequest = namedtuple("IndexedRequest", ["id", "parsed_id", "queue"])
+
+    # filters that can be applied using only request ids
+    request_id_filter_fields = ["action", "target", "subresource", "format"]
+
+    def _get_indexed_requests(
+        self, user_id: int, *, org_slug: str | None = None
+    ) -> list[IndexedRequest]:
+        """
+        Get requests of a specific user from the request indexes without fetching RQ jobs.
 
-        for job in queue.job_class.fetch_many(job_ids, queue.connection):
-            if job and is_rq_job_owner(job, user_id):
-                job = cast(CustomRQJob, job)
+        Parameters:
+            user_id (int): The ID of the user for whom to retrieve requests.
+            org_slug (str | None): The slug of the organization where the requests were created.
+
+        Returns:
+            List[IndexedRequest]: A list of requests, starting from the most recent ones.
+        """
+        entries = []
+        for queue in self.queues:
+            for timestamp, job_id in RequestIndex(queue).get_job_ids(user_id, org_slug=org_slug):
                 try:
                     parsed_request_id = RequestId.parse_and_validate_queue(
-                        job.id, expected_queue=queue.name
+                        job_id, expected_queue=queue.name
                     )
                 except Exception:  # nosec B112
                     continue
 
-                job.parsed_id = parsed_request_id
-                jobs.append(job)
+                entries.append((timestamp, self.IndexedRequest(job_id, parsed_request_id, queue)))
 
-        return jobs
+        entries.sort(key=lambda entry: entry[0], reverse=True)
+        return [indexed_request for _, indexed_request in entries]
 
-    def _get_rq_jobs(self, user_id: int) -> list[RQJob]:
+    def _get_rq_jobs(self, requests: list[IndexedRequest], user_id: int) -> list[RQJob]:
         """
-        Get all RQ jobs for a specific user and return them as a list of RQJob objects.
+        Fetch RQ jobs for the requests, keeping the order of the requests.
 
         Parameters:
-            user_id (int): The ID of the user for whom to retrieve jobs.
+            requests (list[IndexedRequest]): The requests to fetch.
+            user_id (int): The ID of the user who owns the requests.
 
         Returns:
-            List[RQJob]: A list of RQJob objects representing all jobs for the specified user.
+            List[RQJob]: A list of RQJob objects that still exist.
         """
-        all_jobs = []
-        for queue in self.queues:
-            jobs = self._get_rq_jobs_from_queue(queue, user_id)
-            all_jobs.extend(jobs)
+        requests_by_queue: dict[str, list[RequestViewSet.IndexedRequest]] = {}
+        for indexed_request in requests:
+            requests_by_queue.setdefault(indexed_request.queue.name, []).append(indexed_request)
+
+        jobs_by_id = {}
+        for queue_requests in requests_by_queue.values():
+            queue = queue_requests[0].queue
+            for indexed_request, job in zip(
+                queue_requests,
+                queue.job_class.fetch_many([r.id for r in queue_requests], queue.connection),
+            ):
+                if job and is_rq_job_owner(job, user_id):
+                    job = cast(CustomRQJob, job)
+                    job.parsed_id = indexed_request.parsed_id
+                    jobs_by_id[job.id] = job
+
+        return [jobs_by_id[r.id] for r in requests if r.id in jobs_by_id]
+
+    def _can_filter_by_request_ids(self, request: ExtendedRequest) -> bool:
+        query_params = request.query_params
+
+        if NonModelJsonLogicFilter.filter_param in query_params:
+            return False
+
+        if (
+            set(self.filter_fields)
+            .difference(self.request_id_filter_fields)
+            .intersection(query_params)
+        ):
+            return False
+
+        # requests in the personal workspace can't be found using the indexes
+        if "org" in query_params and not query_params["org"]:
+            return False
+
+        return query_params.get(NonModelOrderingFilter.ordering_param) in (
+            None,
+            "created_date",
+            "-created_date",
+        )
+
+    def _filter_by_request_ids(
+        self, request: ExtendedRequest, requests: list[IndexedRequest]
+    ) -> list[IndexedRequest]:
+        query_params = request.query_params
 
-        return all_jobs
+        filters = {}
+        for field in set(self.request_id_filter_fields).intersection(query_params):
+            query_param = query_params[field]
+            if query_param.isdigit():
+                query_param = int(query_param)
+            filters[field] = query_param
+
+        filtered_requests = [
+            r
+            for r in requests
+            if all(getattr(r.parsed_id, field, None) == value for field, value in filters.items())
+        ]
+
+        if query_params.get(NonModelOrderingFilter.ordering_param) == "created_date":
+            filtered_requests.reverse()
+
+        return filtered_requests
 
     def _get_rq_job_by_id(self, rq_id: str) -> RQJob | None:
         """
@@ -204,9 +271,25 @@ class RequestViewSet(viewsets.GenericViewSet):
     @_handle_redis_exceptions
     def list(self, request: ExtendedRequest):
         user_id = request.user.id
-        user_jobs = self._get_rq_jobs(user_id)
+        user_requests = self._get_indexed_requests(
+            user_id, org_slug=request.query_params.get("org") or None
+        )
 
-        filtered_jobs = self.filter_queryset(user_jobs)
+        if self._can_filter_by_request_ids(request):
+            # Only the jobs from the requested page need to be fetched
+            filtered_requests = self._filter_by_request_ids(request, user_requests)
+
+            page = self.paginate_queryset(filtered_requests)
+            if page is not None:
+                serializer = self.get_serializer(
+                    self._get_rq_jobs(page, user_id), many=True, context={"request": request}
+                )
+                return self.get_paginated_response(serializer.data)
+
+            filtered_jobs = self._get_rq_jobs(filtered_requests, user_id)
+        else:
+            user_jobs = self._get_rq_jobs(user_requests, user_id)
+            filtered_jobs = self.filter_queryset(user_jobs)
 
         page = self.paginate_queryset(filtered_jobs)
         if page is not None:
@@ -5,6 +5,8 @@
 import hashlib
 import hmac
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from http import HTTPStatus
 
@@ -15,7 +17,11 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import Signal, receiver
+from redis import WatchError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from cvat.apps.engine.model_utils import bulk_create
 from cvat.apps.engine.models import Comment, Issue, Job, Project, Task
 from cvat.apps.engine.serializers import BasicUserSerializer
 from cvat.apps.events.handlers import (
@@ -39,7 +45,93 @@ signal_redelivery = Signal()
 signal_ping = Signal()
 
 
-def send_webhook(webhook, payload, redelivery=False):
+class _WebhookRetry(Retry):
+    def get_retry_after(self, response):
+        # The target can ask for any delay, it's limited in the same way as the backoff
+        retry_after = super().get_retry_after(response)
+        if retry_after is not None:
+            retry_after = min(retry_after, self.backoff_max)
+
+        return retry_after
+
+
+def _get_max_retry_delay() -> float:
+    # A delivery with all its retries must take much less time than the pending deliveries
+    # lock timeout. Otherwise, the lock can expire before the delivery records are saved,
+    # and the deliveries would be sent again.
+    max_retries = max(1, settings.WEBHOOK_MAX_RETRIES)
+    max_delivery_time = PENDING_DELIVERIES_LOCK_TIMEOUT / 2
+    return max(0, (max_delivery_time - (max_retries + 1) * WEBHOOK_TIMEOUT) / max_retries)
+
+
+def _make_webhook_adapter() -> HTTPAdapter:
+    # Connection errors are not retried, because the request could be already received.
+    # The target can ask to slow down the delivery with the corresponding responses.
+    retry = _WebhookRetry(
+        total=settings.WEBHOOK_MAX_RETRIES,
+        connect=0,
+        read=0,
+        status_forcelist=(HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE),
+        allowed_methods=None,
+        backoff_factor=settings.WEBHOOK_RETRY_BACKOFF_FACTOR,
+        backoff_max=_get_max_retry_delay(),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(pool_maxsize=settings.WEBHOOK_TARGET_MAX_CONCURRENCY, max_retries=retry)
+
+
+def make_webhook_session(adapter: HTTPAdapter | None = None) -> requests.Session:
+    session = make_requests_session()
+
+    if adapter is None:
+        adapter = _make_webhook_adapter()
+
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+class _WebhookSessions:
+    """
+    Keeps a separate session for each thread, because requests.Session is not guaranteed
+    to be thread-safe. The sessions use the same adapter, so the connections
+    are still pooled together.
+    """
+
+    def __init__(self):
+        self._adapter = _make_webhook_adapter()
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = make_webhook_session(self._adapter)
+            self._local.session = session
+
+            with self._lock:
+                self._sessions.append(session)
+
+        return session
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+
+            self._sessions.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _post_webhook(session: requests.Session, webhook, payload) -> WebhookDelivery:
     headers = {}
     if webhook.secret:
         headers["X-Signature-256"] = (
@@ -53,43 +145,205 @@ def send_webhook(webhook, payload, redelivery=False):
 
     response_body = None
     try:
-        with make_requests_session() as session:
-            response = session.post(
-                webhook.target_url,
-                json=payload,
-                verify=webhook.enable_ssl,
-                headers=headers,
-                timeout=WEBHOOK_TIMEOUT,
-                stream=True,
-                proxies=PROXIES_FOR_UNTRUSTED_URLS,
-            )
-            status_code = response.status_code
-            response_body = response.raw.read(RESPONSE_SIZE_LIMIT + 1, decode_content=True)
+        response = session.post(
+            webhook.target_url,
+            json=payload,
+            verify=webhook.enable_ssl,
+            headers=headers,
+            timeout=WEBHOOK_TIMEOUT,
+            stream=True,
+            proxies=PROXIES_FOR_UNTRUSTED_URLS,
+        )
+        status_code = response.status_code
+        response_body = response.raw.read(RESPONSE_SIZE_LIMIT + 1, decode_content=True)
     except requests.ConnectionError:
         status_code = HTTPStatus.BAD_GATEWAY
     except requests.Timeout:
         status_code = HTTPStatus.GATEWAY_TIMEOUT
+    except requests.RequestException:
+        # e.g. invalid URLs or too many redirects, the request can't be delivered
+        status_code = HTTPStatus.BAD_GATEWAY
 
     response = ""
     if response_body is not None and len(response_body) < RESPONSE_SIZE_LIMIT + 1:
         response = response_body.decode("utf-8")
 
-    delivery = WebhookDelivery.objects.create(
+    return WebhookDelivery(
         webhook_id=webhook.id,
         event=payload["event"],
         status_code=status_code,
         changed_fields=",".join(list(payload.get("before_update", {}).keys())),
-        redelivery=redelivery,
         request=payload,
         response=response,
     )
 
+
+def send_webhook(webhook, payload, redelivery=False):
+    with make_webhook_session() as session:
+        delivery = _post_webhook(session, webhook, payload)
+
+    delivery.redelivery = redelivery
+    delivery.save()
+
     return delivery
 
 
+# Only one job can send the deliveries for a target at a time. The lock expires,
+# if the job is lost, and it's extended after each sent delivery.
+PENDING_DELIVERIES_LOCK_TIMEOUT = 600
+
+# The targets having pending deliveries, the jobs for them are rescheduled periodically,
+# if the previous jobs failed or were lost
+PENDING_DELIVERIES_TARGETS_KEY = "cvat:webhooks:pending-deliveries-targets"
+
+
+def _make_pending_deliveries_key(target_url: str) -> str:
+    target_id = hashlib.blake2b(target_url.encode(), digest_size=16).hexdigest()
+    return f"cvat:webhooks:pending-deliveries:{target_id}"
+
+
+def _finish_sending_pending_webhooks(
+    connection, target_url: str, key: str, scheduled_key: str
+) -> bool:
+    # New deliveries can be added after the list is read. The job can only finish,
+    # if there are no new deliveries, otherwise they would wait for the next event.
+    with connection.pipeline() as pipe:
+        try:
+            pipe.watch(key)
+            if pipe.llen(key):
+                return False
+
+            pipe.multi()
+            pipe.delete(scheduled_key)
+            pipe.srem(PENDING_DELIVERIES_TARGETS_KEY, target_url)
+            pipe.execute()
+        except WatchError:
+            return False
+
+    return True
+
+
+def send_pending_webhooks(target_url: str):
+    """
+    Sends all the deliveries pending for the target URL, in the order they were added.
+    Each delivery is sent in a separate request. The connections to the target are reused,
+    and the delivery records are saved in batches.
+
+    The deliveries being sent are kept in a separate list until their records are saved.
+    If the job fails or is lost, they are sent by the next job for the target,
+    so a delivery can be sent more than once. The next job is enqueued by the next event
+    for the target or by reschedule_pending_webhooks().
+    """
+
+    connection = django_rq.get_queue(settings.CVAT_QUEUES.WEBHOOKS.value).connection
+    scheduled_key = f"{_make_pending_deliveries_key(target_url)}:scheduled"
+
+    try:
+        _send_pending_webhooks(connection, target_url)
+    except Exception:
+        # Allow the next event or the periodic check to schedule a new job right away
+        connection.delete(scheduled_key)
+        raise
+
+
+def _send_pending_webhooks(connection, target_url: str):
+    key = _make_pending_deliveries_key(target_url)
+    processing_key = f"{key}:processing"
+    scheduled_key = f"{key}:scheduled"
+    batch_size = settings.WEBHOOK_DELIVERY_BATCH_SIZE
+
+    with (
+        connection.lock(
+            f"{key}:lock",
+            timeout=PENDING_DELIVERIES_LOCK_TIMEOUT,
+            blocking_timeout=PENDING_DELIVERIES_LOCK_TIMEOUT,
+        ) as lock,
+        _WebhookSessions() as sessions,
+        ThreadPoolExecutor(max_workers=settings.WEBHOOK_TARGET_MAX_CONCURRENCY) as executor,
+    ):
+        while True:
+            # the deliveries left by a failed or lost job are sent first
+            items = connection.lrange(processing_key, 0, -1)
+            if not items:
+                with connection.pipeline() as pipe:
+                    for _ in range(batch_size):
+                        pipe.lmove(key, processing_key, "LEFT", "RIGHT")
+                    items = [item for item in pipe.execute() if item is not None]
+
+            if not items:
+                if _finish_sending_pending_webhooks(connection, target_url, key, scheduled_key):
+                    break
+
+                continue
+
+            pending_deliveries = [json.loads(item) for item in items]
+            webhooks = Webhook.objects.in_bulk(set(d["webhook_id"] for d in pending_deliveries))
+
+            # The webhook can be removed while the delivery is waiting
+            pending_deliveries = [d for d in pending_deliveries if d["webhook_id"] in webhooks]
+
+            deliveries = []
+            for delivery, pending_delivery in zip(
+                executor.map(
+                    lambda d: _post_webhook(
+                        sessions.get(), webhooks[d["webhook_id"]], d["payload"]
+                    ),
+                    pending_deliveries,
+                ),
+                pending_deliveries,
+            ):
+                delivery.redelivery = pending_delivery["redelivery"]
+                deliveries.append(delivery)
+
+                lock.reacquire()
+                connection.expire(scheduled_key, PENDING_DELIVERIES_LOCK_TIMEOUT)
+
+            bulk_create(WebhookDelivery, deliveries)
+            connection.delete(processing_key)
+
+
 def add_to_queue(webhook, payload, redelivery=False):
+    """
+    Adds the delivery to the list of the deliveries pending for the webhook target.
+    The pending deliveries for the same target are sent together by a single job,
+    which is enqueued if there is no job scheduled for the target yet.
+    """
+
     queue = django_rq.get_queue(settings.CVAT_QUEUES.WEBHOOKS.value)
-    queue.enqueue_call(func=send_webhook, args=(webhook, payload, redelivery))
+    key = _make_pending_deliveries_key(webhook.target_url)
+
+    with queue.connection.pipeline() as pipe:
+        pipe.rpush(
+            key,
+            json.dumps({"webhook_id": webhook.id, "payload": payload, "redelivery": redelivery}),
+        )
+
+        pipe.sadd(PENDING_DELIVERIES_TARGETS_KEY, webhook.target_url)
+
+        # The mark is removed by the job, when there are no pending deliveries left
+        # or when the job fails. It expires, if the job is lost.
+        pipe.set(f"{key}:scheduled", 1, nx=True, ex=PENDING_DELIVERIES_LOCK_TIMEOUT)
+        *_, is_new_job_required = pipe.execute()
+
+    if is_new_job_required:
+        queue.enqueue_call(func=send_pending_webhooks, args=(webhook.target_url,))
+
+
+def reschedule_pending_webhooks():
+    """
+    Enqueues the jobs for the targets with pending deliveries, which have no jobs scheduled,
+    because the previous jobs failed or were lost. Otherwise, such deliveries would only be
+    sent after the next event for the same target.
+    """
+
+    queue = django_rq.get_queue(settings.CVAT_QUEUES.WEBHOOKS.value)
+
+    for target_url in queue.connection.smembers(PENDING_DELIVERIES_TARGETS_KEY):
+        target_url = target_url.decode()
+        scheduled_key = f"{_make_pending_deliveries_key(target_url)}:scheduled"
+
+        if queue.connection.set(scheduled_key, 1, nx=True, ex=PENDING_DELIVERIES_LOCK_TIMEOUT):
+            queue.enqueue_call(func=send_pending_webhooks, args=(target_url,))
 
 
 def batch_add_to_queue(webhooks, data):
@@ -0,0 +1,183 @@
+# Copyright (C) CVAT.ai Corporation
+#
+# SPDX-License-Identifier: MIT
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from unittest import TestCase, mock
+
+import fakeredis
+import requests
+from django.conf import settings
+from django_rq.queues import DjangoRQ
+from rq import SimpleWorker
+
+from cvat.apps.webhooks import signals
+from cvat.apps.webhooks.models import Webhook
+
+
+class TestPendingDeliveries(TestCase):
+    def setUp(self):
+        self.queue = DjangoRQ("webhooks", connection=fakeredis.FakeRedis())
+        self.webhooks = {
+            1: Webhook(id=1, target_url="http://example.com/a", secret="", enable_ssl=True),
+            2: Webhook(id=2, target_url="http://example.com/b", secret="", enable_ssl=True),
+        }
+
+        self.session = mock.MagicMock()
+        self.session.__enter__.return_value = self.session
+        self.session.post.side_effect = lambda *args, **kwargs: self._make_response()
+
+        self.saved_deliveries = []
+
+        for patcher in (
+            mock.patch.object(signals.django_rq, "get_queue", return_value=self.queue),
+            mock.patch.object(signals, "make_webhook_session", return_value=self.session),
+            mock.patch.object(
+                Webhook.objects,
+                "in_bulk",
+                side_effect=lambda ids: {i: self.webhooks[i] for i in ids if i in self.webhooks},
+            ),
+            mock.patch.object(
+                signals,
+                "bulk_create",
+                side_effect=lambda model, objs: self.saved_deliveries.extend(objs),
+            ),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def _make_response():
+        response = mock.Mock(status_code=HTTPStatus.OK)
+        response.raw.read.return_value = b"ok"
+        return response
+
+    def _add(self, webhook_id: int, event: str):
+        signals.add_to_queue(self.webhooks[webhook_id], {"event": event})
+
+    def _send(self, webhook_id: int):
+        signals.send_pending_webhooks(self.webhooks[webhook_id].target_url)
+
+    def _run_jobs(self):
+        SimpleWorker([self.queue], connection=self.queue.connection).work(burst=True)
+
+    def _get_pending_keys(self):
+        return self.queue.connection.keys("cvat:webhooks:pending-deliveries:*")
+
+    def test_can_enqueue_single_job_per_target(self):
+        self._add(1, "a")
+        self._add(1, "b")
+        self._add(2, "c")
+
+        self.assertEqual(2, self.queue.count)
+
+    def test_can_send_pending_deliveries(self):
+        self._add(1, "a")
+        self._add(1, "b")
+
+        self._send(1)
+
+        self.assertEqual(["a", "b"], [d.event for d in self.saved_deliveries])
+        self.assertEqual([], self._get_pending_keys())
+
+        self._add(1, "c")
+        self.assertEqual(2, self.queue.count)
+
+    def test_can_keep_deliveries_until_saved(self):
+        self._add(1, "a")
+        self._add(1, "b")
+
+        with mock.patch.object(signals, "bulk_create", side_effect=Exception("failed")):
+            self._run_jobs()
+
+        self.assertEqual(1, self.queue.failed_job_registry.count)
+        self.assertEqual([], self.saved_deliveries)
+
+        self._add(1, "c")
+        self._run_jobs()
+
+        self.assertEqual(["a", "b", "c"], [d.event for d in self.saved_deliveries])
+        self.assertEqual([], self._get_pending_keys())
+
+    def test_can_reschedule_deliveries_after_failed_job(self):
+        self._add(1, "a")
+        self._add(1, "b")
+
+        with mock.patch.object(signals, "bulk_create", side_effect=Exception("failed")):
+            self._run_jobs()
+
+        signals.reschedule_pending_webhooks()
+        self._run_jobs()
+
+        self.assertEqual(["a", "b"], [d.event for d in self.saved_deliveries])
+        self.assertEqual([], self._get_pending_keys())
+
+    def test_can_reschedule_deliveries_after_lost_job(self):
+        self._add(1, "a")
+        self.queue.empty()
+
+        # the job can still be running
+        signals.reschedule_pending_webhooks()
+        self.assertEqual(0, self.queue.count)
+
+        # the scheduled job mark expires
+        for key in self.queue.connection.keys("cvat:webhooks:pending-deliveries:*:scheduled"):
+            self.queue.connection.delete(key)
+
+        signals.reschedule_pending_webhooks()
+        self._run_jobs()
+
+        self.assertEqual(["a"], [d.event for d in self.saved_deliveries])
+        self.assertEqual([], self._get_pending_keys())
+
+        signals.reschedule_pending_webhooks()
+        self.assertEqual(0, self.queue.count)
+
+    def test_can_save_failed_requests(self):
+        self._add(1, "a")
+        self._add(1, "b")
+        self.session.post.side_effect = [requests.TooManyRedirects(), self._make_response()]
+
+        self._send(1)
+
+        self.assertEqual(
+            [HTTPStatus.BAD_GATEWAY, HTTPStatus.OK], [d.status_code for d in self.saved_deliveries]
+        )
+
+
+class TestWebhookSession(TestCase):
+    def test_can_limit_retry_delays(self):
+        with signals.make_webhook_session() as session:
+            retry = session.get_adapter("http://example.com").max_retries
+
+        max_retry_delay = retry.backoff_max
+        self.assertLess(
+            (settings.WEBHOOK_MAX_RETRIES + 1) * signals.WEBHOOK_TIMEOUT
+            + settings.WEBHOOK_MAX_RETRIES * max_retry_delay,
+            signals.PENDING_DELIVERIES_LOCK_TIMEOUT,
+        )
+
+        response = mock.Mock(headers={"Retry-After": "3600"})
+        self.assertEqual(max_retry_delay, retry.get_retry_after(response))
+        self.assertEqual(max_retry_delay, retry.new(total=0).get_retry_after(response))
+
+    def test_can_use_separate_sessions_in_threads(self):
+        barrier = threading.Barrier(2)
+
+        def get_session(sessions):
+            session = sessions.get()
+            barrier.wait()  # the sessions are requested from different threads
+            return session
+
+        with (
+            signals._WebhookSessions() as sessions,
+            ThreadPoolExecutor(max_workers=2) as executor,
+        ):
+            session1, session2 = executor.map(get_session, [sessions] * 2)
+
+        self.assertIsNot(session1, session2)
+        self.assertIs(
+            session1.get_adapter("http://example.com"), session2.get_adapter("http://example.com")
+        )
@@ -242,6 +242,9 @@ IAM_ADMIN_ROLE = "admin"
 IAM_ROLES = [IAM_ADMIN_ROLE, "user", "worker"]
 IAM_OPA_HOST = "http://opa:8181"
 IAM_OPA_DATA_URL = f"{IAM_OPA_HOST}/v1/data"
+# OPA decisions are cached in each server process for a short time. 0 disables the cache.
+IAM_OPA_DECISION_CACHE_TTL = int(os.getenv("CVAT_IAM_OPA_DECISION_CACHE_TTL", 10))
+IAM_OPA_DECISION_CACHE_MAX_SIZE = int(os.getenv("CVAT_IAM_OPA_DECISION_CACHE_MAX_SIZE", 10000))
 LOGIN_URL = "rest_login"
 LOGIN_REDIRECT_URL = "/"
 
@@ -251,11 +254,30 @@ OBJECTS_NOT_RELATED_WITH_ORG = ["user", "lambda_function", "lambda_request", "se
 ORG_INVITATION_CONFIRM = "No"
 ORG_INVITATION_EXPIRY_DAYS = 7
 
+# Webhooks settings
+# Number of pending deliveries for a target URL, which are read and saved at once
+WEBHOOK_DELIVERY_BATCH_SIZE = int(os.getenv("CVAT_WEBHOOK_DELIVERY_BATCH_SIZE", 100))
+# Number of concurrent requests to a target URL. Deliveries can come out of order, if it's > 1.
+WEBHOOK_TARGET_MAX_CONCURRENCY = int(os.getenv("CVAT_WEBHOOK_TARGET_MAX_CONCURRENCY", 1))
+# Only 429 and 503 responses are retried
+WEBHOOK_MAX_RETRIES = int(os.getenv("CVAT_WEBHOOK_MAX_RETRIES", 3))
+WEBHOOK_RETRY_BACKOFF_FACTOR = float(os.getenv("CVAT_WEBHOOK_RETRY_BACKOFF_FACTOR", 0.5))
+
 
 # DATAUP Settings
 
 DATAUP_BASE_URL = os.getenv("DATAUP_BASE_URL", "http://host.docker.internal:8001")
 DATAUP_API_VERSION = os.getenv("DATAUP_API_VERSION", "v1")
+DATAUP_CONNECT_TIMEOUT = float(os.getenv("DATAUP_CONNECT_TIMEOUT", 5))
+DATAUP_READ_TIMEOUT = float(os.getenv("DATAUP_READ_TIMEOUT", 60))
+# Only idempotent requests are retried
+DATAUP_MAX_RETRIES = int(os.getenv("DATAUP_MAX_RETRIES", 3))
+DATAUP_RETRY_BACKOFF_FACTOR = float(os.getenv("DATAUP_RETRY_BACKOFF_FACTOR", 0.5))
+DATAUP_CONNECTION_POOL_SIZE = int(os.getenv("DATAUP_CONNECTION_POOL_SIZE", 10))
+# Lifetime in seconds of the resolved API keys in the cache. 0 disables the cache.
+DATAUP_API_KEY_CACHE_TTL = int(os.getenv("DATAUP_API_KEY_CACHE_TTL", 60))
+# Number of GET responses with ETags kept in each server process. 0 disables the cache.
+DATAUP_RESPONSE_CACHE_MAX_SIZE = int(os.getenv("DATAUP_RESPONSE_CACHE_MAX_SIZE", 256))
 
 AUTHENTICATION_BACKENDS = [
     "django.contrib.auth.backends.ModelBackend",
@@ -359,6 +381,10 @@ NUCLIO = {
     "HOST": os.getenv("CVAT_NUCLIO_HOST", "localhost"),
     "PORT": int(os.getenv("CVAT_NUCLIO_PORT", 8070)),
     "DEFAULT_TIMEOUT": int(os.getenv("CVAT_NUCLIO_DEFAULT_TIMEOUT", 120)),
+    # The upper limit for concurrent requests to a function from a single
+    # auto-annotation job. The actual limit also depends on the number of
+    # HTTP workers in the function.
+    "MAX_CONCURRENT_REQUESTS": int(os.getenv("CVAT_NUCLIO_MAX_CONCURRENT_REQUESTS", 4)),
     "FUNCTION_NAMESPACE": os.getenv("CVAT_NUCLIO_FUNCTION_NAMESPACE", "nuclio"),
     "INVOKE_METHOD": os.getenv(
         "CVAT_NUCLIO_INVOKE_METHOD",
@@ -395,6 +421,20 @@ PERIODIC_RQ_JOBS = [
         # Run once a day
         "cron_string": "0 18 * * *",
     },
+    {
+        "queue": CVAT_QUEUES.CLEANING.value,
+        "id": "cron_request_indexes_cleanup",
+        "func": "cvat.apps.redis_handler.cron.cleanup_request_indexes",
+        # Run once a day
+        "cron_string": "0 6 * * *",
+    },
+    {
+        "queue": CVAT_QUEUES.WEBHOOKS.value,
+        "id": "cron_reschedule_pending_webhooks",
+        "func": "cvat.apps.webhooks.signals.reschedule_pending_webhooks",
+        # Run every 10 minutes, the scheduled job marks expire in this time
+        "cron_string": "*/10 * * * *",
+    },
 ]
 
 # JavaScript and CSS compression
@@ -598,6 +638,9 @@ CACHES = {
         "BACKEND": "django.core.cache.backends.redis.RedisCache",
         "LOCATION": f"redis://:{urllib.parse.quote(redis_ondisk_password)}@{redis_ondisk_host}:{redis_ondisk_port}",
         "TIMEOUT": CVAT_CHUNK_CACHE_TTL,
+        "OPTIONS": {
+            "serializer": "cvat.apps.engine.cache.MediaCacheSerializer",
+        },
     },
 }
 
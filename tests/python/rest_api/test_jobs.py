@@ -1254,6 +1254,81 @@ class TestPatchJobAnnotations:
         data = request_data(job["id"])
         self._check_response(admin_user, job["id"], True, data)
 
+    def test_can_save_many_annotations_with_special_characters(
+        self, admin_user, jobs, tasks, labels
+    ):
+        # Big numbers of annotations are inserted with COPY on PostgreSQL,
+        # the count must be at least DEFAULT_DB_BULK_COPY_MIN_SIZE
+        object_count = 10000
+        special_values = ["a\tb", "a\nb", "a\rb", "a\\b", "a\\Nb", "a\\.b", "a'\"b", "a ✓ü b"]
+
+        job, label, attribute = next(
+            (job, label, attribute)
+            for job in jobs
+            if job["type"] == "annotation" and not tasks[job["task_id"]]["validation_mode"]
+            for label in labels
+            if label["type"] == "any"
+            and (
+                label.get("task_id") == job["task_id"]
+                or job["project_id"]
+                and label.get("project_id") == job["project_id"]
+            )
+            for attribute in label["attributes"]
+            if attribute["input_type"] == "text"
+        )
+
+        def make_object(i):
+            return {
+                "frame": job["start_frame"] + i % (job["stop_frame"] - job["start_frame"] + 1),
+                "attributes": [
+                    {
+                        "spec_id": attribute["id"],
+                        "value": special_values[i % len(special_values)] + str(i),
+                    }
+                ],
+            }
+
+        def make_labeled_object(i):
+            return make_object(i) | {"label_id": label["id"]}
+
+        def make_shape(i):
+            return make_object(i) | {
+                "type": "rectangle",
+                "points": [i, i, i + 1, i + 1],
+                "occluded": False,
+                "outside": False,
+            }
+
+        data = {
+            "version": 0,
+            "tags": [make_labeled_object(i) for i in range(object_count)],
+            "shapes": [make_labeled_object(i) | make_shape(i) for i in range(object_count)],
+            "tracks": [
+                make_labeled_object(i) | {"shapes": [make_shape(i)]} for i in range(object_count)
+            ],
+        }
+
+        with make_api_client(admin_user) as client:
+            client.jobs_api.update_annotations(job["id"], labeled_data_request=deepcopy(data))
+            saved_data = json.loads(client.jobs_api.retrieve_annotations(job["id"])[1].data)
+
+        def get_values(objects):
+            return sorted(
+                (
+                    obj["frame"],
+                    [a["value"] for a in obj["attributes"]],
+                    obj.get("points"),
+                )
+                for obj in objects
+            )
+
+        for field in ["tags", "shapes", "tracks"]:
+            assert get_values(saved_data[field]) == get_values(data[field])
+
+        assert get_values(s for t in saved_data["tracks"] for s in t["shapes"]) == get_values(
+            s for t in data["tracks"] for s in t["shapes"]
+        )
+
 
 @pytest.mark.usefixtures("restore_db_per_function")
 class TestPatchJob:
@@ -4,10 +4,15 @@
 # SPDX-License-Identifier: MIT
 
 import json
+import mmap
 import os
+import threading
 from abc import ABC, abstractmethod
+from array import array
+from collections import deque
 from collections.abc import Iterator
-from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing, suppress
 from enum import Enum
 from inspect import isgenerator
 from io import StringIO
@@ -145,7 +150,33 @@ class VideoStreamReader:
                 self._frames_number = index
 
 
+def _read_img_properties(
+    image: Union[str, NamedBytesIO], img_name: str, *, use_image_hash: bool
+) -> dict[str, Any]:
+    # Only the image header is read, unless the checksum is requested
+    with Image.open(image, mode="r") as img:
+        name, extension = os.path.splitext(img_name)
+        image_properties = {
+            "name": name.replace("\\", "/"),
+            "extension": extension,
+        }
+
+        width, height = img.width, img.height
+        orientation = img.getexif().get(274, 1)
+        if orientation > 4:
+            width, height = height, width
+        image_properties["width"] = width
+        image_properties["height"] = height
+
+        if use_image_hash:
+            image_properties["checksum"] = md5_hash(img)
+
+    return image_properties
+
+
 class DatasetImagesReader:
+    _MAX_PENDING_IMAGES_PER_WORKER = 16
+
     def __init__(
         self,
         sources: Union[list[str], Iterator[NamedBytesIO]],
@@ -156,6 +187,7 @@ class DatasetImagesReader:
         meta: Optional[dict[str, list[str]]] = None,
         sorting_method: SortingMethod = SortingMethod.PREDEFINED,
         use_image_hash: bool = False,
+        workers: int = 1,
         **kwargs,
     ):
         self._is_generator_used = isgenerator(sources)
@@ -173,6 +205,7 @@ class DatasetImagesReader:
         self._meta = meta
         self._data_dir = kwargs.get("data_dir", None)
         self._use_image_hash = use_image_hash
+        self._workers = workers
         self._start = start
         self._stop = stop if stop or self._is_generator_used else len(sources) - 1
         if self._stop is None:
@@ -203,47 +236,74 @@ class DatasetImagesReader:
     def step(self, value):
         self._step = int(value)
 
-    def _get_img_properties(self, image: Union[str, NamedBytesIO]) -> dict[str, Any]:
-        img = Image.open(image, mode="r")
+    def _get_img_name(self, image: Union[str, NamedBytesIO]) -> str:
         if self._data_dir:
-            img_name = os.path.relpath(image, self._data_dir)
+            return os.path.relpath(image, self._data_dir)
         else:
-            img_name = os.path.basename(image) if isinstance(image, str) else image.filename
-
-        name, extension = os.path.splitext(img_name)
-        image_properties = {
-            "name": name.replace("\\", "/"),
-            "extension": extension,
-        }
-
-        width, height = img.width, img.height
-        orientation = img.getexif().get(274, 1)
-        if orientation > 4:
-            width, height = height, width
-        image_properties["width"] = width
-        image_properties["height"] = height
+            return os.path.basename(image) if isinstance(image, str) else image.filename
 
+    def _add_img_meta(self, img_name: str, image_properties: dict[str, Any]) -> dict[str, Any]:
         if self._meta and img_name in self._meta:
             image_properties["meta"] = self._meta[img_name]
 
-        if self._use_image_hash:
-            image_properties["checksum"] = md5_hash(img)
-
         return image_properties
 
+    def _get_img_properties(self, image: Union[str, NamedBytesIO]) -> dict[str, Any]:
+        img_name = self._get_img_name(image)
+        return self._add_img_meta(
+            img_name,
+            _read_img_properties(image, img_name, use_image_hash=self._use_image_hash),
+        )
+
+    def _iterate_img_properties(
+        self, images: Iterator[Union[str, NamedBytesIO]]
+    ) -> Iterator[dict[str, Any]]:
+        if self._workers <= 1:
+            for image in images:
+                yield self._get_img_properties(image)
+            return
+
+        # The results are collected in the submission order,
+        # the number of pending images is limited to keep the memory usage bounded
+        max_pending_images = self._workers * self._MAX_PENDING_IMAGES_PER_WORKER
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            pending_images = deque()
+            for image in images:
+                img_name = self._get_img_name(image)
+                pending_images.append(
+                    (
+                        img_name,
+                        executor.submit(
+                            _read_img_properties,
+                            image,
+                            img_name,
+                            use_image_hash=self._use_image_hash,
+                        ),
+                    )
+                )
+
+                if max_pending_images <= len(pending_images):
+                    img_name, future = pending_images.popleft()
+                    yield self._add_img_meta(img_name, future.result())
+
+            while pending_images:
+                img_name, future = pending_images.popleft()
+                yield self._add_img_meta(img_name, future.result())
+
     def __iter__(self):
         sources = (
             self._sources
             if self._is_generator_used
             else islice(self._sources, self.start, self.stop + 1, self.step)
         )
+        img_properties = self._iterate_img_properties(sources)
 
-        for idx in range(self.stop + 1):
-            if idx in range(self.start, self.stop + 1, self.step):
-                image = next(sources)
-                yield self._get_img_properties(image)
-            else:
-                yield dict()
+        with closing(img_properties):
+            for idx in range(self.stop + 1):
+                if idx in range(self.start, self.stop + 1, self.step):
+                    yield next(img_properties)
+                else:
+                    yield dict()
 
     @property
     def range_(self):
@@ -323,54 +383,110 @@ class _Manifest:
 # Needed for faster iteration over the manifest file, will be generated to work inside CVAT
 # and will not be generated when manually creating a manifest
 class _Index:
-    FILE_NAME = "index.json"
+    """
+    Stores the manifest line offsets as a flat array of 64-bit unsigned integers
+    in the native byte order. The index file is memory-mapped on loading,
+    so the offsets are read on demand instead of being loaded at once.
+    """
+
+    FILE_NAME = "index.bin"
+    LEGACY_FILE_NAME = "index.json"
+
+    _OFFSET_TYPECODE = "Q"
 
     def __init__(self, path):
         assert path and os.path.isdir(path), "No index directory path"
         self._path = os.path.join(path, self.FILE_NAME)
-        self._index = {}
+        self._legacy_path = os.path.join(path, self.LEGACY_FILE_NAME)
+        self._index: Union[array, memoryview] = array(self._OFFSET_TYPECODE)
 
     @property
     def path(self):
         return self._path
 
+    def exists(self) -> bool:
+        return os.path.exists(self._path) or os.path.exists(self._legacy_path)
+
     def dump(self):
-        with open(self._path, "w") as index_file:
-            json.dump(self._index, index_file, separators=(",", ":"))
+        # The index is replaced at once, so that readers never see a partially written file
+        tmp_path = f"{self._path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as index_file:
+                index_file.write(self._index)
+
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
 
     def load(self):
-        with open(self._path, "r") as index_file:
-            self._index = json.load(
-                index_file, object_hook=lambda d: {int(k): v for k, v in d.items()}
-            )
+        if not os.path.exists(self._path) and os.path.exists(self._legacy_path):
+            self._convert_legacy_index()
+
+        with open(self._path, "rb") as index_file:
+            if not os.fstat(index_file.fileno()).st_size:
+                # empty files can't be mapped
+                self._index = array(self._OFFSET_TYPECODE)
+                return
+
+            # The mapping remains valid after the file is closed
+            index_map = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._index = memoryview(index_map).cast(self._OFFSET_TYPECODE)
+
+    def _convert_legacy_index(self):
+        try:
+            with open(self._legacy_path, "r") as index_file:
+                legacy_index = json.load(index_file)
+        except FileNotFoundError:
+            # The index has been converted by another process
+            return
+
+        self._index = array(
+            self._OFFSET_TYPECODE, (legacy_index[str(i)] for i in range(len(legacy_index)))
+        )
+        self.dump()
+
+        # The legacy index is only removed after the new one is written
+        with suppress(FileNotFoundError):
+            os.remove(self._legacy_path)
 
     def remove(self):
-        os.remove(self._path)
+        self._index = array(self._OFFSET_TYPECODE)
+
+        for path in (self._path, self._legacy_path):
+            if os.path.exists(path):
+                os.remove(path)
 
     def create(self, manifest, *, skip):
         assert os.path.exists(manifest), "A manifest file not exists, index cannot be created"
+        self._index = array(self._OFFSET_TYPECODE)
         with open(manifest, "r+") as manifest_file:
             while skip:
                 manifest_file.readline()
                 skip -= 1
-            image_number = 0
             position = manifest_file.tell()
             line = manifest_file.readline()
             while line:
                 if line.strip():
-                    self._index[image_number] = position
-                    image_number += 1
+                    self._index.append(position)
                     position = manifest_file.tell()
                 line = manifest_file.readline()
 
     def partial_update(self, manifest, number):
         assert os.path.exists(manifest), "A manifest file not exists, index cannot be updated"
+        # A mapped index is read-only
+        self._index = array(self._OFFSET_TYPECODE, self._index)
         with open(manifest, "r+") as manifest_file:
             manifest_file.seek(self._index[number])
             line = manifest_file.readline()
             while line:
                 if line.strip():
-                    self._index[number] = manifest_file.tell()
+                    if number < len(self._index):
+                        self._index[number] = manifest_file.tell()
+                    else:
+                        self._index.append(manifest_file.tell())
                     number += 1
                 line = manifest_file.readline()
 
@@ -384,6 +500,9 @@ class _Index:
 
         return self._index[number]
 
+    def __iter__(self):
+        return iter(self._index)
+
     def __len__(self):
         return len(self._index)
 
@@ -435,7 +554,7 @@ class _ManifestManager(ABC):
                 return parsed_properties
 
     def init_index(self):
-        if os.path.exists(self._index.path):
+        if self._index.exists():
             self._index.load()
         else:
             self._index.create(self._manifest.path, skip=self._manifest.get_header_lines_count())
@@ -443,7 +562,7 @@ class _ManifestManager(ABC):
                 self._index.dump()
 
     def reset_index(self):
-        if self._create_index and os.path.exists(self._index.path):
+        if self._create_index and self._index.exists():
             self._index.remove()
 
     def set_index(self):
@@ -36,6 +36,12 @@ def get_args():
         type=str,
         default=SortingMethod.LEXICOGRAPHICAL.value,
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of processes used to read images",
+    )
     parser.add_argument("source", type=str, help="Source paths")
     return parser.parse_args()
 
@@ -89,6 +95,7 @@ def main():
                 sorting_method=args.sorting,
                 use_image_hash=True,
                 data_dir=data_dir,
+                workers=args.workers,
             )
             manifest.create(_tqdm=tqdm)
         except Exception as ex: